@@ -1,186 +1,223 @@
-import time
 import json
 import os
 from openai import OpenAI
 from datetime import datetime, timedelta
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.options import Options
 from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
+from rate_limiter import rate_limiter
+from http_client import http_client
+from feed_cache import feed_cache
+from html_backend import parse_html
+from extractor_registry import SourceExtractor, select, select_one
+from rss_scraper import get_entry_pub_date
+from browser_pool import BrowserPool, extract_paragraphs
+from llm_cache import cached_chat_completion, llm_cache
+from prompt_registry import prompt_registry, prompt_usage
+from batch_translation import OpenAIBatchBackend, InlineBatchBackend, prefill_translations
 
 # 기본 .env 파일 로드
 load_dotenv()
 
-openai_api_key = os.getenv('OPENAI_API_KEY')
-print("불러온 OPENAI_API_KEY:", openai_api_key)  # 디버깅용 출력
-if not openai_api_key:
-    raise ValueError("OPENAI_API_KEY가 .env 파일에 설정되어 있지 않습니다.")
+# 수집 방식 (http: 브라우저 없이 RSS/정적 HTML로 수집, selenium: 헤드리스 크롬 풀로 렌더링한 페이지에서 수집)
+CRAWL_MODE = os.getenv('CRAWL_MODE', 'http')
 
-client = OpenAI(api_key=openai_api_key)
+# 번역 방식 (sync: 기사별 즉시 요청, batch: Batch API로 한 번에 제출)
+TRANSLATION_MODE = os.getenv('TRANSLATION_MODE', 'sync')
 
-# 미국 뉴욕 기준 어제 날짜 계산
-yesterday_str = (datetime.now(ZoneInfo("America/New_York")) - timedelta(days=1)).strftime("%Y-%m-%d")
-print("기준 날짜 (미국 기준 어제):", yesterday_str)
+# 수집할 기사 목록 페이지와 같은 태그의 RSS 피드
+LISTING_URL = "https://cointelegraph.com/tags/markets"
+LISTING_RSS_URL = "https://cointelegraph.com/rss/tag/markets"
+LISTING_SELECTOR = "li[data-testid='posts-listing__item']"
 
-# 크롬 드라이버 설정
-chrome_options = Options()
-# chrome_options.add_argument("--headless")  # 필요 시 활성화
-driver = webdriver.Chrome(options=chrome_options)
+# 페이지 요소가 나타날 때까지 기다리는 최대 시간(초) (selenium 모드)
+PAGE_WAIT_TIMEOUT = 10
 
-def get_article_content_by_selenium(driver, url):
+# 기사 번역용 시스템 프롬프트 (prompt_cointelegraph.txt를 시작 시 한 번 읽고 검증)
+TRANSLATION_SYSTEM_PROMPT = prompt_registry.text('cointelegraph')
+
+# 기사 본문 규칙 (면책 조항 전까지의 p/li/blockquote, 두 수집 방식이 같은 규칙 사용)
+ARTICLE_CONTAINER = "div.post-content"
+ARTICLE_BLOCKS = ('p', 'li', 'blockquote')
+ARTICLE_STOP = '[class*="post-content__disclaimer"]'
+ARTICLE_EXTRACTOR = SourceExtractor('cointelegraph-markets', {
+    'containers': [ARTICLE_CONTAINER],
+    'blocks': list(ARTICLE_BLOCKS),
+    'stop': ARTICLE_STOP,
+    'fallbacks': ['readability'],
+})
+
+# cointelegraph 요청은 공유 세션의 호스트 속도 제한을 따름
+http_client.configure_host('https://cointelegraph.com', rate_key='cointelegraph.com')
+
+
+def get_yesterday_str():
+    """미국 뉴욕 기준 어제 날짜(YYYY-MM-DD)를 반환하는 함수"""
+    return (datetime.now(ZoneInfo("America/New_York")) - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def absolute_link(link):
+    if link and link.startswith("/"):
+        return "https://cointelegraph.com" + link
+    return link
+
+
+def list_articles_from_rss(date_str):
+    """태그 RSS 피드에서 해당 날짜(뉴욕 기준) 기사 목록을 가져오는 함수"""
+    summaries = []
+    for entry in feed_cache.fetch(LISTING_RSS_URL)['entries']:
+        date = get_entry_pub_date(entry).astimezone(ZoneInfo("America/New_York")).strftime("%Y-%m-%d")
+        if date == date_str:
+            summaries.append({"title": entry.title.strip(), "link": absolute_link(entry.link), "date": date})
+    return summaries
+
+
+def list_articles_from_html(date_str):
+    """태그 페이지의 정적 HTML에서 해당 날짜 기사 목록을 가져오는 함수 (RSS를 쓸 수 없을 때)"""
+    response = http_client.get(LISTING_URL, timeout=15)
+    response.raise_for_status()
+    document = parse_html(response.content, response.headers.get('Content-Type'))
+
+    summaries = []
+    for item in select(document, LISTING_SELECTOR):
+        title = select_one(item, ".post-card-inline__title")
+        link = select_one(item, "a.post-card-inline__title-link")
+        date = select_one(item, "time.post-card-inline__date")
+        if not (title and link and date):
+            print("기사 정보 추출 실패: 목록 항목에 제목/링크/날짜가 없습니다.")
+            continue
+        if date.get("datetime") == date_str:
+            summaries.append({"title": title.text(), "link": absolute_link(link.get("href")), "date": date_str})
+    return summaries
+
+
+def list_articles_http(date_str):
+    """브라우저 없이 해당 날짜 기사 목록을 가져오는 함수 (RSS 우선, 실패하면 정적 HTML)"""
     try:
-        driver.get(url)
-        time.sleep(1.5)
-        content_div = driver.find_element(By.CSS_SELECTOR, "div.post-content.relative")
-        content_elements = content_div.find_elements(By.XPATH, ".//*")
-
-        content = []
-        for elem in content_elements:
-            class_attr = elem.get_attribute("class") or ""
-            if "post-content__disclaimer" in class_attr:
-                break
-            tag = elem.tag_name.lower()
-            if tag in ["p", "li", "blockquote"]:
-                text = elem.text.strip()
-                if text:
-                    content.append(text)
-        return "\n".join(content)
+        summaries = list_articles_from_rss(date_str)
+        if summaries:
+            return summaries
+        print("RSS에서 대상 기사를 찾지 못해 목록 페이지 HTML을 확인합니다.")
+    except Exception as e:
+        print(f"[WARN] 태그 RSS 읽기 실패, 목록 페이지 HTML을 사용합니다: {e}")
+    return list_articles_from_html(date_str)
+
+
+def get_article_content_by_http(url):
+    """기사 페이지의 정적 HTML에서 본문을 추출하는 함수"""
+    try:
+        response = http_client.get(url, timeout=15)
+        response.raise_for_status()
+        document = parse_html(response.content, response.headers.get('Content-Type'))
+        content, _, _ = ARTICLE_EXTRACTOR.extract(document, None)
+        return content
     except Exception as e:
         print(f"[본문 수집 실패] {url} | 에러: {e}")
         return ""
 
-try:
-    # prompt.txt 파일에서 시스템 프롬프트 읽기
-    with open('prompt.txt', 'r', encoding='utf-8') as f:
-        system_prompt = f.read()
 
+def list_articles_selenium(driver, date_str):
+    """크롬으로 목록 페이지를 스크롤하며 해당 날짜 기사 목록을 가져오는 함수"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
 
-    url = "https://cointelegraph.com/tags/markets"
-    driver.get(url)
-    time.sleep(2)
+    listing_selector = "ul > " + LISTING_SELECTOR
+    rate_limiter.acquire('cointelegraph.com')
+    driver.get(LISTING_URL)
+    WebDriverWait(driver, PAGE_WAIT_TIMEOUT).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, listing_selector))
+    )
 
-    # 페이지 스크롤
+    # 페이지 스크롤 (새 기사가 로드되면 바로 다음 스크롤, 더 이상 늘지 않으면 중단)
     for _ in range(5):
+        item_count = len(driver.find_elements(By.CSS_SELECTOR, listing_selector))
         driver.find_element(By.TAG_NAME, "body").send_keys(Keys.END)
-        time.sleep(0.5)
-
-    news_items = driver.find_elements(By.CSS_SELECTOR, "ul > li[data-testid='posts-listing__item']")
+        try:
+            WebDriverWait(driver, 2).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, listing_selector)) > item_count
+            )
+        except TimeoutException:
+            break
 
-    news_summaries = []
-    for item in news_items:
+    summaries = []
+    for item in driver.find_elements(By.CSS_SELECTOR, listing_selector):
         try:
             title = item.find_element(By.CSS_SELECTOR, ".post-card-inline__title").text.strip()
             link = item.find_element(By.CSS_SELECTOR, "a.post-card-inline__title-link").get_attribute("href")
-            if link and link.startswith("/"):
-                link = "https://cointelegraph.com" + link
             date = item.find_element(By.CSS_SELECTOR, "time.post-card-inline__date").get_attribute("datetime")
         except Exception as e:
             print(f"기사 정보 추출 실패: {e}")
             continue
+        if date == date_str:
+            summaries.append({"title": title, "link": absolute_link(link), "date": date})
+    return summaries
 
-        if date == yesterday_str:
-            print(" 기사 수집 대상:", title)
-            news_summaries.append({"title": title, "link": link, "date": date})
+
+def get_article_content_by_selenium(driver, url):
+    """크롬으로 렌더링한 기사 페이지에서 본문을 추출하는 함수 (문단 텍스트를 스크립트 한 번으로 가져옴)"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    try:
+        # 호스트 속도 제한은 브라우저 풀이 적용하고, 본문이 렌더링되면 바로 진행
+        driver.get(url)
+        WebDriverWait(driver, PAGE_WAIT_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ARTICLE_CONTAINER))
+        )
+        return "\n\n".join(extract_paragraphs(driver, ARTICLE_CONTAINER, ARTICLE_BLOCKS, ARTICLE_STOP))
+    except Exception as e:
+        print(f"[본문 수집 실패] {url} | 에러: {e}")
+        return ""
+
+
+def collect_articles(date_str, mode=CRAWL_MODE):
+    """
+    해당 날짜 기사의 목록과 본문을 수집하는 함수
+
+    Returns:
+        list: {title, link, date, content} 기사 목록
+    """
+    if mode == 'selenium':
+        # 목록은 브라우저 하나로 읽고, 기사 페이지는 풀의 브라우저들이 나눠서 처리
+        with BrowserPool() as pool:
+            with pool.browser() as driver:
+                summaries = list_articles_selenium(driver, date_str)
+            for summary in summaries:
+                print(" 기사 수집 대상:", summary["title"])
+            contents = pool.map([summary["link"] for summary in summaries], get_article_content_by_selenium)
+        for summary, content in zip(summaries, contents):
+            summary["content"] = content or ""
+        return summaries
+
+    summaries = list_articles_http(date_str)
+    for summary in summaries:
+        print(" 기사 수집 대상:", summary["title"])
+        summary["content"] = get_article_content_by_http(summary["link"])
+    return summaries
+
+
+def translate_articles(client, news_summaries):
+    """수집한 기사를 번역해 kr_content를 붙인 결과 목록을 반환하는 함수"""
+    # 배치 모드면 번역을 한 번에 제출해 캐시에 채움 (이후 번역은 캐시에서 읽음)
+    if TRANSLATION_MODE == "batch":
+        prefill_translations(
+            InlineBatchBackend(client) if os.getenv('BATCH_BACKEND') == 'inline' else OpenAIBatchBackend(client),
+            "gpt-4o-mini",
+            TRANSLATION_SYSTEM_PROMPT,
+            [summary["content"] for summary in news_summaries],
+            store=True,
+        )
 
     results = []
     for summary in news_summaries:
         try:
-            content = get_article_content_by_selenium(driver, summary["link"])
-
-            completion = client.chat.completions.create(
-                model="gpt-4o-mini",
-                store=True,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """
-당신은 블록체인 뉴스 기사를 작성하는 전문가입니다. 최신 기술과 관련된 뉴스를 작성하고, 심층 분석과 의견을 제공하며, 독자들이 이해하기 쉽게 설명합니다.
-모든 답변은 한국어로 작성하며, 명확하고 간결한 문체를 사용하되, 문장을 지나치게 줄이지 않고 영어 기사와 비슷한 길이로 작성한다. 
-사용자가 제공하는 정보나 요청에 따라 뉴스를 작성하고 필요한 경우 추가 정보를 요청할 수 있다. 또한, 
-당신은 한국어 뉴스 기사 작성, 외신 번역, 주제별 기사 작성, 실시간 이슈 기사 작성, 제목 뽑기, 기사 연관 사진 및 시각물 생성, 오탈자 교정, 기사 분량 조절, 보도자료 작성, 기사 기획안 작성 등을 담당하는 대한민국 내 유일한 최고관리자이다.
-
-### 기사 작성 시 참고 사항:
-1. 제목, 리드 문장, 첫 번째 문단, 두 번째 문단 등 각 문단을 나눠서 제공한다.
-2. 소주제는 필요 없으므로 삭제하고 문맥을 자연스럽게 이어서 작성한다.
-3. 한국어 기사는 영어 기사에 비해 지나치게 축약하지 말고, 영어 기사와 비슷한 분량으로 작성한다.
-4. 각 문장을 한국어로 번역한다.
-5. 별도로 헤드라인(headline), 리드 문장(Lead), 첫 문단을 생성한다.
-6. 헤드라인은 주어와 내용으로 하되 조사(은, 는, 이, 가, 을, 를, 의)와 기호($) 사용을 지양한다.
-7. 리드 문장은 육하원칙을 최대한 살린 주제 문장으로 제시한다.
-8. 본문 첫 문단은 '원본 기사의 송출일(현지시간) 언론사명에 따르면'(예시: 25일(현지시간) 코인텔레그래프에 따르면)으로 시작하도록 하고 기사에서 가장 핵심 내용이 담긴 문단을 붙여준다.
-9. 영어 남기지 말고 모두 한국어 정식 표기나 음역으로 바꾼다. 고유명사이면 한국어 표기 뒤에 영어 표기를 괄호 안에 넣어 붙여준다, 예를 들어, "Apple"을 "애플(Apple)"로, "Google"을 "구글(Google)"로 표기한다.
-10. "나", "저", "우리" 같은 1인칭 주어 사용하지 않는다.
-11. 서술어는 존댓말 대신 "있다", "했다" 같은 평서형 서술어를 사용한다, "것이다", "그러나"라는 표현을 지양한다.
-12. '$숫자' 또는 '$ 숫자'는 '숫자 달러'로 번역하고, 억이나 만 단위는 한글로 표기하고, 큰 단위 2개까지만 표기한다.
-13. 따옴표 앞에 주어나 접속사를 붙여서 문장이 따옴표로 시작하지 않도록 한다.
-14. 중제목, 소제목은 삭제한다.
-15. 어체 변경: 있습니다 -> 있다, 하였습니다 -> 하였다.
-16. 타이틀 간소화: 을, 를, 이, 가 등 불필요한 조사는 생략하고 종결어미 생략.
-17. 주어, 내용: 비트와이즈 CEO, "자산운용사 비트코인 ETF 투자 늘릴 것".
-18. 종목(티커)명 표기: 비트코인(BTC), 이더리움(ETH).
-19. 달러 표기: $65000 -> 6만5000달러.
-20. 이미지 캡션: 기사 내용 함축 / 셔터스톡.
-21. 업체명 한글 표기: JPMorgan -> JP모건.
-22. 리드 문장: 기사 첫 문장은 기사 주요 내용을 간결히 요약한 3줄 이내로 작성한다.
-23. 제목은 볼드 처리.
-24. 제목끼리는 한 칸 띄어쓰기.
-25. 포탈 송출 시 하이퍼링크 제거.
-26. 코멘트: 소속 직함 이름 "" 라고 말했다.
-27. 본문 쌍따옴표 지양: 본문에서는 '효과적' 이였다, 코멘트에만 쌍따옴표 작성.
-
-### 헤드라인(제목)
-- 기사 축약·함축. 가능한 한글 사용, 알트 코인은 티커 입력하기(BTC, ETH 제외), 기호 피하기.
-- 풀어서 쓰기, 제목이 길면 반올림, seo에 최적화된 제목을 제공해주세요.
-
-### 리드(Lead, 첫 문장, 도입부)
-- 가장 중요한 사실 요약 문장.
-- 전체 기사 내용 짐작 가능하게 간결하게 작성.
-
-### 본문(Body)
-- 출처와 보도시점 첫째 줄, 둘째 줄 이내에 표시.
-- 본문은 상단부터 중요 내용, 관련도가 높은 순으로 작성.
-- 문장 간결하게. 없어도 의미가 통하는 단어 삭제.
-- 끊을 수 있는 문장은 모두 끊기. 한 문단에 한 주제로. 문단 간결하게.
-
-### 따옴표(인용문)
-- 따옴표 안에는 한 문장만.
-- 높임말 지양. 주어, 연결어 없는 인용문 지양.
-### 숫자
-- 숫자 쉼표 생략.
-- 천단위까지 숫자로, 만억조는 한글로 표기.
-- 한글과 한글 사이만 띄어쓰기.
-
-### 명사 사용
-- 이름 - 회사 - 직책 순.
-- 국문(영문) 표기 후 국문만 사용.
-- 단어와 괄호 붙여쓰기.
-
-### 추가 지침
-1. 고유명사는 한글 발음으로 번역.
-2. 한글 발음 옆에 (영문) 입력.
-
-#### 추가 변경사항:
-1. 제공되는 한국어 기사는 영어 기사와 비슷한 분량으로 작성하고 너무 짧지 않게 한다.
-2. 기사 제공 시 리드 문장, 본문 첫 번째 문단, 두 번째 문단으로 꼭 나누어서 작성한다.
-3. 첫 번째 문단은 가능한 한 해당 기사의 작성 날짜를 포함하여 시작하고, 형식은 '20일(현지시간) 코인텔레그래프에 따르면'과 같이 작성한다.
-4. 기사에 소주제는 필요 없으므로 과감히 제거하고 문맥을 자연스럽게 이어서 작성한다.
-5. 제일먼저 써머리 3줄을 써줘(핵심내용요약, 핵심내용은 이어지게 써줘)
-6. 본문에 소주제는 제거하고, 자연스럽게 문맥이 이어지도록 만들어줘. 
-7. 영어제공기사에 비해 한국어 기사가 너무 짧으면 안돼
-8. 주요 키워드 3개만 서줘(키워드는 한글로 숫자없이 3개만 써주면돼)
-9. 제목은 구글SEO에 가장 최적화된 제목과 클릭당 단가수가 가장 높은 키워드를 포함하여 만들어주세요.
-"""
-                    },
-                    {
-                        "role": "user",
-                        "content": content
-                    }
-                ]
-            )
+            content = summary["content"]
 
-            kr_content = completion.choices[0].message.content
+            # 같은 기사를 다시 번역하면 캐시된 응답 사용
+            kr_content = cached_chat_completion(client, "gpt-4o-mini", TRANSLATION_SYSTEM_PROMPT, content, store=True)
             print("번역 : ", kr_content)
 
             results.append({
@@ -194,15 +231,35 @@ try:
         except Exception as e:
             print(f"기사 처리 중 오류 발생: {e}")
             continue
+    return results
+
+
+def main():
+    openai_api_key = os.getenv('OPENAI_API_KEY')
+    if not openai_api_key:
+        raise ValueError("OPENAI_API_KEY가 .env 파일에 설정되어 있지 않습니다.")
+    client = OpenAI(api_key=openai_api_key)
 
-    file_name = f"cointelegraph_yesterday_{yesterday_str}.json"
-    with open(file_name, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    # 미국 뉴욕 기준 어제 날짜 계산
+    yesterday_str = get_yesterday_str()
+    print("기준 날짜 (미국 기준 어제):", yesterday_str)
+    print("수집 방식:", CRAWL_MODE)
 
-    print(f"\n총 {len(results)}개의 뉴스를 저장했습니다: {file_name}")
+    try:
+        news_summaries = collect_articles(yesterday_str)
+        results = translate_articles(client, news_summaries)
+
+        file_name = f"cointelegraph_yesterday_{yesterday_str}.json"
+        with open(file_name, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+        print(f"\n총 {len(results)}개의 뉴스를 저장했습니다: {file_name}")
+        llm_cache.report()
+        prompt_usage.report()
+
+    except Exception as e:
+        print(f"프로그램 실행 중 오류 발생: {e}")
 
-except Exception as e:
-    print(f"프로그램 실행 중 오류 발생: {e}")
 
-finally:
-    driver.quit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import glob
+import json
+import os
+import threading
+from datetime import date, timedelta
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 사이 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+
+# 스크랩한 기사를 저장할 JSON Lines 파일
+ARTICLE_STORE_PATH = 'news.jsonl'
+
+# 날짜별로 옮긴 기사 파일(news-YYYY-MM-DD.jsonl)을 보관하는 기간(일)
+ARTICLE_ARCHIVE_DAYS = int(os.getenv('ARTICLE_ARCHIVE_DAYS', '7'))
+
+# 예전 버전에서 사용하던 텍스트 형식 기사 파일
+LEGACY_NEWS_PATH = 'news.txt'
+
+# 기사 레코드 필드 (confidence: 본문 추출 신뢰도 0~1, 예전 기사에는 없음)
+ARTICLE_FIELDS = ('title', 'link', 'content', 'published', 'source', 'confidence')
+
+
+class ArticleStore:
+    """
+    스크랩한 기사를 한 줄에 하나씩 JSON으로 저장하는 기사 저장소 (JSON Lines)
+
+    기사는 스크랩되는 즉시 한 줄씩 추가되고, 읽을 때도 한 줄씩 스트리밍하므로
+    배치 크기와 관계없이 메모리 사용량이 일정하다.
+    본문에 어떤 문자열이 들어 있어도 레코드 경계가 깨지지 않는다.
+    """
+
+    def __init__(self, path=ARTICLE_STORE_PATH):
+        """
+        Args:
+            path (str): JSON Lines 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """새 배치를 시작하기 위해 저장소를 비우는 함수"""
+        with self._lock:
+            open(self.path, 'w', encoding='utf-8').close()
+
+    def rotate(self, keep_days=ARTICLE_ARCHIVE_DAYS):
+        """
+        날짜가 바뀌었으면 저장소 파일을 날짜별 파일로 옮기고 보관 기간이 지난 파일을 지우는 함수
+
+        계속 실행되는 스케줄 모드/크롤링 노드에서 저장소가 끝없이 커지지 않도록 주기적으로 호출한다.
+        여러 프로세스(크롤링 노드)가 같은 저장소를 쓰므로 잠금 파일로 한 프로세스만 옮기게 하고,
+        잠금을 얻은 뒤 파일 날짜를 다시 확인해 다른 프로세스가 이미 옮긴 뒤 새로 만든 파일은 옮기지 않는다.
+
+        Returns:
+            str: 옮긴 파일 경로 (옮기지 않았으면 None)
+        """
+        root, ext = os.path.splitext(self.path)
+        today = date.today()
+        with self._lock, open(f"{self.path}.lock", 'a') as lock_file:
+            if fcntl is not None:
+                # 파일을 닫으면 잠금이 풀림
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            if not os.path.exists(self.path):
+                return None
+            day = date.fromtimestamp(os.path.getmtime(self.path))
+            if day >= today:
+                return None
+            archive = f"{root}-{day.isoformat()}{ext}"
+            os.replace(self.path, archive)
+            for old in glob.glob(f"{root}-*{ext}"):
+                try:
+                    old_day = date.fromisoformat(old[len(root) + 1:-len(ext) or None])
+                except ValueError:
+                    continue
+                if old_day < today - timedelta(days=keep_days):
+                    os.remove(old)
+        print(f"기사 저장소를 {archive}로 옮겼습니다.")
+        return archive
+
+    def append(self, article):
+        """기사 하나를 저장소 끝에 추가하는 함수 (읽는 쪽이 바로 볼 수 있도록 즉시 flush)"""
+        record = {field: article.get(field, '') for field in ARTICLE_FIELDS}
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+
+    def iter_articles(self):
+        """
+        저장된 기사를 한 건씩 읽어오는 제너레이터
+
+        Yields:
+            dict: 기사 레코드
+        """
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                # 쓰는 중인 마지막 줄(줄바꿈 없음)은 다음에 읽음
+                if not line.endswith('\n') or not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    print(f"[WARN] 손상된 기사 레코드를 건너뜁니다: {e}")
+
+
+def format_for_translation(article):
+    """
+    번역 모델에 보낼 사용자 메시지를 만드는 함수
+
+    '### 제목' 같은 장식 없이 번역에 필요한 필드만 간결하게 담는다.
+    """
+    return (
+        f"출처: {article.get('source', '')} | 발행일: {article.get('published', '')}\n"
+        f"제목: {article.get('title', '')}\n\n"
+        f"{article.get('content', '')}"
+    )
+
+
+def import_legacy_news_file(store, legacy_path=LEGACY_NEWS_PATH):
+    """
+    예전 news.txt('### 제목' 섹션 + 80자 대시 구분선)를 기사 저장소로 옮기는 함수
+
+    Returns:
+        int: 옮긴 기사 수
+    """
+    if not os.path.exists(legacy_path):
+        return 0
+    headers = {'### 제목': 'title', '### 링크': 'link', '### 본문': 'content', '### 발행일': 'published', '### 출처': 'source'}
+    with open(legacy_path, 'r', encoding='utf-8') as f:
+        blocks = f.read().split("-" * 80)
+    count = 0
+    for block in blocks:
+        article = {}
+        field = None
+        lines = []
+        for line in block.strip().split('\n'):
+            if line.strip() in headers:
+                if field:
+                    article[field] = '\n'.join(lines).strip()
+                field, lines = headers[line.strip()], []
+            else:
+                lines.append(line)
+        if field:
+            article[field] = '\n'.join(lines).strip()
+        if article.get('title') and article.get('content'):
+            store.append(article)
+            count += 1
+    return count
+
+
+# 파이프라인 전체에서 공유하는 기사 저장소
+article_store = ArticleStore()
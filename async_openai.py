@@ -0,0 +1,338 @@
+import asyncio
+import random
+import re
+import threading
+import time
+from openai import AsyncOpenAI, APIConnectionError, APITimeoutError, APIStatusError, RateLimitError
+from generated_image import GeneratedImage
+from llm_cache import llm_cache, make_cache_key, is_complete_response
+from prompt_registry import build_messages, prompt_usage
+from rate_limiter import rate_limiter
+
+# 동시 요청 수 기본 설정
+ASYNC_INITIAL_CONCURRENCY = 4
+ASYNC_MAX_CONCURRENCY = 16
+
+# 재시도 설정 (지수 백오프 + full jitter)
+ASYNC_MAX_RETRIES = 5
+ASYNC_BACKOFF_BASE = 1.0
+ASYNC_BACKOFF_MAX = 60.0
+
+
+def parse_retry_after(headers):
+    """Retry-After / retry-after-ms 헤더에서 대기 시간(초)을 읽는 함수 (없으면 None)"""
+    if not headers:
+        return None
+    value = headers.get('retry-after-ms')
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get('retry-after')
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def parse_reset_seconds(value):
+    """x-ratelimit-reset-* 헤더 값('1s', '6m0s', '120ms')을 초로 바꾸는 함수"""
+    units = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+    parts = re.findall(r'([\d.]+)(ms|s|m|h)', value or '')
+    if not parts:
+        return None
+    return sum(float(number) * units[unit] for number, unit in parts)
+
+
+class AdaptiveConcurrency:
+    """
+    응답에 따라 동시 요청 수를 조절하는 제한기 (AIMD)
+
+    성공하면 동시 요청 수를 조금씩 늘리고, 429를 받으면 절반으로 줄인 뒤 Retry-After 동안 새 요청을 멈춘다.
+    남은 요청 수 헤더(x-ratelimit-remaining-*)가 거의 바닥나면 미리 줄인다.
+    """
+
+    def __init__(self, initial=ASYNC_INITIAL_CONCURRENCY, minimum=1, maximum=ASYNC_MAX_CONCURRENCY):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._condition = None
+
+    def _cond(self):
+        # 이벤트 루프 안에서 처음 사용할 때 생성
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self):
+        cond = self._cond()
+        async with cond:
+            while self.in_flight >= int(self.limit):
+                await cond.wait()
+            self.in_flight += 1
+        pause = self.paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+    async def release(self):
+        cond = self._cond()
+        async with cond:
+            self.in_flight -= 1
+            cond.notify_all()
+
+    def on_success(self, headers=None):
+        """성공 시 동시 요청 수를 늘리고, 한도 헤더가 거의 바닥났으면 줄이는 함수"""
+        self.limit = min(self.maximum, self.limit + 1 / max(self.limit, 1))
+        if headers:
+            remaining = headers.get('x-ratelimit-remaining-requests')
+            if remaining is not None and remaining.isdigit() and int(remaining) <= int(self.limit):
+                self.limit = max(self.minimum, int(remaining) or self.minimum)
+                reset = parse_reset_seconds(headers.get('x-ratelimit-reset-requests'))
+                if reset:
+                    self.paused_until = max(self.paused_until, time.monotonic() + reset)
+
+    def on_rate_limited(self, retry_after=None):
+        """429 응답 시 동시 요청 수를 절반으로 줄이고 잠시 멈추는 함수"""
+        self.limit = max(self.minimum, self.limit / 2)
+        if retry_after:
+            self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+        print(f"[async] 속도 제한 응답 - 동시 요청 수를 {int(self.limit)}개로 줄입니다.")
+
+
+class AsyncOpenAIRunner:
+    """
+    AsyncOpenAI로 번역과 이미지 생성을 동시에 실행하는 클래스
+
+    API 종류(chat, images)별로 적응형 동시성 제한을 따로 두고, 429/5xx/연결 오류는 jitter가 있는 지수 백오프로 재시도한다.
+    번역 응답은 동기 경로와 같은 LLM 캐시를 사용한다.
+    """
+
+    def __init__(self, api_key, max_retries=ASYNC_MAX_RETRIES, cache=None):
+        """
+        Args:
+            api_key (str): OpenAI API 키
+            max_retries (int): 요청당 최대 재시도 횟수
+            cache (LLMCache): 번역 응답 캐시 (없으면 공유 캐시)
+        """
+        # 재시도는 이 클래스가 직접 처리
+        self.client = AsyncOpenAI(api_key=api_key, max_retries=0)
+        self.max_retries = max_retries
+        self.cache = cache or llm_cache
+        self.limits = {
+            'openai.chat': AdaptiveConcurrency(),
+            'openai.images': AdaptiveConcurrency(initial=2, maximum=5),
+        }
+
+    async def _call(self, key, request, consume=None):
+        """
+        동시성 제한, 속도 제한, 재시도를 적용해 원시 응답 요청을 실행하는 함수
+
+        consume이 있으면 응답(스트림)을 동시성 자리를 쥔 채로 consume에 넘겨 끝까지 읽는다.
+        읽기 시작한 뒤의 오류는 이미 전달한 조각과 겹치므로 재시도하지 않는다.
+        """
+        limit = self.limits[key]
+        for attempt in range(self.max_retries + 1):
+            await limit.acquire()
+            consuming = False
+            try:
+                wait = rate_limiter.bucket(key).reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                raw = await request()
+                limit.on_success(raw.headers)
+                if consume is None:
+                    return raw.parse()
+                consuming = True
+                return await consume(raw.parse())
+            except RateLimitError as e:
+                if consuming or 'insufficient_quota' in str(e):
+                    raise
+                retry_after = parse_retry_after(e.response.headers if e.response is not None else None)
+                limit.on_rate_limited(retry_after)
+                error = e
+            except APIStatusError as e:
+                if consuming or e.status_code < 500:
+                    raise
+                retry_after = parse_retry_after(e.response.headers if e.response is not None else None)
+                error = e
+            except (APIConnectionError, APITimeoutError) as e:
+                if consuming:
+                    raise
+                retry_after = None
+                error = e
+            finally:
+                await limit.release()
+
+            if attempt == self.max_retries:
+                raise error
+            # full jitter: 0 ~ min(최대, 기본 * 2^시도) 사이에서 무작위 대기 (Retry-After가 더 길면 그 값을 따름)
+            backoff = random.uniform(0, min(ASYNC_BACKOFF_MAX, ASYNC_BACKOFF_BASE * 2 ** attempt))
+            delay = max(backoff, retry_after or 0)
+            print(f"[async] 요청 실패, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {error}")
+            await asyncio.sleep(delay)
+
+    async def chat(self, model, system_prompt, user_content, temperature=None, **kwargs):
+        """캐시를 거쳐 chat completion을 요청하고 응답 텍스트를 반환하는 함수"""
+        key = make_cache_key(model, system_prompt, temperature, user_content, **kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        request = {
+            'model': model,
+            'messages': build_messages(system_prompt, user_content),
+        }
+        if temperature is not None:
+            request['temperature'] = temperature
+        request.update(kwargs)
+
+        completion = await self._call(
+            'openai.chat',
+            lambda: self.client.chat.completions.with_raw_response.create(**request),
+        )
+        prompt_usage.record(completion.usage)
+        choice = completion.choices[0]
+        response = choice.message.content
+        if is_complete_response(response, choice.finish_reason):
+            self.cache.put(key, response, model)
+        return response
+
+    async def chat_stream(self, model, system_prompt, user_content, on_delta, temperature=None, **kwargs):
+        """
+        캐시를 거쳐 chat completion을 스트리밍으로 요청하고, 도착하는 응답 조각마다 on_delta를 호출하는 함수
+
+        llm_cache.streamed_chat_completion과 같은 캐시 키와 캐시 규칙을 따르고,
+        chat과 같은 동시성 제한과 재시도를 적용한다.
+        """
+        key = make_cache_key(model, system_prompt, temperature, user_content, **kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            on_delta(cached)
+            return cached
+
+        request = {
+            'model': model,
+            'messages': build_messages(system_prompt, user_content),
+            'stream': True,
+            'stream_options': {'include_usage': True},
+        }
+        if temperature is not None:
+            request['temperature'] = temperature
+        request.update(kwargs)
+
+        parts = []
+        finish_reason = None
+
+        async def consume(stream):
+            nonlocal finish_reason
+            async for event in stream:
+                # 마지막 이벤트에는 choices 없이 usage만 들어 있음
+                if event.usage:
+                    prompt_usage.record(event.usage)
+                if not event.choices:
+                    continue
+                choice = event.choices[0]
+                finish_reason = choice.finish_reason or finish_reason
+                delta = choice.delta.content
+                if delta:
+                    parts.append(delta)
+                    on_delta(delta)
+
+        await self._call(
+            'openai.chat',
+            lambda: self.client.chat.completions.with_raw_response.create(**request),
+            consume,
+        )
+        response = ''.join(parts)
+        if is_complete_response(response, finish_reason):
+            self.cache.put(key, response, model)
+        return response
+
+    async def image(self, prompt, model, size="1792x1024", quality="standard"):
+        """이미지를 생성하고 GeneratedImage를 반환하는 함수"""
+        started = time.monotonic()
+        response = await self._call(
+            'openai.images',
+            lambda: self.client.images.with_raw_response.generate(
+                model=model, prompt=prompt, size=size, quality=quality, n=1
+            ),
+        )
+        return GeneratedImage(response.data[0].url, prompt, model, time.monotonic() - started)
+
+    async def close(self):
+        await self.client.close()
+
+
+class AsyncRunnerThread:
+    """
+    파이프라인 스레드(동기 코드)에서 AsyncOpenAIRunner 하나를 함께 쓰도록 이벤트 루프를 별도 스레드에서 돌리는 클래스
+
+    모든 요청이 같은 실행기를 거치므로 번역/이미지 단계의 작업자가 여러 개여도
+    429와 한도 헤더에 따른 동시성 조절(AIMD)이 프로세스 전체에 한 번만 적용된다.
+    이벤트 루프와 클라이언트는 처음 요청할 때 만든다.
+    """
+
+    def __init__(self, api_key, **runner_options):
+        self.api_key = api_key
+        self.runner_options = runner_options
+        self._loop = None
+        self._thread = None
+        self._runner = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='openai-async', daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+                self._runner = self._submit(self._create_runner())
+            return self._runner
+
+    async def _create_runner(self):
+        # 클라이언트가 이벤트 루프 스레드에서 만들어지도록 코루틴 안에서 생성
+        return AsyncOpenAIRunner(self.api_key, **self.runner_options)
+
+    def _submit(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def chat(self, model, system_prompt, user_content, temperature=None, **kwargs):
+        """AsyncOpenAIRunner.chat을 실행하고 결과를 기다리는 함수 (호출한 스레드는 결과만 기다림)"""
+        runner = self._start()
+        return self._submit(runner.chat(model, system_prompt, user_content, temperature=temperature, **kwargs))
+
+    def chat_stream(self, model, system_prompt, user_content, on_delta, temperature=None, **kwargs):
+        """
+        AsyncOpenAIRunner.chat_stream을 실행하고 결과를 기다리는 함수
+
+        on_delta는 이벤트 루프 스레드에서 호출되므로 오래 걸리는 작업은 다른 스레드로 넘겨야 한다.
+        """
+        runner = self._start()
+        return self._submit(
+            runner.chat_stream(model, system_prompt, user_content, on_delta, temperature=temperature, **kwargs)
+        )
+
+    def image(self, prompt, model, **kwargs):
+        """AsyncOpenAIRunner.image를 실행하고 결과를 기다리는 함수"""
+        runner = self._start()
+        return self._submit(runner.image(prompt, model, **kwargs))
+
+    def close(self):
+        with self._lock:
+            loop, thread, runner = self._loop, self._thread, self._runner
+            self._loop = self._thread = self._runner = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(runner.close(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
@@ -0,0 +1,184 @@
+import io
+import json
+import time
+from llm_cache import llm_cache, make_cache_key, is_complete_response
+from prompt_registry import build_messages, prompt_usage
+
+# 배치 상태 중 더 이상 바뀌지 않는 상태
+BATCH_FINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+# 배치 요청 엔드포인트
+BATCH_ENDPOINT = '/v1/chat/completions'
+
+
+class OpenAIBatchBackend:
+    """
+    OpenAI Batch API 백엔드
+
+    client의 base_url을 로컬 가짜 서버(fake_batch_server.py)로 지정하면 실제 API 없이 테스트할 수 있다.
+    """
+
+    def __init__(self, client, completion_window='24h'):
+        """
+        Args:
+            client (OpenAI): OpenAI 클라이언트
+            completion_window (str): 배치 완료 기한
+        """
+        self.client = client
+        self.completion_window = completion_window
+
+    def submit(self, jsonl_bytes):
+        """JSONL 배치 요청을 업로드하고 배치 ID를 반환하는 함수"""
+        batch_file = self.client.files.create(file=('batch.jsonl', io.BytesIO(jsonl_bytes)), purpose='batch')
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window,
+        )
+        return batch.id
+
+    def status(self, batch_id):
+        """배치 상태를 반환하는 함수"""
+        return self.client.batches.retrieve(batch_id).status
+
+    def results(self, batch_id):
+        """완료된 배치의 결과 레코드를 한 줄씩 반환하는 제너레이터"""
+        batch = self.client.batches.retrieve(batch_id)
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    yield json.loads(line)
+
+
+class InlineBatchBackend:
+    """
+    배치 요청을 즉시 하나씩 chat completion으로 실행하는 로컬 대체 백엔드
+
+    Batch API를 쓸 수 없는 환경에서 같은 흐름(제출 -> 상태 확인 -> 결과 매핑)을 그대로 사용하기 위한 것이다.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._results = {}
+
+    def submit(self, jsonl_bytes):
+        batch_id = f"inline-{len(self._results) + 1}"
+        results = []
+        for line in jsonl_bytes.decode('utf-8').splitlines():
+            request = json.loads(line)
+            try:
+                completion = self.client.chat.completions.create(**request['body'])
+                body = {
+                    'choices': [{
+                        'message': {'content': completion.choices[0].message.content},
+                        'finish_reason': completion.choices[0].finish_reason,
+                    }],
+                    'usage': completion.usage.model_dump() if completion.usage else None,
+                }
+                results.append({'custom_id': request['custom_id'], 'response': {'status_code': 200, 'body': body}})
+            except Exception as e:
+                results.append({'custom_id': request['custom_id'], 'response': None, 'error': {'message': str(e)}})
+        self._results[batch_id] = results
+        return batch_id
+
+    def status(self, batch_id):
+        return 'completed'
+
+    def results(self, batch_id):
+        return iter(self._results.get(batch_id, []))
+
+
+def build_batch_lines(model, system_prompt, user_contents, temperature=None, **kwargs):
+    """
+    기사별 chat completion 요청을 배치 JSONL 레코드로 만드는 함수
+
+    custom_id는 LLM 캐시 키와 같으므로 결과를 같은 기사에 그대로 매핑할 수 있다.
+
+    Returns:
+        list: (custom_id, record) 리스트
+    """
+    lines = []
+    for user_content in user_contents:
+        key = make_cache_key(model, system_prompt, temperature, user_content, **kwargs)
+        body = {
+            'model': model,
+            'messages': build_messages(system_prompt, user_content),
+        }
+        if temperature is not None:
+            body['temperature'] = temperature
+        body.update(kwargs)
+        lines.append((key, {'custom_id': key, 'method': 'POST', 'url': BATCH_ENDPOINT, 'body': body}))
+    return lines
+
+
+def extract_batch_response(record):
+    """배치 결과 레코드에서 응답 텍스트를 꺼내는 함수 (실패하거나 끝까지 생성되지 않았으면 None)"""
+    response = record.get('response') or {}
+    if response.get('status_code') != 200:
+        return None
+    try:
+        choice = response['body']['choices'][0]
+        content = choice['message']['content']
+    except (KeyError, IndexError, TypeError):
+        return None
+    return content if is_complete_response(content, choice.get('finish_reason')) else None
+
+
+def prefill_translations(backend, model, system_prompt, user_contents, temperature=None,
+                         cache=None, poll_interval=30, timeout=24 * 3600, **kwargs):
+    """
+    아직 캐시에 없는 번역 요청을 배치로 제출하고, 결과를 LLM 캐시에 채우는 함수
+
+    결과가 캐시에 들어가므로 이후 기존 번역/파싱/포스팅 경로(cached_chat_completion)는 API 호출 없이 진행된다.
+
+    Args:
+        backend: OpenAIBatchBackend 또는 InlineBatchBackend
+        model (str): 모델 이름
+        system_prompt (str): 시스템 프롬프트
+        user_contents (list): 번역할 사용자 메시지 목록
+        temperature (float): cached_chat_completion과 같은 값을 써야 캐시 키가 일치함
+        cache (LLMCache): 채울 캐시 (없으면 공유 캐시)
+        poll_interval (float): 상태 확인 간격(초)
+        timeout (float): 최대 대기 시간(초)
+
+    Returns:
+        int: 캐시에 채운 응답 수
+    """
+    cache = cache or llm_cache
+    pending = [
+        (key, record) for key, record in build_batch_lines(model, system_prompt, user_contents, temperature, **kwargs)
+        if not cache.contains(key)
+    ]
+    if not pending:
+        print("배치 번역: 모든 기사가 이미 캐시에 있습니다.")
+        return 0
+
+    jsonl_bytes = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for _, record in pending).encode('utf-8')
+    batch_id = backend.submit(jsonl_bytes)
+    print(f"배치 번역 제출: {batch_id} ({len(pending)}건)")
+
+    deadline = time.monotonic() + timeout
+    status = backend.status(batch_id)
+    while status not in BATCH_FINAL_STATUSES:
+        if time.monotonic() > deadline:
+            print(f"[WARN] 배치 {batch_id} 대기 시간 초과 (상태: {status})")
+            return 0
+        time.sleep(poll_interval)
+        status = backend.status(batch_id)
+    print(f"배치 {batch_id} 상태: {status}")
+
+    expected = {key for key, _ in pending}
+    filled = 0
+    for record in backend.results(batch_id):
+        key = record.get('custom_id')
+        response = extract_batch_response(record)
+        if key in expected and response:
+            prompt_usage.record(((record.get('response') or {}).get('body') or {}).get('usage'))
+            cache.put(key, response, model)
+            filled += 1
+        elif key in expected:
+            print(f"[WARN] 배치 요청 실패 ({key[:12]}): {record.get('error') or record.get('response')}")
+    print(f"배치 번역 결과 {filled}/{len(pending)}건을 캐시에 저장했습니다.")
+    return filled
@@ -0,0 +1,250 @@
+"""
+HTML 파서 백엔드(bs4, lxml, selectolax)별 본문 추출 속도를 비교하는 벤치마크
+
+저장한 기사 페이지(fixtures)를 각 파서로 파싱하고 extractors.json 규칙으로 본문을 추출하는 시간을 잰다.
+같은 기사에서 파서마다 다른 본문이 나오면 함께 알려준다.
+측정 결과는 fixtures/html/bench_results.json에 기록한다.
+
+네트워크 없이도 같은 결과를 재현할 수 있도록, 소스별 추출 규칙에 맞춘 기사 페이지를 고정 시드로 만드는
+generate 명령을 제공한다 (저장소에는 이렇게 만든 페이지가 들어 있다).
+
+사용 예시:
+    python bench_html.py record            # 각 RSS 피드의 최근 기사 페이지를 fixtures/html에 저장
+    python bench_html.py record URL SOURCE # 특정 페이지 하나를 저장
+    python bench_html.py generate          # 소스별 기사 페이지를 고정 시드로 만들어 저장
+    python bench_html.py bench 5           # 저장된 페이지로 5회 반복 측정
+"""
+import hashlib
+import json
+import os
+import platform
+import random
+import sys
+import time
+from html_backend import available_backends, parse_html
+from extractor_registry import extractor_registry
+
+# 벤치마크용 기사 페이지 저장 위치
+FIXTURES_DIR = os.path.join('fixtures', 'html')
+FIXTURES_INDEX = os.path.join(FIXTURES_DIR, 'index.json')
+
+FIXTURES_RESULTS = os.path.join(FIXTURES_DIR, 'bench_results.json')
+
+# 피드별로 저장할 기사 수
+RECORD_PER_SOURCE = 5
+
+# generate로 만드는 피드별 기사 수와 난수 시드
+GENERATED_PER_SOURCE = 3
+GENERATED_SEED = 20240601
+
+# 소스별 기사 본문 영역 (extractors.json의 컨테이너 규칙에 맞춤)
+GENERATED_LAYOUTS = {
+    'CoinTelegraph': ('cointelegraph.com', '<div class="post-content">', '</div>'),
+    'CoinDesk': ('www.coindesk.com', '<article><div class="article-body at-body">', '</div></article>'),
+    'ThePieNews': ('thepienews.com', '<article><div class="entry-content">', '</div></article>'),
+}
+
+_WORDS = (
+    'bitcoin ethereum market price trading exchange regulators token network investors fund analysts '
+    'blockchain protocol liquidity volume stablecoin custody launch report week data growth policy '
+    'students university platform partnership funding round platform users wallet security update'
+).split()
+
+
+class FixtureEntry(dict):
+    """RSS 항목 대신 쓰는 최소한의 항목 (link, description)"""
+
+    def __init__(self, link):
+        super().__init__(link=link, description='')
+        self.link = link
+        self.description = ''
+
+
+def load_index():
+    if not os.path.exists(FIXTURES_INDEX):
+        return {}
+    with open(FIXTURES_INDEX, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_index(index):
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    with open(FIXTURES_INDEX, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+
+def record_page(url, source_name, index):
+    """기사 페이지를 원본 바이트 그대로 저장하는 함수"""
+    from http_client import http_client
+
+    response = http_client.get(url, timeout=10)
+    response.raise_for_status()
+    file_name = f"{source_name}__{hashlib.sha1(url.encode('utf-8')).hexdigest()[:10]}.html"
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    with open(os.path.join(FIXTURES_DIR, file_name), 'wb') as f:
+        f.write(response.content)
+    index[file_name] = {'source': source_name, 'url': url, 'content_type': response.headers.get('Content-Type')}
+    print(f"저장: {file_name} ({len(response.content)} bytes)")
+
+
+def record_sources(per_source=RECORD_PER_SOURCE):
+    """각 RSS 피드의 최근 기사 페이지를 저장하는 함수"""
+    from feed_cache import feed_cache
+    from rss_scraper import SOURCES
+
+    index = load_index()
+    for source_name, rss_url in SOURCES.items():
+        for entry in feed_cache.fetch(rss_url)['entries'][:per_source]:
+            try:
+                record_page(entry.link, source_name, index)
+            except Exception as e:
+                print(f"[WARN] 저장 실패 ({entry.link}): {e}")
+    save_index(index)
+
+
+def _sentence(rng, words=18):
+    text = ' '.join(rng.choice(_WORDS) for _ in range(rng.randint(words // 2, words)))
+    return text[0].upper() + text[1:] + '.'
+
+
+def _paragraph(rng):
+    sentences = [_sentence(rng) for _ in range(rng.randint(3, 6))]
+    # 본문 안의 링크/강조 태그도 실제 기사처럼 섞음
+    sentences[0] = f'<strong>{sentences[0]}</strong>'
+    sentences[-1] = f'<a href="https://example.com/{rng.randint(1, 9999)}">{sentences[-1]}</a>'
+    return '<p>' + ' '.join(sentences) + '</p>'
+
+
+def generate_page(source_name, rng):
+    """소스의 추출 규칙에 맞춘 기사 페이지 HTML을 만드는 함수 (메뉴, 스크립트, 광고, 관련 기사 포함)"""
+    host, open_tag, close_tag = GENERATED_LAYOUTS[source_name]
+    nav = ''.join(f'<li><a href="https://{host}/tags/{word}-{i}">{word}</a></li>' for i, word in enumerate(_WORDS * 2))
+    scripts = ''.join(
+        f'<script>window.__DATA_{i}__ = {json.dumps({"id": i, "items": [_sentence(rng, 8) for _ in range(5)]})};</script>'
+        for i in range(12)
+    )
+    body = []
+    for index in range(rng.randint(10, 18)):
+        body.append(_paragraph(rng))
+        if index % 4 == 1:
+            body.append(f'<h2>{_sentence(rng, 6)}</h2>')
+        if index % 5 == 2:
+            body.append('<figure><img src="https://example.com/image.jpg"><figcaption>Image</figcaption></figure>')
+            body.append('<script>googletag.cmd.push(function() { googletag.display("ad"); });</script>')
+    if source_name == 'ThePieNews':
+        body.append('<ul>' + ''.join(f'<li>{_sentence(rng, 8)}</li>' for _ in range(4)) + '</ul>')
+        body.append('<div class="sharedaddy">Share this article</div>')
+        body.append('<div class="jp-relatedposts">' + ''.join(f'<p>{_sentence(rng, 8)}</p>' for _ in range(3)) + '</div>')
+    elif source_name == 'CoinDesk':
+        body.append('<aside>' + ''.join(f'<p>{_sentence(rng, 8)}</p>' for _ in range(3)) + '</aside>')
+    related = ''.join(f'<li><a href="https://{host}/news/{i}">{_sentence(rng, 8)}</a></li>' for i in range(20))
+    return (
+        f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{_sentence(rng, 8)}</title>'
+        f'<style>body{{font-family:sans-serif}} .nav li{{display:inline}}</style>{scripts}</head>'
+        f'<body><header><nav><ul class="nav">{nav}</ul></nav></header>'
+        f'<main><h1>{_sentence(rng, 10)}</h1>{open_tag}{"".join(body)}{close_tag}'
+        f'<section class="related"><ul>{related}</ul></section></main>'
+        f'<footer><ul>{nav}</ul><p>Copyright</p></footer></body></html>'
+    ).encode('utf-8')
+
+
+def generate_fixtures(per_source=GENERATED_PER_SOURCE, seed=GENERATED_SEED):
+    """소스별 기사 페이지를 고정 시드로 만들어 저장하는 함수 (같은 시드면 항상 같은 페이지)"""
+    rng = random.Random(seed)
+    index = load_index()
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for source_name, (host, _, _) in GENERATED_LAYOUTS.items():
+        for number in range(per_source):
+            html = generate_page(source_name, rng)
+            file_name = f"{source_name}__generated{number}.html"
+            with open(os.path.join(FIXTURES_DIR, file_name), 'wb') as f:
+                f.write(html)
+            index[file_name] = {
+                'source': source_name,
+                'url': f"https://{host}/news/generated-{number}",
+                'content_type': 'text/html; charset=utf-8',
+                'generated': True,
+            }
+            print(f"생성: {file_name} ({len(html)} bytes)")
+    save_index(index)
+
+
+def save_results(results, fixtures, repeat):
+    """측정 결과를 실행 환경과 함께 bench_results.json에 기록하는 함수"""
+    record = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'articles': len(fixtures),
+        'bytes': sum(len(html) for _, html in fixtures),
+        'repeat': repeat,
+        'ms_per_article': {backend: round(value, 3) for backend, value in results.items()},
+    }
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    with open(FIXTURES_RESULTS, 'w', encoding='utf-8') as f:
+        json.dump(record, f, ensure_ascii=False, indent=2)
+
+
+def load_fixtures():
+    fixtures = []
+    for file_name, meta in load_index().items():
+        path = os.path.join(FIXTURES_DIR, file_name)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                fixtures.append((meta, f.read()))
+    return fixtures
+
+
+def bench(repeat=3):
+    """저장된 페이지로 파서별 파싱+추출 시간을 측정하고 결과를 출력하는 함수"""
+    fixtures = load_fixtures()
+    if not fixtures:
+        print(
+            f"{FIXTURES_DIR}에 저장된 페이지가 없습니다. "
+            f"먼저 'python bench_html.py record' 또는 'python bench_html.py generate'를 실행하세요."
+        )
+        return {}
+
+    results = {}
+    outputs = {}
+    for backend in available_backends():
+        started = time.perf_counter()
+        for _ in range(repeat):
+            contents = [
+                extractor_registry.extract(
+                    parse_html(html, meta.get('content_type'), backend),
+                    FixtureEntry(meta['url']),
+                    meta['source'],
+                )
+                for meta, html in fixtures
+            ]
+        elapsed = time.perf_counter() - started
+        results[backend] = elapsed / (repeat * len(fixtures)) * 1000
+        outputs[backend] = contents
+
+    baseline = results.get('bs4')
+    print(f"\n기사 {len(fixtures)}건, {repeat}회 반복")
+    for backend, per_article in results.items():
+        speedup = f", bs4 대비 {baseline / per_article:.1f}배" if baseline else ''
+        print(f"- {backend}: 기사당 {per_article:.2f}ms{speedup}")
+
+    reference = outputs.get('bs4') or next(iter(outputs.values()))
+    for backend, contents in outputs.items():
+        different = sum(1 for a, b in zip(reference, contents) if a != b)
+        if different:
+            print(f"[WARN] {backend}: 기준 결과와 본문이 다른 기사 {different}건")
+    save_results(results, fixtures, repeat)
+    return results
+
+
+if __name__ == "__main__":
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'bench'
+    if mode == 'record' and len(sys.argv) > 3:
+        index = load_index()
+        record_page(sys.argv[2], sys.argv[3], index)
+        save_index(index)
+    elif mode == 'record':
+        record_sources()
+    elif mode == 'generate':
+        generate_fixtures()
+    else:
+        bench(int(sys.argv[2]) if len(sys.argv) > 2 else 3)
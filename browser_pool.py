@@ -0,0 +1,201 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from fetch_engine import HostPoliteness
+
+# 동시에 띄울 헤드리스 브라우저 수
+BROWSER_WORKERS = int(os.getenv('BROWSER_WORKERS', '3'))
+
+# 브라우저 창 표시 여부 (디버깅할 때만 false)
+BROWSER_HEADLESS = os.getenv('BROWSER_HEADLESS', 'true').lower() == 'true'
+
+# 본문 추출에 필요 없는 요청 (이미지, 폰트, 미디어, 광고/분석 스크립트)은 네트워크 단계에서 차단
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3',
+    '*doubleclick.net*', '*googlesyndication.com*', '*googletagmanager.com*',
+    '*google-analytics.com*', '*facebook.net*', '*hotjar.com*', '*taboola.com*', '*outbrain.com*',
+]
+
+# 본문 영역의 문단 텍스트를 한 번의 호출로 모두 모으는 스크립트
+# arguments: [본문 영역 선택자, 문단 태그 목록, 중단 선택자(없으면 null)]
+EXTRACT_SCRIPT = """
+const root = document.querySelector(arguments[0]);
+if (!root) { return null; }
+const blocks = new Set(arguments[1]);
+const stop = arguments[2];
+const paragraphs = [];
+let last = null;
+for (const el of root.querySelectorAll('*')) {
+    if (stop && el.matches(stop)) { break; }
+    if (last && last.contains(el)) { continue; }
+    if (!blocks.has(el.tagName.toLowerCase())) { continue; }
+    last = el;
+    const text = (el.innerText || '').trim();
+    if (text) { paragraphs.push(text); }
+}
+return paragraphs;
+"""
+
+
+def create_browser(headless=BROWSER_HEADLESS):
+    """이미지/폰트/광고 요청을 차단한 크롬 드라이버를 만드는 함수 (selenium은 이때 불러옴)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    if headless:
+        options.add_argument('--headless=new')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    # DOM이 준비되면 바로 반환 (나머지 리소스 로딩을 기다리지 않음)
+    options.page_load_strategy = 'eager'
+
+    driver = webdriver.Chrome(options=options)
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    return driver
+
+
+def extract_paragraphs(driver, container, blocks=('p', 'li', 'blockquote'), stop=None):
+    """
+    현재 페이지의 본문 영역에서 문단 텍스트를 한 번의 execute_script로 가져오는 함수
+
+    Args:
+        driver: 셀레니움 드라이버
+        container (str): 본문 영역 CSS 선택자
+        blocks (tuple): 문단으로 모을 태그 (모은 문단 안쪽의 태그는 다시 모으지 않음)
+        stop (str): 이 CSS 선택자에 맞는 요소가 나오면 그 뒤는 모으지 않음
+
+    Returns:
+        list: 문단 텍스트 목록 (본문 영역이 없으면 빈 목록)
+    """
+    return driver.execute_script(EXTRACT_SCRIPT, container, list(blocks), stop) or []
+
+
+class BrowserPool:
+    """
+    헤드리스 브라우저 여러 개를 띄워 두고 페이지 작업에 번갈아 빌려주는 풀
+
+    브라우저는 처음 필요할 때 만들어 작업 사이에 재사용하고, 응답하지 않는 브라우저만 새로 만든다.
+    같은 호스트로 가는 페이지 요청은 HostPoliteness의 호스트별 제한을 따른다.
+    """
+
+    def __init__(self, size=BROWSER_WORKERS, headless=BROWSER_HEADLESS, politeness=None):
+        """
+        Args:
+            size (int): 최대 브라우저 수 (동시에 처리하는 페이지 수)
+            headless (bool): 헤드리스 모드 사용 여부
+            politeness (HostPoliteness): 호스트별 제한 (없으면 브라우저 수만큼 동시 요청 허용)
+        """
+        self.size = max(1, size)
+        self.headless = headless
+        self.politeness = politeness or HostPoliteness(max_concurrent_per_host=self.size)
+        self._idle = queue.Queue()
+        self._browsers = []
+        self._reserved = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _checkout(self):
+        # 쉬는 브라우저가 없으면 새로 만들고, 최대 수에 도달했으면 반납을 기다림
+        # (기다리는 동안 죽은 브라우저가 버려지면 빈자리에 새로 만들 수 있도록 주기적으로 다시 확인)
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                reserved = self._reserved < self.size
+                if reserved:
+                    self._reserved += 1
+            if reserved:
+                # 브라우저 시작은 느리므로 잠금 밖에서 만들어 여러 브라우저를 동시에 띄움
+                try:
+                    driver = create_browser(self.headless)
+                except Exception:
+                    with self._lock:
+                        self._reserved -= 1
+                    raise
+                with self._lock:
+                    self._browsers.append(driver)
+                return driver
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._browsers:
+                self._browsers.remove(driver)
+                self._reserved -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    @contextmanager
+    def browser(self):
+        """쉬고 있는 브라우저를 빌려주는 컨텍스트 매니저 (모두 사용 중이면 반납될 때까지 대기)"""
+        driver = self._checkout()
+        try:
+            yield driver
+        finally:
+            # 호출한 쪽이 예외를 잡아 삼켜도 죽은 브라우저가 풀로 돌아가지 않도록 반납 전에 상태를 확인
+            # (페이지 대기 시간 초과 등은 브라우저를 계속 쓰고, 브라우저가 죽었을 때만 버림)
+            if self._is_alive(driver):
+                self._idle.put(driver)
+            else:
+                self._discard(driver)
+
+    def map(self, urls, func):
+        """
+        URL마다 func(driver, url)를 브라우저 풀에서 병렬로 실행하고 입력 순서대로 결과를 반환하는 함수
+
+        실패한 작업의 결과는 None으로 채운다.
+        """
+        def run(url):
+            with self.politeness.slot(url):
+                with self.browser() as driver:
+                    return func(driver, url)
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.size, thread_name_prefix='browser') as executor:
+            futures = [executor.submit(run, url) for url in urls]
+            for url, future in zip(urls, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"[WARN] 브라우저 작업 실패 ({url}): {e}")
+                    results.append(None)
+        return results
+
+    def close(self):
+        """풀의 모든 브라우저를 종료하는 함수"""
+        with self._lock:
+            browsers, self._browsers = self._browsers, []
+            self._reserved = 0
+        for driver in browsers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
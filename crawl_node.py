@@ -0,0 +1,222 @@
+"""
+여러 서버에서 피드와 기사 URL을 공유 작업 큐로 나눠 크롤링하는 노드
+
+각 노드는 공유 큐(work_queue)에서 피드/기사 작업을 임대해 처리한다.
+- 피드 작업: 수집 기록(seen_store)에 없는 새 기사를 기사 작업으로 등록하고(작업 ID가 URL이라 한 번만 등록),
+  피드는 발행 주기 저장소(cadence_store)에서 학습한 피드별 간격(+무작위 편차) 뒤에 다시 처리하도록 돌려놓는다.
+  실패한 피드도 멈추지 않고 대기 시간을 늘려 다시 처리한다.
+- 기사 작업: 페이지를 가져와 본문을 추출한 뒤 수집 기록에 처음 기록한 노드만 작업 저장소(job_store)에 등록한다.
+  포스팅은 `python main.py resume`을 실행하는 프로세스가 작업 저장소에서 이어서 처리한다.
+
+노드 사이의 중복 방지는 공유 SQLite 파일(WORK_QUEUE_PATH, seen_store, job_store)로 이루어지므로
+모든 노드가 같은 파일을 보도록 경로를 설정해야 한다.
+
+사용 예시:
+    python crawl_node.py seed          # feeds.json의 피드를 큐에 등록 (새 피드를 추가했을 때도 실행)
+    python crawl_node.py run           # 노드 실행 (Ctrl+C로 종료)
+    python crawl_node.py run --once    # 지금 처리할 작업이 없어지면 종료
+    python crawl_node.py status        # 큐 상태 출력
+"""
+import argparse
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from article_store import article_store
+from feed_cadence import cadence_store, publish_times
+from feed_registry import feed_registry, FEED_DEFAULTS
+from feed_scheduler import jittered
+from fetch_engine import HostPoliteness
+from job_store import job_store
+from process_pool import process_pool, EntryRecord, WORKER_PROCESSES
+from rss_scraper import MAX_FETCH_WORKERS, get_new_entries, fetch_article_page, build_article
+from seen_store import seen_store, normalize_url
+from work_queue import work_queue, NODE_ID, TASK_LEASE_SECONDS
+
+# 처리할 작업이 없을 때 큐를 다시 확인하는 간격(초)
+POLL_INTERVAL_SECONDS = 2.0
+
+# 하트비트 간격(초) - 임대 시간보다 충분히 짧아야 처리 중인 작업이 만료되지 않음
+HEARTBEAT_SECONDS = TASK_LEASE_SECONDS / 4
+
+
+def seed_feeds(sources=None, queue=work_queue):
+    """
+    피드 작업을 큐에 등록하는 함수 (이미 등록된 피드는 그대로 둠)
+
+    Returns:
+        int: 새로 등록한 피드 수
+    """
+    sources = sources or feed_registry.sources()
+    added = sum(
+        1 for source_name, url in sources.items()
+        if queue.put(f"feed:{url}", 'feed', {'source': source_name, 'url': url})
+    )
+    print(f"피드 {added}개를 작업 큐에 등록했습니다. (전체 {len(sources)}개)")
+    return added
+
+
+class CrawlNode:
+    """
+    공유 큐에서 피드/기사 작업을 임대해 처리하는 크롤링 노드
+
+    노드 안에서는 스레드 풀로 여러 작업을 동시에 처리하고, 같은 호스트 요청은 HostPoliteness로 제한한다.
+    하트비트 스레드가 처리 중인 작업의 임대를 연장하므로, 노드가 죽으면 그 작업은 임대 만료 후 다른 노드로 넘어간다.
+    """
+
+    def __init__(self, node_id=NODE_ID, queue=work_queue, threads=MAX_FETCH_WORKERS, feed_interval=None):
+        """
+        Args:
+            node_id (str): 노드 이름 (작업 임대 소유자)
+            queue (WorkQueue): 공유 작업 큐
+            threads (int): 동시에 처리할 작업 수
+            feed_interval (float): 같은 피드를 다시 확인하는 간격(초) (없으면 피드별로 학습한 발행 주기 간격)
+        """
+        self.node_id = node_id
+        self.queue = queue
+        self.threads = threads
+        self.feed_interval = feed_interval
+        self.politeness = HostPoliteness()
+        self.processed = {'feed': 0, 'article': 0, 'failed': 0}
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def stop(self):
+        self._stop.set()
+
+    def _heartbeat_loop(self):
+        while not self._stop.wait(HEARTBEAT_SECONDS):
+            try:
+                self.queue.heartbeat(self.node_id)
+            except Exception as e:
+                print(f"[WARN] 하트비트 기록 실패: {e}")
+
+    def feed_interval_for(self, source_name):
+        """피드를 다시 확인하기까지의 간격(초)을 반환하는 함수 (학습 전에는 feeds.json의 간격)"""
+        if self.feed_interval is not None:
+            return self.feed_interval
+        return cadence_store.load(source_name, self._default_interval(source_name)).interval
+
+    @staticmethod
+    def _default_interval(source_name):
+        feed = feed_registry.get(source_name)
+        return feed.interval_seconds if feed else FEED_DEFAULTS['interval_minutes'] * 60
+
+    def _observe_feed(self, source_name, entries):
+        # 모든 노드가 같은 발행 주기 저장소를 갱신하므로 어느 노드가 피드를 처리해도 학습이 이어짐
+        if self.feed_interval is None:
+            cadence_store.observe(source_name, publish_times(entries), self._default_interval(source_name))
+
+    def handle_feed(self, task):
+        """피드에서 새 기사를 골라 기사 작업으로 등록하는 함수 (이미 등록된 기사 작업은 그대로 둠)"""
+        source_name, url = task.payload['source'], task.payload['url']
+        # 계속 실행되는 노드에서 기사 저장소가 끝없이 커지지 않도록 날짜가 바뀌면 날짜별 파일로 옮김
+        article_store.rotate()
+        added = 0
+        for entry, pub_date in get_new_entries(url, source_name, self._observe_feed):
+            # 수집 기록에는 기사를 가져온 뒤에 기록하므로 (handle_article) 여기서는 작업 ID(URL)로만 중복을 막음
+            payload = {
+                'source': source_name,
+                'pub_date': pub_date.isoformat(),
+                'entry': EntryRecord.from_entry(entry),
+            }
+            if self.queue.put(f"article:{normalize_url(entry.link)}", 'article', payload):
+                added += 1
+        print(f"{source_name} 피드에서 기사 작업 {added}개를 등록했습니다.")
+        self.queue.reschedule(task, jittered(self.feed_interval_for(source_name)))
+
+    def handle_article(self, task):
+        """
+        기사 페이지를 가져와 본문을 추출하고 포스팅 작업으로 등록하는 함수
+
+        수집 기록은 기사를 가져온 뒤에 기록하므로, 가져오기에 실패해 재시도하거나 중단된 기사가 기록만 남아 빠지지 않는다.
+        """
+        entry = EntryRecord.from_entry(task.payload['entry'])
+        pub_date = datetime.fromisoformat(task.payload['pub_date'])
+        with self.politeness.slot(entry.link):
+            page = fetch_article_page(entry, task.payload['source'], pub_date)
+        article = build_article(page)
+        # 수집 기록에 처음 기록한 노드만 등록 (다른 URL로 이미 수집한 같은 제목의 기사는 제외)
+        # 이 URL이 이미 기록되어 있으면 등록 전에 멈춘 이전 시도이므로 이어서 등록
+        if not seen_store.claim(entry.link, entry.title) and not seen_store.contains(entry.link):
+            print(f"이미 수집한 제목의 기사라 건너뜁니다: {entry.title}")
+            self.queue.complete(task)
+            return
+        article_store.append(article)
+        # 작업 저장소도 URL로 중복을 막으므로 여러 노드가 같은 기사를 포스팅하지 않음
+        job_store.enqueue(article)
+        self.queue.complete(task)
+
+    def _handle(self, task):
+        try:
+            if task.kind == 'feed':
+                self.handle_feed(task)
+            elif task.kind == 'article':
+                self.handle_article(task)
+            else:
+                raise ValueError(f"알 수 없는 작업 종류입니다: {task.kind}")
+            kind = task.kind
+        except Exception as e:
+            print(f"작업 처리 실패 ({task.id}): {e}")
+            self.queue.fail(task, e)
+            kind = 'failed'
+        with self._stats_lock:
+            self.processed[kind] += 1
+
+    def run(self, once=False):
+        """
+        작업을 임대해 처리하는 루프를 실행하는 함수
+
+        Args:
+            once (bool): True면 지금 처리할 수 있는 작업이 없고 처리 중인 작업도 끝나면 종료
+        """
+        print(f"크롤링 노드 시작: {self.node_id} (동시 작업 {self.threads}개)")
+        self.queue.heartbeat(self.node_id)
+        heartbeat = threading.Thread(target=self._heartbeat_loop, name='heartbeat', daemon=True)
+        heartbeat.start()
+
+        running = set()
+        with ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='crawl') as executor:
+            try:
+                while not self._stop.is_set():
+                    running = {future for future in running if not future.done()}
+                    free = self.threads - len(running)
+                    tasks = self.queue.lease(self.node_id, limit=free) if free > 0 else []
+                    for task in tasks:
+                        running.add(executor.submit(self._handle, task))
+                    if tasks:
+                        continue
+                    if once and not running:
+                        break
+                    self._stop.wait(POLL_INTERVAL_SECONDS)
+            finally:
+                self._stop.set()
+
+        print(
+            f"크롤링 노드 종료: 피드 {self.processed['feed']}건, 기사 {self.processed['article']}건, "
+            f"실패 {self.processed['failed']}건"
+        )
+        self.queue.report()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="공유 작업 큐로 피드와 기사를 나눠 크롤링합니다.")
+    arg_parser.add_argument('command', choices=['seed', 'run', 'status'])
+    arg_parser.add_argument('--once', action='store_true', help="지금 처리할 작업이 없어지면 종료")
+    arg_parser.add_argument('--threads', type=int, default=MAX_FETCH_WORKERS, help="노드 안에서 동시에 처리할 작업 수")
+    arg_parser.add_argument('--workers', type=int, default=WORKER_PROCESSES,
+                            help="HTML 파싱/본문 추출에 사용할 프로세스 수 (0이면 현재 프로세스)")
+    args = arg_parser.parse_args()
+
+    if args.command == 'seed':
+        seed_feeds()
+    elif args.command == 'status':
+        work_queue.report()
+    else:
+        process_pool.configure(args.workers)
+        node = CrawlNode(threads=args.threads)
+        try:
+            node.run(once=args.once)
+        except KeyboardInterrupt:
+            node.stop()
+        finally:
+            process_pool.shutdown()
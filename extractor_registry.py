@@ -0,0 +1,321 @@
+import json
+import re
+import threading
+import time
+from readability import extract_main_content
+
+# 소스별 본문 추출 설정 파일
+EXTRACTORS_PATH = 'extractors.json'
+
+# 설정에 없는 소스에 사용하는 설정 이름
+DEFAULT_EXTRACTOR = 'default'
+
+# 추출 방법별 본문 신뢰도 (readability는 추출 결과로 계산)
+SELECTOR_CONFIDENCE = 1.0
+FALLBACK_CONFIDENCE = {'main': 0.6, 'all_paragraphs': 0.3, 'rss': 0.3}
+FAILED_CONFIDENCE = 0.1
+
+# readability 결과를 받아들이는 최소 신뢰도 (낮으면 다음 대체 방법 시도)
+READABILITY_MIN_CONFIDENCE = 0.2
+
+_SIMPLE_SELECTOR_RE = re.compile(r'^(?P<tag>[\w*-]+)?(?P<classes>(?:\.[\w-]+)*)(?P<attrs>(?:\[[^\]]+\])*)$')
+_ATTR_RE = re.compile(r'\[\s*(?P<name>[\w-]+)\s*(?:(?P<op>[*^$~]?=)\s*["\']?(?P<value>[^"\'\]]*)["\']?)?\s*\]')
+
+
+def _attr_text(element, name):
+    value = element.get(name)
+    if isinstance(value, list):
+        return ' '.join(value)
+    return value
+
+
+def compile_simple_selector(selector):
+    """
+    'div', 'div.post-content', 'div[class*="content"]' 형태의 단순 선택자를 요소 검사 함수로 바꾸는 함수
+
+    Raises:
+        ValueError: 지원하지 않는 선택자일 때
+    """
+    match = _SIMPLE_SELECTOR_RE.match(selector.strip())
+    if not match or not selector.strip():
+        raise ValueError(f"지원하지 않는 선택자입니다: {selector}")
+    tag = match.group('tag')
+    tag = None if tag in (None, '*') else tag.lower()
+    classes = [name for name in match.group('classes').split('.') if name]
+    attrs = [(m.group('name'), m.group('op'), m.group('value')) for m in _ATTR_RE.finditer(match.group('attrs'))]
+
+    def matches(element):
+        if tag and element.name != tag:
+            return False
+        if classes:
+            element_classes = element.get('class') or []
+            if not all(name in element_classes for name in classes):
+                return False
+        for name, op, value in attrs:
+            actual = _attr_text(element, name)
+            if actual is None:
+                return False
+            if op == '=' and actual != value:
+                return False
+            if op == '*=' and value not in actual:
+                return False
+            if op == '^=' and not actual.startswith(value):
+                return False
+            if op == '$=' and not actual.endswith(value):
+                return False
+            if op == '~=' and value not in actual.split():
+                return False
+        return True
+
+    return matches
+
+
+class CompiledSelector:
+    """공백으로 구분한 하위 선택자('article div.entry-content')까지 지원하는 컴파일된 선택자"""
+
+    def __init__(self, selector):
+        self.selector = selector
+        self.parts = [compile_simple_selector(part) for part in selector.split()]
+
+    def matches(self, element):
+        if not self.parts[-1](element):
+            return False
+        # 나머지 부분은 조상 요소에서 오른쪽부터 차례로 찾음
+        remaining = self.parts[:-1]
+        parent = element.parent
+        while remaining and parent is not None:
+            if remaining[-1](parent):
+                remaining = remaining[:-1]
+            parent = parent.parent
+        return not remaining
+
+
+def _iter_tags(root, skip=None):
+    # 트리를 한 번만 훑으며 요소를 문서 순서대로 반환 (skip이 참인 요소는 하위 트리 전체를 건너뜀)
+    # root와 요소는 html_backend의 노드 (파서와 관계없이 같은 인터페이스)
+    stack = [iter(root.children)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            continue
+        if skip and skip(child):
+            continue
+        descend = yield child
+        if descend is not False:
+            stack.append(iter(child.children))
+
+
+def select(root, selector):
+    """root 아래에서 선택자에 맞는 요소를 문서 순서대로 반환하는 제너레이터 (트리를 한 번만 훑음)"""
+    compiled = selector if isinstance(selector, CompiledSelector) else CompiledSelector(selector)
+    for element in _iter_tags(root):
+        if compiled.matches(element):
+            yield element
+
+
+def select_one(root, selector):
+    """root 아래에서 선택자에 맞는 첫 번째 요소를 반환하는 함수 (없으면 None)"""
+    return next(select(root, selector), None)
+
+
+def rss_fallback(entry):
+    """RSS 항목의 전체 내용, 설명, 요약 순으로 대체 본문을 반환하는 함수"""
+    if hasattr(entry, 'content') and entry.content:
+        return entry.content[0].value
+    if hasattr(entry, 'description'):
+        return entry.description
+    if hasattr(entry, 'summary'):
+        return entry.summary
+    return ''
+
+
+class SourceExtractor:
+    """
+    소스 하나의 본문 추출 규칙
+
+    설정 항목:
+        containers: 본문 영역 선택자 (앞에 있을수록 우선)
+        require: 이 선택자에 맞는 요소가 없으면 containers를 건너뛰고 fallbacks로 진행
+        strip: 본문에서 제외할 요소 선택자 (하위 트리 전체 제외)
+        blocks: 문단으로 모을 태그
+        list_blocks: 항목(li)마다 '• '를 붙여 문단으로 나눌 태그
+        skip_phrases: 이 문구가 들어간 문단은 제외
+        stop: 이 선택자에 맞는 요소가 나오면 그 뒤의 문단은 모으지 않음 (예: 면책 조항)
+        fallbacks: 본문을 찾지 못했을 때 차례로 시도할 방법 (readability, main, all_paragraphs, rss)
+    """
+
+    def __init__(self, name, config):
+        self.name = name
+        self.containers = [CompiledSelector(selector) for selector in config.get('containers', [])]
+        self.require = CompiledSelector(config['require']) if config.get('require') else None
+        self.strip = [CompiledSelector(selector) for selector in config.get('strip', [])]
+        self.blocks = set(config.get('blocks', ['p']))
+        self.list_blocks = set(config.get('list_blocks', []))
+        self.skip_phrases = [phrase.lower() for phrase in config.get('skip_phrases', [])]
+        self.stop = CompiledSelector(config['stop']) if config.get('stop') else None
+        self.fallbacks = list(config.get('fallbacks', ['rss']))
+
+    def _is_stripped(self, element):
+        return any(selector.matches(element) for selector in self.strip)
+
+    def paragraphs(self, container):
+        """본문 영역에서 제외 요소를 건너뛰며 문단 텍스트를 모으는 함수"""
+        paragraphs = []
+        walker = _iter_tags(container, skip=self._is_stripped)
+        descend = None
+        while True:
+            try:
+                element = walker.send(descend)
+            except StopIteration:
+                break
+            descend = None
+            if self.stop and self.stop.matches(element):
+                break
+            if element.name not in self.blocks:
+                continue
+            # 문단으로 모은 요소 안쪽은 다시 보지 않음 (중복 방지)
+            descend = False
+            text = element.text()
+            if not text or any(phrase in text.lower() for phrase in self.skip_phrases):
+                continue
+            if element.name in self.list_blocks:
+                items = [li.text() for li in element.find_all('li')]
+                paragraphs.extend(f"• {item}" for item in items if item)
+            else:
+                paragraphs.append(text)
+        return paragraphs
+
+    def _find_first(self, soup):
+        # 문서를 한 번 훑으며 모든 선택자의 첫 번째 일치 요소를 기록
+        first = [None] * len(self.containers)
+        required_found = self.require is None
+        for element in _iter_tags(soup):
+            if not required_found and self.require.matches(element):
+                required_found = True
+            for index, selector in enumerate(self.containers):
+                if first[index] is None and selector.matches(element):
+                    first[index] = element
+            if required_found and all(found is not None for found in first):
+                break
+        return first if required_found else []
+
+    def extract(self, soup, entry):
+        """
+        본문을 추출하는 함수
+
+        Returns:
+            tuple: (본문, 사용한 방법, 신뢰도) - 방법은 선택자 또는 대체 방법 이름
+        """
+        for selector, container in zip(self.containers, self._find_first(soup)):
+            if container is None:
+                continue
+            paragraphs = self.paragraphs(container)
+            if paragraphs:
+                return '\n\n'.join(paragraphs), selector.selector, SELECTOR_CONFIDENCE
+
+        for fallback in self.fallbacks:
+            if fallback == 'readability':
+                result = extract_main_content(soup)
+                if result.paragraphs and result.confidence >= READABILITY_MIN_CONFIDENCE:
+                    return result.content, fallback, result.confidence
+                continue
+            if fallback == 'main':
+                main = soup.find('main')
+                content = '\n\n'.join(self.paragraphs(main)) if main else ''
+            elif fallback == 'all_paragraphs':
+                content = '\n\n'.join(text for text in (p.text() for p in soup.find_all('p')) if text)
+            elif fallback == 'rss':
+                content = rss_fallback(entry)
+            else:
+                print(f"[WARN] 알 수 없는 대체 방법입니다: {fallback}")
+                continue
+            if content and content.strip():
+                return content, fallback, FALLBACK_CONFIDENCE[fallback]
+        return '', None, 0.0
+
+
+class ExtractorRegistry:
+    """
+    extractors.json에서 소스별 추출 규칙을 읽어 두고, 소스별 추출 시간과 결과를 집계하는 클래스
+
+    새 매체는 설정 파일에 항목을 추가하면 되며, 설정이 없는 소스는 default 규칙을 사용한다.
+    """
+
+    def __init__(self, path=EXTRACTORS_PATH):
+        self.path = path
+        self._extractors = None
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            configs = json.load(f)
+        return {name: SourceExtractor(name, config) for name, config in configs.items()}
+
+    def get(self, source_name):
+        """소스 이름에 해당하는 SourceExtractor를 반환하는 함수 (처음 호출할 때 설정을 읽고 선택자를 컴파일)"""
+        with self._lock:
+            if self._extractors is None:
+                self._extractors = self._load()
+            return self._extractors.get(source_name) or self._extractors[DEFAULT_EXTRACTOR]
+
+    def extract(self, soup, entry, source_name):
+        """소스 규칙으로 본문을 추출하고 소요 시간을 기록하는 함수"""
+        return self.extract_with_confidence(soup, entry, source_name)[0]
+
+    def extract_with_confidence(self, soup, entry, source_name):
+        """
+        소스 규칙으로 본문을 추출하고 본문 신뢰도와 함께 반환하는 함수
+
+        Returns:
+            tuple: (본문, 신뢰도 0~1) - 신뢰도가 낮으면 번역할 가치가 낮은 본문
+        """
+        started = time.perf_counter()
+        content, method, confidence = self.get(source_name).extract(soup, entry)
+        return self.record_result(source_name, entry, content, method, confidence, time.perf_counter() - started)
+
+    def record_result(self, source_name, entry, content, method, confidence, elapsed):
+        """
+        추출 결과를 집계하고 본문이 없으면 RSS 설명으로 대체하는 함수 (다른 프로세스에서 추출한 결과에도 사용)
+
+        Returns:
+            tuple: (본문, 신뢰도 0~1)
+        """
+        extractor = self.get(source_name)
+        self._record(source_name, elapsed, method, extractor)
+
+        if not content.strip():
+            print(f"[WARN] 기사 내용을 찾을 수 없습니다. ({entry.link}, 소스: {source_name})")
+            content = entry.get('description', '') or entry.get('summary', '')
+            confidence = FAILED_CONFIDENCE
+        elif method in extractor.fallbacks:
+            print(f"{source_name} 본문 선택자 실패 - 대체 방법 '{method}' 사용 ({len(content)} 문자, 신뢰도 {confidence:.2f})")
+        return content, confidence
+
+    def _record(self, source_name, elapsed, method, extractor):
+        with self._lock:
+            stats = self._stats.setdefault(source_name, {'count': 0, 'seconds': 0.0, 'fallbacks': 0, 'failures': 0})
+            stats['count'] += 1
+            stats['seconds'] += elapsed
+            if method is None:
+                stats['failures'] += 1
+            elif method in extractor.fallbacks:
+                stats['fallbacks'] += 1
+
+    def stats(self):
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def report(self):
+        """소스별 본문 추출 횟수, 평균 소요 시간, 대체 방법 사용 횟수를 출력하는 함수"""
+        for name, stats in self.stats().items():
+            average = stats['seconds'] / stats['count'] * 1000 if stats['count'] else 0.0
+            print(
+                f"본문 추출 [{name}] {stats['count']}건, 평균 {average:.1f}ms, "
+                f"대체 방법 {stats['fallbacks']}건, 실패 {stats['failures']}건"
+            )
+
+
+# 스크래퍼 전체에서 공유하는 추출 규칙 저장소
+extractor_registry = ExtractorRegistry()
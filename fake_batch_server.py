@@ -0,0 +1,133 @@
+"""
+OpenAI Batch API를 흉내 내는 로컬 가짜 서버
+
+배치 번역 흐름(파일 업로드 -> 배치 생성 -> 상태 확인 -> 결과 다운로드)을 실제 API 없이 확인하기 위한 개발용 서버다.
+배치는 생성 즉시 완료되며, 각 요청에 대해 기사 제목을 담은 고정 형식의 JSON 번역 결과를 돌려준다.
+
+사용 예시:
+    python fake_batch_server.py 8765
+    OPENAI_BATCH_BASE_URL=http://127.0.0.1:8765/v1 python main.py batch --poll-interval 1
+"""
+import itertools
+import json
+import sys
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_files = {}
+_batches = {}
+_ids = itertools.count(1)
+_lock = threading.Lock()
+
+
+def _new_id(prefix):
+    with _lock:
+        return f"{prefix}-{next(_ids)}"
+
+
+def _file_object(file_id, data, purpose):
+    return {
+        'id': file_id, 'object': 'file', 'bytes': len(data), 'created_at': int(time.time()),
+        'filename': f"{file_id}.jsonl", 'purpose': purpose, 'status': 'processed',
+    }
+
+
+def fake_completion(body):
+    """요청 본문에 대한 가짜 번역 응답을 만드는 함수"""
+    user_content = body['messages'][-1]['content']
+    first_line = next((line for line in user_content.splitlines() if line.strip()), '')
+    content = json.dumps({
+        'title': f"[가짜 번역] {first_line[:40]}",
+        'lead': '가짜 배치 서버가 만든 리드 문장이다.',
+        'content': '<p>가짜 배치 서버가 만든 본문이다.</p><br>',
+        'tags': ['테스트'],
+    }, ensure_ascii=False)
+    return {'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}]}
+
+
+def complete_batch(batch):
+    """입력 파일의 모든 요청을 처리하고 결과 파일을 만드는 함수"""
+    lines = []
+    for line in _files[batch['input_file_id']].decode('utf-8').splitlines():
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        lines.append(json.dumps({
+            'id': _new_id('batch_req'),
+            'custom_id': request['custom_id'],
+            'response': {'status_code': 200, 'body': fake_completion(request['body'])},
+            'error': None,
+        }, ensure_ascii=False))
+    output_id = _new_id('file')
+    _files[output_id] = ('\n'.join(lines) + '\n').encode('utf-8')
+    batch.update({'status': 'completed', 'output_file_id': output_id, 'completed_at': int(time.time())})
+
+
+class FakeBatchHandler(BaseHTTPRequestHandler):
+
+    def _send_json(self, payload, status=200):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def do_POST(self):
+        if self.path.endswith('/files'):
+            raw = b'Content-Type: ' + self.headers['Content-Type'].encode() + b'\r\n\r\n' + self._body()
+            message = BytesParser(policy=default_policy).parsebytes(raw)
+            fields = {part.get_param('name', header='content-disposition'): part.get_payload(decode=True)
+                      for part in message.iter_parts()}
+            file_id = _new_id('file')
+            _files[file_id] = fields.get('file', b'')
+            self._send_json(_file_object(file_id, _files[file_id], (fields.get('purpose') or b'batch').decode()))
+        elif self.path.endswith('/batches'):
+            request = json.loads(self._body())
+            batch_id = _new_id('batch')
+            _batches[batch_id] = {
+                'id': batch_id, 'object': 'batch', 'endpoint': request['endpoint'],
+                'input_file_id': request['input_file_id'], 'completion_window': request['completion_window'],
+                'status': 'in_progress', 'created_at': int(time.time()),
+                'output_file_id': None, 'error_file_id': None,
+            }
+            self._send_json(_batches[batch_id])
+        else:
+            self._send_json({'error': {'message': 'not found'}}, 404)
+
+    def do_GET(self):
+        parts = self.path.rstrip('/').split('/')
+        if len(parts) >= 2 and parts[-2] == 'batches' and parts[-1] in _batches:
+            batch = _batches[parts[-1]]
+            if batch['status'] == 'in_progress':
+                complete_batch(batch)
+            self._send_json(batch)
+        elif parts[-1] == 'content' and parts[-2] in _files:
+            data = _files[parts[-2]]
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/octet-stream')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self._send_json({'error': {'message': 'not found'}}, 404)
+
+    def log_message(self, format, *args):
+        print(f"[fake-batch] {format % args}")
+
+
+def serve(port=8765):
+    """가짜 배치 서버를 실행하는 함수"""
+    server = ThreadingHTTPServer(('127.0.0.1', port), FakeBatchHandler)
+    print(f"가짜 배치 서버 실행 중: http://127.0.0.1:{port}/v1")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    serve(int(sys.argv[1]) if len(sys.argv) > 1 else 8765)
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import time
+import feedparser
+from http_client import http_client
+
+# 피드 캐시를 저장할 디렉터리
+FEED_CACHE_DIR = 'feed_cache'
+
+# 캐시에 저장할 RSS 항목 필드
+ENTRY_FIELDS = ('id', 'title', 'link', 'description', 'summary')
+ENTRY_TIME_FIELDS = ('published_parsed', 'updated_parsed')
+
+
+def serialize_entry(entry):
+    """feedparser 항목을 JSON으로 저장할 수 있는 dict로 변환하는 함수"""
+    data = {field: entry[field] for field in ENTRY_FIELDS if field in entry}
+    for field in ENTRY_TIME_FIELDS:
+        if entry.get(field):
+            data[field] = list(entry[field])
+    if entry.get('content'):
+        data['content'] = [
+            {'value': item.get('value', ''), 'type': item.get('type', '')}
+            for item in entry.content
+        ]
+    return data
+
+
+def deserialize_entry(data):
+    """저장된 dict를 feedparser 항목과 같은 방식으로 접근할 수 있는 객체로 되돌리는 함수"""
+    entry = feedparser.FeedParserDict()
+    for field in ENTRY_FIELDS:
+        if field in data:
+            entry[field] = data[field]
+    for field in ENTRY_TIME_FIELDS:
+        if field in data:
+            entry[field] = time.struct_time(tuple(data[field]))
+    if 'content' in data:
+        entry['content'] = [feedparser.FeedParserDict(item) for item in data['content']]
+    return entry
+
+
+class FeedCache:
+    """
+    조건부 GET(ETag / Last-Modified)을 사용하는 디스크 기반 RSS 피드 캐시
+
+    피드별로 ETag, Last-Modified, 파싱된 항목을 파일 하나에 저장한다.
+    서버가 304 Not Modified를 반환하면 다운로드와 파싱 없이 저장된 항목을 그대로 사용한다.
+    """
+
+    def __init__(self, cache_dir=FEED_CACHE_DIR):
+        """
+        Args:
+            cache_dir (str): 캐시 파일을 저장할 디렉터리
+        """
+        self.cache_dir = cache_dir
+
+    def _path(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def load(self, url):
+        """저장된 캐시 레코드를 읽는 함수 (없거나 손상되었으면 None)"""
+        path = self._path(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] 피드 캐시 읽기 실패 ({url}): {e}")
+            return None
+
+    def save(self, url, record):
+        """캐시 레코드를 임시 파일에 쓴 뒤 교체하는 함수 (동시 실행 중에도 파일이 깨지지 않음)"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(url)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def fetch(self, url):
+        """
+        조건부 요청으로 피드를 가져오는 함수
+
+        Args:
+            url (str): RSS 피드 URL
+
+        Returns:
+            dict: {'title', 'entries', 'status', 'not_modified'}
+        """
+        cached = self.load(url)
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = http_client.get(url, headers=headers, timeout=15)
+
+        if response.status_code == 304 and cached:
+            print(f"피드 변경 없음 (304), 캐시 사용: {url}")
+            return {
+                'title': cached.get('title'),
+                'entries': [deserialize_entry(data) for data in cached.get('entries', [])],
+                'status': 304,
+                'not_modified': True,
+            }
+
+        response.raise_for_status()
+        feed = feedparser.parse(response.content)
+        record = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+            'title': feed.feed.get('title'),
+            'entries': [serialize_entry(entry) for entry in feed.entries],
+        }
+        try:
+            self.save(url, record)
+        except OSError as e:
+            print(f"[WARN] 피드 캐시 저장 실패 ({url}): {e}")
+
+        return {
+            'title': record['title'],
+            'entries': feed.entries,
+            'status': response.status_code,
+            'not_modified': False,
+        }
+
+
+# 스크래퍼 전체에서 공유하는 피드 캐시
+feed_cache = FeedCache()
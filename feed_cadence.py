@@ -0,0 +1,421 @@
+"""
+피드별 발행 주기를 학습해 확인 간격을 정하는 적응형 스케줄링
+
+피드를 확인할 때마다 항목의 발행 시각(published_parsed/updated_parsed)으로 두 가지를 학습한다.
+- 시간대 프로필: UTC 시각(0~23시)별 시간당 발행 수의 지수 이동 평균 (PROFILE_DAYS일 기준)
+- 기사 사이 간격의 이동 평균
+
+하루 이상 관찰한 피드는 시간대 프로필로 앞으로 기대되는 발행 수를 적분해, 새 기사가
+1/POLLS_PER_ARTICLE건 나올 것으로 기대되는 시점에 다시 확인한다. 그래서 발행이 몰리는 시간대에는
+자주, 밤처럼 조용한 시간대에는 드물게 확인하고, 조용한 시간대가 끝나는 시점에 맞춰 다시 확인한다.
+프로필이 없는 처음 하루는 기사 간격으로 정하되, 새 기사가 없으면 간격을 BACKOFF_FACTOR배씩 늘리고
+(기대 간격의 BACKOFF_MAX_GAPS배까지) 한 번에 여러 기사가 새로 보이면 간격을 절반으로 줄인다.
+어느 경우든 간격은 feeds.json 간격의 MAX_INTERVAL_FACTOR배를 넘지 않는다.
+
+사용 예시:
+    python feed_cadence.py record          # 피드의 현재 항목 발행 시각을 기록에 추가 (주기적으로 실행)
+    python feed_cadence.py simulate        # 기록으로 고정 간격과 적응형 간격의 신선도/요청 수 비교 (결과는 기록 폴더에 저장)
+    python feed_cadence.py status          # 피드별 학습 상태 출력
+"""
+import calendar
+import json
+import math
+import os
+import sqlite3
+import sys
+import threading
+import time
+from feed_registry import feed_registry
+from feed_scheduler import FeedScheduler, jittered
+
+# 피드별 학습 상태를 저장할 SQLite 파일 (크롤링 노드가 여러 개면 같은 파일을 공유)
+CADENCE_DB_PATH = 'feed_cadence.db'
+
+# 기사 사이 간격 이동 평균의 가중치 (클수록 최근 간격을 많이 반영)
+CADENCE_ALPHA = 0.3
+
+# 기대 기사 간격마다 피드를 확인할 횟수 (한 번 확인하면 그동안 나온 기사를 모두 볼 수 있음)
+POLLS_PER_ARTICLE = 1
+
+# 새 기사가 없을 때 간격을 늘리는 배수와, 늘릴 수 있는 최대 간격 (기대 확인 간격의 배수)
+BACKOFF_FACTOR = 1.5
+BACKOFF_MAX_GAPS = 4
+
+# 시간대 프로필의 평균 기간(일)과, 프로필을 쓰기 전에 관찰해야 하는 기간(초)
+PROFILE_DAYS = 7
+PROFILE_MIN_SECONDS = 86400
+
+# 시간대 프로필에 섞는 하루 평균 발행률의 비율 (한 번도 발행이 없던 시간대도 가끔 확인)
+PROFILE_UNIFORM_WEIGHT = 0.2
+
+# 확인 간격의 하한과 상한(초)
+MIN_POLL_SECONDS = 120
+MAX_POLL_SECONDS = 6 * 3600
+
+# 적응형 간격이 feeds.json의 피드 간격보다 길어질 수 있는 최대 배수 (조용한 시간대의 최대 지연을 제한)
+MAX_INTERVAL_FACTOR = 2
+
+# 시뮬레이션용 발행 기록 저장 위치와 피드에 한 번에 보이는 최신 항목 수
+HISTORY_DIR = os.path.join('fixtures', 'feed_history')
+SIMULATION_RESULTS = os.path.join(HISTORY_DIR, 'simulation_results.json')
+FEED_WINDOW = 30
+
+
+def entry_publish_time(entry):
+    """RSS 항목의 발행 시각(UTC epoch 초)을 반환하는 함수 (시각 정보가 없으면 None)"""
+    parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    return calendar.timegm(parsed) if parsed else None
+
+
+def max_interval_for(feed_interval):
+    """피드 설정 간격으로 적응형 확인 간격의 상한(초)을 정하는 함수"""
+    return min(MAX_POLL_SECONDS, MAX_INTERVAL_FACTOR * feed_interval)
+
+
+def publish_times(entries):
+    """RSS 항목 목록의 발행 시각 목록을 반환하는 함수 (시각 정보가 없는 항목은 제외)"""
+    return [t for t in (entry_publish_time(entry) for entry in entries) if t is not None]
+
+
+class CadenceModel:
+    """
+    피드 하나의 발행 주기 모델
+
+    ewma_gap은 기사 사이 간격(초)의 지수 이동 평균, last_published는 지금까지 본 가장 최근 발행 시각,
+    profile은 UTC 시각별 발행 수의 감쇠 합계(24개), started는 처음 본 발행 시각, updated는 마지막 확인 시각이다.
+    """
+
+    def __init__(self, interval, ewma_gap=None, last_published=None, profile=None, started=None, updated=None,
+                 min_interval=MIN_POLL_SECONDS, max_interval=MAX_POLL_SECONDS):
+        self.interval = interval
+        self.ewma_gap = ewma_gap
+        self.last_published = last_published
+        self.profile = list(profile) if profile else [0.0] * 24
+        self.started = started
+        self.updated = updated
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    def _update_gap(self, times):
+        for previous, current in zip(times, times[1:]):
+            gap = current - previous
+            if gap <= 0:
+                continue
+            if self.ewma_gap is not None:
+                # 밤사이처럼 긴 공백 하나가 평균을 크게 늘리지 않도록 제한
+                gap = min(gap, BACKOFF_MAX_GAPS * self.ewma_gap)
+            self.ewma_gap = gap if self.ewma_gap is None else CADENCE_ALPHA * gap + (1 - CADENCE_ALPHA) * self.ewma_gap
+
+    def _update_profile(self, new, now):
+        if self.updated is not None:
+            decay = math.exp(-max(now - self.updated, 0) / (PROFILE_DAYS * 86400))
+            self.profile = [count * decay for count in self.profile]
+        self.updated = now
+        for published in new:
+            self.profile[int(published // 3600) % 24] += 1
+
+    def hourly_rates(self, now):
+        """
+        UTC 시각별 기대 발행 수(건/시간)를 반환하는 함수
+
+        관찰 기간이 PROFILE_DAYS일보다 짧으면 감쇠 합계가 작게 나오므로 관찰 기간으로 보정한다.
+        """
+        observed = 1 - math.exp(-max(now - self.started, 1) / (PROFILE_DAYS * 86400))
+        rates = [count / PROFILE_DAYS / observed for count in self.profile]
+        mean = sum(rates) / 24
+        return [(1 - PROFILE_UNIFORM_WEIGHT) * rate + PROFILE_UNIFORM_WEIGHT * mean for rate in rates]
+
+    def _profile_interval(self, now):
+        # 기대 발행 수를 한 시간 구간씩 더해 1/POLLS_PER_ARTICLE건이 되는 시점까지의 간격
+        rates = self.hourly_rates(now)
+        needed = 1 / POLLS_PER_ARTICLE
+        at, expected = now, 0.0
+        while at - now < self.max_interval:
+            rate = rates[int(at // 3600) % 24] / 3600
+            span = 3600 - at % 3600
+            if rate > 0 and expected + rate * span >= needed:
+                return at + (needed - expected) / rate - now
+            expected += rate * span
+            at += span
+        return self.max_interval
+
+    def _gap_interval(self, first, new):
+        target = self.ewma_gap / POLLS_PER_ARTICLE
+        if first:
+            return target
+        if not new:
+            # 조용한 시간대: 새 기사가 없을 때마다 간격을 늘리되 기대 간격의 BACKOFF_MAX_GAPS배까지만
+            return min(self.interval * BACKOFF_FACTOR, BACKOFF_MAX_GAPS * target)
+        if len(new) > 1:
+            # 몰아서 발행하는 시간대: 한 번에 여러 기사가 보이면 간격을 줄임
+            return min(target, self.interval / 2)
+        return target
+
+    def observe(self, times, now=None):
+        """
+        피드 확인 결과(항목 발행 시각 목록)를 반영하고 다음 확인 간격(초)을 반환하는 함수
+
+        Args:
+            times (list): 피드에 보이는 항목의 발행 시각(epoch 초)
+            now (float): 확인한 시각 (없으면 현재 시각)
+
+        Returns:
+            float: 다음 확인까지의 간격(초)
+        """
+        now = time.time() if now is None else now
+        times = sorted(times)
+        first = self.last_published is None
+        new = times if first else [t for t in times if t > self.last_published]
+        if self.started is None and times:
+            self.started = times[0]
+
+        # 처음에는 피드에 보이는 항목 전체로, 이후에는 새 기사만으로 갱신
+        self._update_gap(new if first else [self.last_published] + new)
+        self._update_profile(new, now)
+        if new:
+            self.last_published = new[-1]
+
+        if self.started is not None and now - self.started >= PROFILE_MIN_SECONDS:
+            interval = self._profile_interval(now)
+        elif self.ewma_gap is not None:
+            interval = self._gap_interval(first, new)
+        else:
+            return self.interval
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
+        return self.interval
+
+
+class CadenceStore:
+    """
+    피드별 발행 주기 모델을 저장하는 SQLite 저장소
+
+    observe()는 모델을 읽고 갱신해 저장하는 과정을 한 트랜잭션으로 처리하므로,
+    여러 크롤링 노드가 같은 파일을 공유해도 갱신이 유실되지 않는다.
+    """
+
+    def __init__(self, path=CADENCE_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self):
+        # sqlite3 연결은 스레드 간에 공유할 수 없으므로 스레드마다 따로 연결
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        with self._init_lock:
+            if not self._initialized:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS cadence (
+                        feed TEXT PRIMARY KEY,
+                        interval REAL NOT NULL,
+                        ewma_gap REAL,
+                        last_published REAL,
+                        updated_at REAL NOT NULL,
+                        profile TEXT,
+                        started REAL,
+                        observed_at REAL
+                    )
+                ''')
+                self._initialized = True
+        return conn
+
+    _SELECT = 'SELECT interval, ewma_gap, last_published, profile, started, observed_at FROM cadence WHERE feed = ?'
+
+    @staticmethod
+    def _model(row, default_interval):
+        max_interval = max_interval_for(default_interval)
+        if row is None:
+            return CadenceModel(default_interval, max_interval=max_interval)
+        interval, ewma_gap, last_published, profile, started, observed_at = row
+        return CadenceModel(
+            interval, ewma_gap, last_published, json.loads(profile) if profile else None, started, observed_at,
+            max_interval=max_interval,
+        )
+
+    def load(self, feed_name, default_interval):
+        """저장된 모델을 반환하는 함수 (처음 보는 피드는 default_interval로 시작)"""
+        row = self._connect().execute(self._SELECT, (feed_name,)).fetchone()
+        return self._model(row, default_interval)
+
+    def observe(self, feed_name, times, default_interval, now=None):
+        """
+        피드 확인 결과를 모델에 반영해 저장하는 함수
+
+        Returns:
+            CadenceModel: 갱신한 모델
+        """
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            model = self._model(conn.execute(self._SELECT, (feed_name,)).fetchone(), default_interval)
+            model.observe(times, now)
+            conn.execute(
+                'INSERT OR REPLACE INTO cadence VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    feed_name, model.interval, model.ewma_gap, model.last_published, time.time(),
+                    json.dumps([round(count, 4) for count in model.profile]), model.started, model.updated,
+                ),
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return model
+
+    def report(self):
+        """피드별 기대 기사 간격과 현재 확인 간격을 출력하는 함수"""
+        rows = self._connect().execute('SELECT feed, interval, ewma_gap FROM cadence ORDER BY feed').fetchall()
+        for feed, interval, ewma_gap in rows:
+            gap = f"{ewma_gap / 60:.1f}분" if ewma_gap else '학습 전'
+            print(f"발행 주기 [{feed}] 기사 간격 {gap}, 확인 간격 {interval / 60:.1f}분")
+
+
+class AdaptiveFeedScheduler(FeedScheduler):
+    """
+    피드별 발행 주기 모델로 확인 간격을 정하는 스케줄러
+
+    피드를 꺼낼 때는 현재 모델의 간격으로 다음 확인 시각을 잡아 두고, 스크랩 단계가 observe()로
+    항목 발행 시각을 알려 주면 갱신한 간격으로 다음 확인 시각을 다시 정한다.
+    """
+
+    def __init__(self, feeds, store=None, **kwargs):
+        self.store = store or cadence_store
+        self._feeds = {feed.name: feed for feed in feeds}
+        self._models = {feed.name: self.store.load(feed.name, feed.interval_seconds) for feed in feeds}
+        super().__init__(feeds, **kwargs)
+
+    def interval_for(self, feed):
+        return jittered(self._models[feed.name].interval, self.jitter, self.rng)
+
+    def observe(self, feed_name, entries):
+        """피드 항목으로 발행 주기 모델을 갱신하고 다음 확인 시각을 다시 정하는 함수"""
+        feed = self._feeds.get(feed_name)
+        if feed is None:
+            return
+        model = self.store.observe(feed_name, publish_times(entries), feed.interval_seconds, self.clock())
+        self._models[feed_name] = model
+        self.schedule(feed, self.clock() + self.interval_for(feed))
+        print(f"[스케줄] {feed_name} 다음 확인까지 {model.interval / 60:.1f}분")
+
+
+def history_path(feed_name):
+    return os.path.join(HISTORY_DIR, f"{feed_name}.json")
+
+
+def load_history(feed_name):
+    """기록해 둔 피드 발행 시각 목록을 반환하는 함수 (정렬, 중복 제거)"""
+    path = history_path(feed_name)
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return sorted(set(json.load(f)['published']))
+
+
+def record_histories():
+    """각 피드의 현재 항목 발행 시각을 기록에 합치는 함수 (주기적으로 실행해 기록을 쌓음)"""
+    from feed_cache import feed_cache
+
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    for feed in feed_registry.feeds():
+        try:
+            times = publish_times(feed_cache.fetch(feed.url)['entries'])
+        except Exception as e:
+            print(f"[WARN] {feed.name} 피드 기록 실패: {e}")
+            continue
+        merged = sorted(set(load_history(feed.name)) | set(times))
+        with open(history_path(feed.name), 'w', encoding='utf-8') as f:
+            json.dump({'feed': feed.name, 'published': merged}, f)
+        print(f"{feed.name}: 발행 시각 {len(merged)}개 기록 (이번에 {len(times)}개 확인)")
+
+
+def simulate_feed(history, interval, adaptive, window=FEED_WINDOW):
+    """
+    기록한 발행 시각으로 피드 확인을 흉내 내어 신선도와 요청 수를 계산하는 함수
+
+    각 확인 시점에는 그때까지 발행된 최신 window개 항목만 보인다고 가정하고,
+    확인 전에 window 밖으로 밀려난 기사는 놓친 기사로 센다.
+
+    Args:
+        history (list): 정렬된 발행 시각(epoch 초) 목록
+        interval (float): 고정 간격 또는 적응형의 시작 간격(초)
+        adaptive (bool): 적응형 모델 사용 여부
+
+    Returns:
+        dict: {'requests', 'found', 'missed', 'mean_delay', 'p95_delay'} (지연은 분 단위)
+    """
+    model = CadenceModel(interval, max_interval=max_interval_for(interval)) if adaptive else None
+    seen_until = 0
+    delays = []
+    missed = requests = 0
+    now, end = history[0], history[-1]
+    # 마지막 기사를 확인할 때까지 반복
+    while seen_until < end:
+        requests += 1
+        published = [t for t in history if t <= now]
+        visible = published[-window:]
+        new = [t for t in published if t > seen_until]
+        for t in new:
+            if t in visible:
+                delays.append(now - t)
+            else:
+                missed += 1
+        if published:
+            seen_until = published[-1]
+        now += model.observe(visible, now) if model else interval
+
+    delays.sort()
+    return {
+        'requests': requests,
+        'found': len(delays),
+        'missed': missed,
+        'mean_delay': sum(delays) / len(delays) / 60 if delays else 0.0,
+        'p95_delay': delays[int(len(delays) * 0.95)] / 60 if delays else 0.0,
+    }
+
+
+def simulate():
+    """기록이 있는 피드마다 고정 간격과 적응형 간격의 결과를 비교해 출력하는 함수"""
+    results = {}
+    for feed in feed_registry.feeds():
+        history = load_history(feed.name)
+        if len(history) < 2:
+            print(f"{feed.name}: 발행 기록이 부족합니다. 먼저 'python feed_cadence.py record'를 실행하세요.")
+            continue
+        results[feed.name] = {
+            policy: simulate_feed(history, feed.interval_seconds, policy == 'adaptive')
+            for policy in ('fixed', 'adaptive')
+        }
+        days = (history[-1] - history[0]) / 86400
+        print(f"\n{feed.name} (기사 {len(history)}개, {days:.1f}일)")
+        for policy, row in results[feed.name].items():
+            print(
+                f"- {policy:<8} 요청 {row['requests']:>5} | 발견 {row['found']:>4} | 놓침 {row['missed']:>3} | "
+                f"평균 지연 {row['mean_delay']:>6.1f}분 | p95 지연 {row['p95_delay']:>6.1f}분"
+            )
+    if results:
+        with open(SIMULATION_RESULTS, 'w', encoding='utf-8') as f:
+            json.dump(
+                {name: {policy: {key: round(value, 1) for key, value in row.items()} for policy, row in rows.items()}
+                 for name, rows in results.items()},
+                f, ensure_ascii=False, indent=2,
+            )
+    return results
+
+
+# 스케줄러와 크롤링 노드가 공유하는 발행 주기 저장소
+cadence_store = CadenceStore()
+
+
+if __name__ == "__main__":
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'simulate'
+    if mode == 'record':
+        record_histories()
+    elif mode == 'status':
+        cadence_store.report()
+    else:
+        simulate()
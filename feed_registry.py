@@ -0,0 +1,101 @@
+import json
+import threading
+
+# 피드 목록과 피드별 설정 파일
+FEEDS_PATH = 'feeds.json'
+
+# 설정 파일에서 생략한 항목의 기본값
+# interval_minutes: 피드를 다시 확인하는 간격, max_entries: 한 번에 처리할 최신 기사 수,
+# extractor: extractors.json의 추출 규칙 이름 (없으면 피드 이름),
+# category: WordPress 카테고리 slug (없으면 기사 내용으로 판단), priority: 같은 시각에 도래하면 작은 값부터 처리
+FEED_DEFAULTS = {
+    'interval_minutes': 60,
+    'max_entries': 3,
+    'extractor': None,
+    'category': None,
+    'priority': 5,
+    'enabled': True,
+}
+
+
+class Feed:
+    """피드 하나의 설정"""
+
+    def __init__(self, name, config):
+        settings = dict(FEED_DEFAULTS, **config)
+        if not settings.get('url'):
+            raise ValueError(f"피드 '{name}'에 url이 없습니다.")
+        self.name = name
+        self.url = settings['url']
+        self.interval_minutes = float(settings['interval_minutes'])
+        self.max_entries = int(settings['max_entries'])
+        self.extractor = settings['extractor'] or name
+        self.category = settings['category']
+        self.priority = int(settings['priority'])
+        self.enabled = bool(settings['enabled'])
+
+    @property
+    def interval_seconds(self):
+        return self.interval_minutes * 60
+
+    def __repr__(self):
+        return f"Feed({self.name!r}, every {self.interval_minutes:g}m)"
+
+
+class FeedRegistry:
+    """
+    feeds.json에서 피드 목록과 피드별 설정을 읽어 두는 저장소
+
+    새 피드는 설정 파일에 항목을 추가하면 되며, enabled가 false인 피드는 목록에서 제외한다.
+    """
+
+    def __init__(self, path=FEEDS_PATH):
+        self.path = path
+        self._feeds = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            configs = json.load(f)
+        return {name: Feed(name, config) for name, config in configs.items()}
+
+    def _all(self):
+        with self._lock:
+            if self._feeds is None:
+                self._feeds = self._load()
+            return self._feeds
+
+    def reload(self):
+        """설정 파일을 다시 읽는 함수 (실행 중에 피드를 추가/수정했을 때)"""
+        with self._lock:
+            self._feeds = self._load()
+
+    def feeds(self):
+        """사용 중인 피드 목록을 우선순위 순서로 반환하는 함수"""
+        return sorted((feed for feed in self._all().values() if feed.enabled), key=lambda feed: feed.priority)
+
+    def get(self, name):
+        """피드 이름에 해당하는 Feed를 반환하는 함수 (없으면 None)"""
+        return self._all().get(name)
+
+    def sources(self):
+        """피드 이름 -> RSS URL dict를 반환하는 함수 (예전 SOURCES와 같은 형태)"""
+        return {feed.name: feed.url for feed in self.feeds()}
+
+    def max_entries(self, name):
+        feed = self.get(name)
+        return feed.max_entries if feed else FEED_DEFAULTS['max_entries']
+
+    def extractor(self, name):
+        """피드에 사용할 추출 규칙 이름을 반환하는 함수 (설정이 없는 소스는 소스 이름)"""
+        feed = self.get(name)
+        return feed.extractor if feed else name
+
+    def category(self, name):
+        """피드에 고정된 WordPress 카테고리 slug를 반환하는 함수 (없으면 None)"""
+        feed = self.get(name)
+        return feed.category if feed else None
+
+
+# 스크래퍼 전체에서 공유하는 피드 설정 저장소
+feed_registry = FeedRegistry()
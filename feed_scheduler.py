@@ -0,0 +1,107 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+
+# 확인 간격에 더하는 무작위 편차 비율 (±10%) - 여러 피드가 같은 시각에 몰리지 않도록 분산
+FEED_JITTER = 0.1
+
+# 시작할 때 첫 확인 시각을 흩뜨리는 최대 범위(초) - 모든 피드를 한꺼번에 확인하지 않음
+INITIAL_SPREAD_SECONDS = 120
+
+
+def jittered(seconds, jitter=FEED_JITTER, rng=random):
+    """간격에 ±jitter 비율의 무작위 편차를 더한 값을 반환하는 함수"""
+    return seconds * (1 + rng.uniform(-jitter, jitter))
+
+
+class FeedScheduler:
+    """
+    피드마다 자기 간격으로 확인 시각을 정하는 스케줄러
+
+    다음 확인 시각이 가장 이른 피드부터 꺼내는 힙을 사용하므로 피드가 수백 개로 늘어나도
+    한 번에 도래한 피드만 처리한다. 같은 시각에 도래한 피드는 priority가 작은 것부터 꺼낸다.
+    """
+
+    def __init__(self, feeds, jitter=FEED_JITTER, initial_spread=INITIAL_SPREAD_SECONDS, clock=time.time, rng=None):
+        """
+        Args:
+            feeds (list): Feed 목록
+            jitter (float): 간격에 더할 무작위 편차 비율
+            initial_spread (float): 첫 확인 시각을 흩뜨리는 최대 범위(초)
+            clock (callable): 현재 시각(초)을 반환하는 함수
+            rng (random.Random): 편차 계산에 쓸 난수 생성기 (테스트/시뮬레이션용)
+        """
+        self.jitter = jitter
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self._heap = []
+        # 피드별 현재 유효한 확인 시각 (다시 등록하면 힙에 남은 예전 항목은 꺼낼 때 버림)
+        self._due = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        now = clock()
+        for feed in feeds:
+            self.schedule(feed, now + self.rng.uniform(0, min(initial_spread, feed.interval_seconds)))
+
+    def __len__(self):
+        return len(self._due)
+
+    def schedule(self, feed, due):
+        """피드의 다음 확인 시각을 등록하는 함수 (이미 등록된 피드면 확인 시각을 바꿈)"""
+        with self._lock:
+            self._due[feed.name] = due
+            heapq.heappush(self._heap, (due, feed.priority, next(self._counter), feed))
+
+    def _drop_stale(self):
+        # 다시 등록되어 더 이상 유효하지 않은 힙 항목을 버림 (잠금을 잡은 상태에서 호출)
+        while self._heap and self._due.get(self._heap[0][3].name) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def interval_for(self, feed):
+        """피드의 다음 확인까지의 간격(초)을 반환하는 함수"""
+        return jittered(feed.interval_seconds, self.jitter, self.rng)
+
+    def next_due(self):
+        """가장 이른 다음 확인 시각을 반환하는 함수 (등록된 피드가 없으면 None)"""
+        with self._lock:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now=None):
+        """
+        확인 시각이 된 피드를 꺼내고 다음 확인 시각을 다시 등록하는 함수
+
+        Returns:
+            list: 지금 확인할 Feed 목록 (도래 시각, 우선순위 순서)
+        """
+        now = self.clock() if now is None else now
+        due_feeds = []
+        with self._lock:
+            self._drop_stale()
+            while self._heap and self._heap[0][0] <= now:
+                due_feeds.append(heapq.heappop(self._heap)[3])
+                self._drop_stale()
+        for feed in due_feeds:
+            self.schedule(feed, now + self.interval_for(feed))
+        return due_feeds
+
+    def iter_due(self, stop_event=None):
+        """
+        피드를 확인할 시각이 될 때마다 하나씩 반환하는 제너레이터 (stop_event가 설정되면 종료)
+
+        파이프라인의 입력으로 넘기면 피드마다 자기 간격으로 계속 스크랩한다.
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            next_due = self.next_due()
+            if next_due is None:
+                return
+            wait = next_due - self.clock()
+            if wait > 0:
+                stop_event.wait(min(wait, 60))
+                continue
+            for feed in self.pop_due():
+                print(f"\n[스케줄] {feed.name} 피드 확인")
+                yield feed
@@ -0,0 +1,102 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from rate_limiter import rate_limiter
+
+
+def get_host(url):
+    """URL에서 호스트명을 추출하는 함수 (www. 접두어 제거)"""
+    host = urlparse(url).netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return host
+
+
+class HostPoliteness:
+    """
+    호스트별 예의(politeness) 제한을 관리하는 클래스
+
+    전역 sleep 대신 같은 호스트로 가는 요청만 동시 요청 수와 호스트별 토큰 버킷으로 제한한다.
+    서로 다른 호스트로 가는 요청은 서로를 기다리지 않는다.
+    """
+
+    def __init__(self, max_concurrent_per_host=2, limiter=None):
+        """
+        Args:
+            max_concurrent_per_host (int): 호스트당 동시에 진행할 수 있는 최대 요청 수
+            limiter (RateLimiter): 호스트별 토큰 버킷 (없으면 공유 속도 제한기 사용)
+        """
+        self.max_concurrent_per_host = max_concurrent_per_host
+        self.limiter = limiter or rate_limiter
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def _semaphore(self, host):
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.max_concurrent_per_host)
+            return self._semaphores[host]
+
+    @contextmanager
+    def slot(self, url):
+        """해당 URL의 호스트에 요청을 보낼 수 있을 때까지 대기하는 컨텍스트 매니저"""
+        host = get_host(url)
+        semaphore = self._semaphore(host)
+        with semaphore:
+            self.limiter.acquire(host)
+            yield host
+
+
+class FetchEngine:
+    """
+    제한된 스레드 풀에서 기사 페이지를 병렬로 가져오는 엔진
+
+    호스트별 제한은 HostPoliteness가 담당하고, 스레드 풀은 전체 동시 작업 수만 제한한다.
+    """
+
+    def __init__(self, max_workers=8, politeness=None):
+        """
+        Args:
+            max_workers (int): 전체 동시 작업 스레드 수
+            politeness (HostPoliteness): 호스트별 제한 (없으면 기본값 사용)
+        """
+        self.politeness = politeness or HostPoliteness()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fetch')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+    def submit(self, url, func, *args, **kwargs):
+        """
+        url의 호스트 제한을 지키면서 func를 실행하도록 예약하는 함수
+
+        Returns:
+            concurrent.futures.Future: func의 결과
+        """
+        def run():
+            with self.politeness.slot(url):
+                return func(*args, **kwargs)
+        return self._executor.submit(run)
+
+    def map(self, tasks):
+        """
+        (url, func, args) 작업 목록을 병렬로 실행하고 입력 순서대로 결과를 반환하는 함수
+
+        실패한 작업의 결과는 None으로 채운다.
+        """
+        futures = [self.submit(url, func, *args) for url, func, args in tasks]
+        results = []
+        for (url, _, _), future in zip(tasks, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"작업 실행 실패 ({url}): {e}")
+                results.append(None)
+        return results
@@ -0,0 +1,73 @@
+import threading
+import time
+from http_client import http_client
+
+
+class GeneratedImage:
+    """
+    이미지 생성 결과 한 건
+
+    DALL-E 호출 한 번의 결과(URL, 프롬프트, 소요 시간)를 담고, 이미지 바이트는 처음 필요할 때
+    한 번만 다운로드한다. 업로드와 URL 대체 사용이 모두 같은 이미지를 가리킨다.
+    """
+
+    def __init__(self, url, prompt, model, generation_seconds):
+        """
+        Args:
+            url (str): 생성된 이미지 URL (OpenAI가 일정 시간 동안만 제공)
+            prompt (str): 이미지 생성에 사용한 프롬프트
+            model (str): 이미지 생성 모델 이름
+            generation_seconds (float): 이미지 생성 API 호출 소요 시간(초)
+        """
+        self.url = url
+        self.prompt = prompt
+        self.model = model
+        self.generation_seconds = generation_seconds
+        self.download_seconds = None
+        self._content = None
+        self._downloaded = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def restore(cls, url, content):
+        """저장해 둔 이미지(URL과 바이트)로 결과를 다시 만드는 함수 (다시 다운로드하지 않음)"""
+        image = cls(url, None, None, 0.0)
+        image._content = content
+        image._downloaded = content is not None
+        return image
+
+    @property
+    def content(self):
+        """이미지 바이트 (처음 접근할 때 다운로드, 실패하면 None)"""
+        with self._lock:
+            if not self._downloaded:
+                self._content = self._download()
+                self._downloaded = True
+            return self._content
+
+    def _download(self):
+        started = time.monotonic()
+        try:
+            response = http_client.get(self.url, timeout=60)
+            if response.status_code == 200:
+                return response.content
+            print(f"이미지 다운로드 실패: {response.status_code}")
+            return None
+        except Exception as e:
+            print(f"이미지 다운로드 중 오류 발생: {e}")
+            return None
+        finally:
+            self.download_seconds = time.monotonic() - started
+
+    def release(self):
+        """다운로드한 이미지 바이트를 메모리에서 해제하는 함수 (URL과 통계는 유지)"""
+        with self._lock:
+            self._content = None
+
+    @property
+    def timings(self):
+        """단계별 소요 시간(초)"""
+        return {
+            'generation_seconds': round(self.generation_seconds, 2),
+            'download_seconds': round(self.download_seconds, 2) if self.download_seconds is not None else None,
+        }
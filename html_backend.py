@@ -0,0 +1,260 @@
+import codecs
+import os
+import re
+
+# 선택 의존성: 설치된 파서 중 가장 빠른 것을 사용
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        # lexbor가 없는 예전 버전
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+try:
+    from bs4 import BeautifulSoup, Tag
+except ImportError:
+    BeautifulSoup = Tag = None
+
+# 사용할 HTML 파서 (auto, selectolax, lxml, bs4)
+HTML_BACKEND = os.getenv('HTML_BACKEND', 'auto')
+
+# auto일 때 시도하는 순서 (빠른 순)
+BACKEND_PRIORITY = ('selectolax', 'lxml', 'bs4')
+
+_CHARSET_RE = re.compile(rb'charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def detect_encoding(raw, content_type=None):
+    """
+    HTML 바이트의 인코딩을 BOM, Content-Type 헤더, <meta charset> 순으로 찾는 함수 (없으면 utf-8)
+    """
+    for bom, encoding in _BOMS:
+        if raw.startswith(bom):
+            return encoding
+    for source in ((content_type or '').encode('latin-1', 'ignore'), raw[:2048]):
+        match = _CHARSET_RE.search(source)
+        if match:
+            encoding = match.group(1).decode('ascii', 'ignore')
+            try:
+                return codecs.lookup(encoding).name
+            except LookupError:
+                continue
+    return 'utf-8'
+
+
+def decode_html(html, content_type=None):
+    """HTML 바이트를 찾은 인코딩으로 한 번에 디코딩하는 함수 (이미 문자열이면 그대로 반환)"""
+    if isinstance(html, str):
+        return html
+    return html.decode(detect_encoding(html, content_type), errors='replace')
+
+
+class BS4Node:
+    """BeautifulSoup 요소 어댑터"""
+
+    __slots__ = ('_tag',)
+
+    def __init__(self, tag):
+        self._tag = tag
+
+    @property
+    def name(self):
+        return self._tag.name
+
+    def get(self, attr):
+        return self._tag.get(attr)
+
+    @property
+    def parent(self):
+        parent = self._tag.parent
+        if parent is None or parent.name == '[document]':
+            return None
+        return BS4Node(parent)
+
+    @property
+    def children(self):
+        return (BS4Node(child) for child in self._tag.children if isinstance(child, Tag))
+
+    def text(self):
+        return self._tag.get_text().strip()
+
+    def find(self, name):
+        tag = self._tag.find(name)
+        return BS4Node(tag) if tag else None
+
+    def find_all(self, name):
+        return [BS4Node(tag) for tag in self._tag.find_all(name)]
+
+
+class LxmlNode:
+    """lxml.html 요소 어댑터"""
+
+    __slots__ = ('_element',)
+
+    def __init__(self, element):
+        self._element = element
+
+    @property
+    def name(self):
+        return self._element.tag
+
+    def get(self, attr):
+        value = self._element.get(attr)
+        if attr == 'class' and value is not None:
+            return value.split()
+        return value
+
+    @property
+    def parent(self):
+        parent = self._element.getparent()
+        return LxmlNode(parent) if parent is not None else None
+
+    @property
+    def children(self):
+        # 주석, 처리 명령은 tag가 문자열이 아님
+        return (LxmlNode(child) for child in self._element if isinstance(child.tag, str))
+
+    def text(self):
+        return self._element.text_content().strip()
+
+    def find(self, name):
+        element = next((e for e in self._element.iter(name) if e is not self._element), None)
+        return LxmlNode(element) if element is not None else None
+
+    def find_all(self, name):
+        return [LxmlNode(element) for element in self._element.iter(name) if element is not self._element]
+
+
+class LxmlDocument(LxmlNode):
+    """lxml 문서 루트 (자식은 <html> 요소 하나)"""
+
+    __slots__ = ()
+
+    @property
+    def name(self):
+        return '[document]'
+
+    @property
+    def children(self):
+        return iter([LxmlNode(self._element)])
+
+    def find(self, name):
+        element = next(self._element.iter(name), None)
+        return LxmlNode(element) if element is not None else None
+
+    def find_all(self, name):
+        return [LxmlNode(element) for element in self._element.iter(name)]
+
+
+def _is_selectolax_element(node):
+    # 문서, 주석 등 특수 노드는 tag가 '-', '#', '!', '_'로 시작
+    return bool(node.tag) and node.tag[0] not in '-#!_'
+
+
+class SelectolaxNode:
+    """selectolax 요소 어댑터"""
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def name(self):
+        return self._node.tag
+
+    def get(self, attr):
+        value = self._node.attributes.get(attr)
+        if attr == 'class' and value is not None:
+            return value.split()
+        return value
+
+    @property
+    def parent(self):
+        parent = self._node.parent
+        if parent is None or not _is_selectolax_element(parent):
+            return None
+        return SelectolaxNode(parent)
+
+    @property
+    def children(self):
+        return (SelectolaxNode(child) for child in self._node.iter(include_text=False) if _is_selectolax_element(child))
+
+    def text(self):
+        return self._node.text(deep=True).strip()
+
+    def find(self, name):
+        node = self._node.css_first(name)
+        return SelectolaxNode(node) if node is not None else None
+
+    def find_all(self, name):
+        return [SelectolaxNode(node) for node in self._node.css(name)]
+
+
+class SelectolaxDocument(SelectolaxNode):
+    """selectolax 문서 루트 (자식은 <html> 요소 하나)"""
+
+    __slots__ = ()
+
+    @property
+    def name(self):
+        return '[document]'
+
+    @property
+    def children(self):
+        return iter([SelectolaxNode(self._node)])
+
+
+def available_backends():
+    """설치되어 사용할 수 있는 파서 이름 목록 (빠른 순)"""
+    installed = {'selectolax': SelectolaxParser, 'lxml': lxml_html, 'bs4': BeautifulSoup}
+    return [name for name in BACKEND_PRIORITY if installed[name] is not None]
+
+
+def resolve_backend(backend=None):
+    """설정한 파서 이름을 실제 사용할 파서 이름으로 바꾸는 함수"""
+    backend = backend or HTML_BACKEND
+    available = available_backends()
+    if not available:
+        raise ImportError("HTML 파서가 없습니다. selectolax, lxml, beautifulsoup4 중 하나를 설치하세요.")
+    if backend == 'auto':
+        return available[0]
+    if backend not in available:
+        print(f"[WARN] HTML 파서 '{backend}'를 사용할 수 없어 '{available[0]}'를 사용합니다.")
+        return available[0]
+    return backend
+
+
+def parse_html(html, content_type=None, backend=None):
+    """
+    HTML을 파싱해 문서 노드를 반환하는 함수
+
+    바이트는 찾은 인코딩으로 한 번만 디코딩한다. 반환하는 노드는 파서와 관계없이
+    name, get(), parent, children, text(), find(), find_all()을 제공한다.
+
+    Args:
+        html (bytes | str): 페이지 HTML
+        content_type (str): 응답의 Content-Type 헤더 (charset 확인용)
+        backend (str): selectolax, lxml, bs4, auto (생략하면 HTML_BACKEND)
+    """
+    text = decode_html(html, content_type)
+    backend = resolve_backend(backend)
+    if backend == 'selectolax':
+        return SelectolaxDocument(SelectolaxParser(text or '<html></html>').root)
+    if backend == 'lxml':
+        # lxml은 인코딩 선언이 있는 문자열을 받지 않으므로 디코딩한 뒤 선언을 제거
+        return LxmlDocument(lxml_html.document_fromstring(_XML_DECLARATION_RE.sub('', text) or '<html></html>'))
+    return BS4Node(BeautifulSoup(text, 'html.parser'))
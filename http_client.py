@@ -0,0 +1,130 @@
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+from fetch_engine import get_host
+from rate_limiter import rate_limiter
+
+# .env 파일 로드
+load_dotenv()
+
+# 모든 요청에 기본으로 붙는 헤더
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class HttpClient:
+    """
+    호스트별 커넥션 풀을 공유하는 HTTP 클라이언트
+
+    호스트마다 keep-alive 세션을 하나씩 만들어 재사용하므로 요청마다 TCP/TLS 연결을 새로 열지 않는다.
+    호스트별로 기본 헤더, 인증 정보, 타임아웃, 속도 제한 버킷을 지정할 수 있다.
+    """
+
+    def __init__(self, timeout=15, retries=3, backoff_factor=0.5, pool_maxsize=10, headers=None):
+        """
+        Args:
+            timeout (float): 기본 요청 타임아웃(초)
+            retries (int): 연결 오류와 RETRY_STATUS_CODES 응답에 대한 최대 재시도 횟수
+            backoff_factor (float): 재시도 간 지수 백오프 계수
+            pool_maxsize (int): 호스트당 유지할 최대 연결 수
+            headers (dict): 모든 요청에 붙일 기본 헤더
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.pool_maxsize = pool_maxsize
+        self.headers = dict(headers or DEFAULT_HEADERS)
+        self._host_config = {}
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def configure_host(self, host_or_url, headers=None, auth=None, timeout=None, rate_key=None):
+        """
+        호스트별 기본 설정을 등록하는 함수
+
+        Args:
+            host_or_url (str): 호스트명 또는 해당 호스트의 URL
+            headers (dict): 이 호스트에만 추가로 붙일 헤더
+            auth (tuple): (사용자, 비밀번호) 기본 인증 정보
+            timeout (float): 이 호스트의 기본 타임아웃(초)
+            rate_key (str): 요청 전에 토큰을 얻을 속도 제한 버킷 이름
+        """
+        host = get_host(host_or_url) if '://' in host_or_url else host_or_url
+        with self._lock:
+            self._host_config[host] = {
+                'headers': headers or {},
+                'auth': auth,
+                'timeout': timeout,
+                'rate_key': rate_key,
+            }
+            # 이미 만든 세션이 있으면 새 설정으로 다시 생성
+            session = self._sessions.pop(host, None)
+        if session:
+            session.close()
+
+    def _build_session(self, host):
+        config = self._host_config.get(host, {})
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(self.headers)
+        session.headers.update(config.get('headers') or {})
+        if config.get('auth'):
+            session.auth = config['auth']
+        return session
+
+    def session(self, url):
+        """URL의 호스트에 해당하는 keep-alive 세션을 반환하는 함수"""
+        host = get_host(url)
+        with self._lock:
+            if host not in self._sessions:
+                self._sessions[host] = self._build_session(host)
+            return self._sessions[host]
+
+    def request(self, method, url, **kwargs):
+        """
+        공유 세션으로 요청을 보내는 함수
+
+        kwargs는 requests.Session.request와 같다. timeout을 생략하면 호스트 또는 클라이언트 기본값을 사용한다.
+        """
+        config = self._host_config.get(get_host(url), {})
+        kwargs.setdefault('timeout', config.get('timeout') or self.timeout)
+        if config.get('rate_key'):
+            rate_limiter.acquire(config['rate_key'])
+        return self.session(url).request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        """모든 세션의 연결을 닫는 함수"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+# 파이프라인 전체에서 공유하는 HTTP 클라이언트
+http_client = HttpClient(
+    timeout=float(os.getenv('HTTP_TIMEOUT', '15')),
+    retries=int(os.getenv('HTTP_RETRIES', '3')),
+)
@@ -0,0 +1,300 @@
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from seen_store import normalize_url
+
+# 기사별 처리 상태를 저장할 SQLite 파일
+JOB_DB_PATH = 'jobs.db'
+
+# 생성한 대표 이미지를 업로드 전까지 보관하는 디렉터리 (재시작 시 이미지를 다시 만들지 않음)
+JOB_IMAGE_DIR = 'job_images'
+
+# 기사 처리 단계 (앞 단계가 끝나야 다음 단계로 넘어감)
+JOB_STATES = ('scraped', 'translated', 'image_ready', 'media_uploaded', 'posted')
+
+# 더 이상 처리하지 않는 상태 (skipped: 번역할 가치가 없는 기사, failed: 재시도 횟수 초과)
+FINAL_STATES = ('posted', 'skipped', 'failed')
+
+# 작업을 빌린 작업자가 이 시간(초) 안에 진행하지 않으면 다른 작업자가 가져갈 수 있음
+LEASE_SECONDS = 900
+
+# 실패한 작업의 최대 시도 횟수와 재시도 전 대기 시간(초, 시도 횟수만큼 늘어남)
+MAX_ATTEMPTS = 3
+RETRY_DELAY_SECONDS = 300
+
+# 이 프로세스의 작업자 이름 (작업 임대 소유자로 기록)
+JOB_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaseLostError(RuntimeError):
+    """작업 임대가 만료되어 다른 작업자가 가져간 작업을 기록하려 할 때 발생하는 예외"""
+
+
+class Job:
+    """
+    기사 한 건의 처리 상태
+
+    article은 스크랩한 기사 dict, data는 단계별 결과(title, lead, content, tags, image_url, image_path,
+    featured_media_id, post_id, post_link)를 담는다.
+    """
+
+    def __init__(self, job_id, state, article, data, attempts, owner):
+        self.id = job_id
+        self.state = state
+        self.article = article
+        self.data = data
+        self.attempts = attempts
+        self.owner = owner
+        # 실행 중에만 쓰는 값 (미리 시작한 이미지 생성 등, 저장하지 않음)
+        self.runtime = {}
+
+    def __getitem__(self, key):
+        return self.data.get(key)
+
+    def __repr__(self):
+        return f"Job({self.article.get('title')!r}, state={self.state})"
+
+
+class JobStore:
+    """
+    기사별 처리 단계를 기록하는 SQLite 기반 작업 저장소
+
+    각 단계가 끝날 때마다 결과와 상태를 저장하므로, 중간에 실패해도 다음 실행은 기사별로
+    마지막으로 끝난 단계 다음부터 이어서 처리한다 (이미 포스팅한 기사는 다시 포스팅하지 않음).
+    작업은 만료 시간이 있는 임대(lease)로 빌려주므로 여러 프로세스가 같은 저장소를 나눠 처리할 수 있고,
+    작업자가 죽으면 임대가 만료된 뒤 다른 작업자가 이어받는다.
+    """
+
+    def __init__(self, path=JOB_DB_PATH, image_dir=JOB_IMAGE_DIR, lease_seconds=LEASE_SECONDS):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            image_dir (str): 업로드 전 이미지 보관 디렉터리
+            lease_seconds (float): 작업 임대 시간(초)
+        """
+        self.path = path
+        self.image_dir = image_dir
+        self.lease_seconds = lease_seconds
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self):
+        # sqlite3 연결은 스레드 간에 공유할 수 없으므로 스레드마다 따로 연결
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        with self._init_lock:
+            if not self._initialized:
+                conn.executescript('''
+                    CREATE TABLE IF NOT EXISTS jobs (
+                        job_id TEXT PRIMARY KEY,
+                        state TEXT NOT NULL,
+                        article TEXT NOT NULL,
+                        data TEXT NOT NULL DEFAULT '{}',
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        last_error TEXT,
+                        lease_owner TEXT,
+                        lease_expires REAL,
+                        created_at REAL NOT NULL,
+                        updated_at REAL NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs(state, lease_expires);
+                ''')
+                self._initialized = True
+        return conn
+
+    def _transaction(self, func):
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            result = func(conn)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return result
+
+    @staticmethod
+    def _job(row):
+        job_id, state, article, data, attempts, owner = row
+        return Job(job_id, state, json.loads(article), json.loads(data), attempts, owner)
+
+    def enqueue(self, article, owner=None):
+        """
+        스크랩한 기사를 작업으로 등록하는 함수
+
+        Args:
+            article (dict): 기사 정보 (link 필수)
+            owner (str): 주어지면 새로 등록한 작업을 바로 이 작업자에게 임대
+
+        Returns:
+            Job: 새로 등록한 작업 (이미 등록된 기사면 None)
+        """
+        job_id = normalize_url(article['link'])
+        now = time.time()
+        lease_expires = now + self.lease_seconds if owner else None
+
+        def insert(conn):
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO jobs (job_id, state, article, lease_owner, lease_expires, created_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (job_id, JOB_STATES[0], json.dumps(article, ensure_ascii=False), owner, lease_expires, now, now),
+            )
+            return cursor.rowcount == 1
+
+        if not self._transaction(insert):
+            return None
+        return Job(job_id, JOB_STATES[0], article, {}, 0, owner)
+
+    def lease(self, owner, limit=1):
+        """
+        처리할 수 있는 미완료 작업을 작업자에게 임대하는 함수 (먼저 등록한 작업부터)
+
+        Returns:
+            list: 임대한 Job 목록 (없으면 빈 목록)
+        """
+        now = time.time()
+        placeholders = ', '.join('?' for _ in FINAL_STATES)
+
+        def take(conn):
+            rows = conn.execute(
+                f'SELECT job_id, state, article, data, attempts, lease_owner FROM jobs '
+                f'WHERE state NOT IN ({placeholders}) AND (lease_expires IS NULL OR lease_expires < ?) '
+                f'ORDER BY created_at LIMIT ?',
+                (*FINAL_STATES, now, limit),
+            ).fetchall()
+            conn.executemany(
+                'UPDATE jobs SET lease_owner = ?, lease_expires = ? WHERE job_id = ?',
+                [(owner, now + self.lease_seconds, row[0]) for row in rows],
+            )
+            return rows
+
+        jobs = [self._job(row) for row in self._transaction(take)]
+        for job in jobs:
+            job.owner = owner
+        return jobs
+
+    def iter_leased(self, owner):
+        """미완료 작업을 하나씩 임대해 반환하는 제너레이터 (소비하는 속도에 맞춰 임대)"""
+        while True:
+            jobs = self.lease(owner)
+            if not jobs:
+                return
+            yield jobs[0]
+
+    def _update(self, job, sets, params):
+        def update(conn):
+            cursor = conn.execute(
+                f'UPDATE jobs SET {sets}, updated_at = ? WHERE job_id = ? AND lease_owner = ?',
+                (*params, time.time(), job.id, job.owner),
+            )
+            if cursor.rowcount != 1:
+                raise LeaseLostError(f"작업 임대가 만료되었습니다: {job.id}")
+
+        self._transaction(update)
+
+    def advance(self, job, state, **data):
+        """
+        작업의 단계 결과를 저장하고 다음 상태로 옮기는 함수 (임대 시간도 연장)
+
+        Raises:
+            LeaseLostError: 임대가 만료되어 다른 작업자가 가져간 경우
+        """
+        merged = dict(job.data, **data)
+        self._update(
+            job,
+            'state = ?, data = ?, last_error = NULL, lease_expires = ?',
+            (state, json.dumps(merged, ensure_ascii=False), time.time() + self.lease_seconds),
+        )
+        job.state, job.data = state, merged
+
+    def update(self, job, **data):
+        """
+        상태는 그대로 두고 단계 결과만 저장하는 함수 (임대 시간도 연장)
+
+        Raises:
+            LeaseLostError: 임대가 만료되어 다른 작업자가 가져간 경우
+        """
+        self.advance(job, job.state, **data)
+
+    def skip(self, job, reason):
+        """처리할 가치가 없는 작업을 더 이상 시도하지 않도록 기록하는 함수"""
+        self._update(job, "state = 'skipped', last_error = ?, lease_owner = NULL, lease_expires = NULL", (reason,))
+        job.state = 'skipped'
+
+    def fail(self, job, error):
+        """
+        작업 실패를 기록하고 임대를 반납하는 함수
+
+        시도 횟수가 MAX_ATTEMPTS에 도달하면 failed 상태로 멈추고, 아니면 대기 시간이 지난 뒤 다시 임대할 수 있다.
+        """
+        attempts = job.attempts + 1
+        if attempts >= MAX_ATTEMPTS:
+            self._update(
+                job, "state = 'failed', attempts = ?, last_error = ?, lease_owner = NULL, lease_expires = NULL",
+                (attempts, str(error)),
+            )
+            job.state = 'failed'
+            print(f"[WARN] 작업을 {attempts}회 시도했지만 실패해 중단합니다: {job.article.get('title')} ({error})")
+        else:
+            # 대기 시간이 지날 때까지는 임대할 수 없도록 만료 시간을 미래로 설정
+            self._update(
+                job, 'attempts = ?, last_error = ?, lease_owner = NULL, lease_expires = ?',
+                (attempts, str(error), time.time() + RETRY_DELAY_SECONDS * attempts),
+            )
+        job.attempts = attempts
+
+    def image_path(self, job):
+        """작업의 대표 이미지를 보관할 파일 경로를 반환하는 함수"""
+        digest = hashlib.sha1(job.id.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.image_dir, f"{digest}.img")
+
+    def save_image(self, job, content):
+        """대표 이미지 바이트를 파일로 저장하고 경로를 반환하는 함수 (임시 파일에 쓴 뒤 교체)"""
+        path = self.image_path(job)
+        os.makedirs(self.image_dir, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        return path
+
+    def load_image(self, job):
+        """저장해 둔 대표 이미지 바이트를 반환하는 함수 (없으면 None)"""
+        path = job['image_path']
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def remove_image(self, job):
+        path = job['image_path']
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    def counts(self):
+        """상태별 작업 수를 dict로 반환하는 함수"""
+        rows = self._connect().execute('SELECT state, COUNT(*) FROM jobs GROUP BY state').fetchall()
+        return dict(rows)
+
+    def unfinished_count(self):
+        return sum(count for state, count in self.counts().items() if state not in FINAL_STATES)
+
+    def report(self):
+        """상태별 작업 수를 출력하는 함수"""
+        counts = self.counts()
+        summary = ', '.join(f"{state} {counts.get(state, 0)}" for state in JOB_STATES + FINAL_STATES[1:])
+        print(f"작업 상태: {summary}")
+
+
+# 파이프라인 전체에서 공유하는 작업 저장소
+job_store = JobStore()
@@ -0,0 +1,251 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from rate_limiter import rate_limiter
+from prompt_registry import build_messages, prompt_usage
+
+# LLM 응답 캐시를 저장할 SQLite 파일
+LLM_CACHE_PATH = 'llm_cache.db'
+
+# 캐시 최대 항목 수와 최대 보관 기간(일)
+LLM_CACHE_MAX_ENTRIES = 5000
+LLM_CACHE_MAX_AGE_DAYS = 30
+
+
+def normalize_text(text):
+    """줄바꿈, 줄 끝 공백, 연속 빈 줄, 유니코드 정규화 차이를 없앤 텍스트를 반환하는 함수"""
+    text = unicodedata.normalize('NFC', text or '')
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = '\n'.join(line.rstrip() for line in text.split('\n'))
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+def make_cache_key(model, system_prompt, temperature, user_content, **extra):
+    """
+    (모델, 시스템 프롬프트, temperature, 정규화한 기사 텍스트, 기타 요청 옵션)의 해시를 반환하는 함수
+    """
+    payload = {
+        'model': model,
+        'system_prompt': hashlib.sha256((system_prompt or '').encode('utf-8')).hexdigest(),
+        'temperature': temperature,
+        'user_content': normalize_text(user_content),
+        'extra': extra,
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class LLMCache:
+    """
+    내용 주소 기반(content-addressed) LLM 응답 캐시
+
+    같은 요청(모델, 프롬프트, temperature, 기사 텍스트)은 같은 키가 되므로, 재실행 시 API를 다시 호출하지 않는다.
+    항목 수와 보관 기간을 넘으면 오래 사용하지 않은 항목부터 삭제한다.
+    """
+
+    def __init__(self, path=LLM_CACHE_PATH, max_entries=LLM_CACHE_MAX_ENTRIES, max_age_days=LLM_CACHE_MAX_AGE_DAYS):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            max_entries (int): 최대 항목 수
+            max_age_days (float): 최대 보관 기간(일)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses(accessed_at)')
+            self._local.conn = conn
+        return conn
+
+    def _count(self, hit):
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key):
+        """캐시된 응답을 반환하는 함수 (없거나 만료되었으면 None)"""
+        conn = self._connect()
+        row = conn.execute('SELECT response, created_at FROM responses WHERE key = ?', (key,)).fetchone()
+        if row and time.time() - row[1] <= self.max_age_days * 86400:
+            conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+            self._count(True)
+            return row[0]
+        self._count(False)
+        return None
+
+    def contains(self, key):
+        """유효한 캐시 항목이 있는지 확인하는 함수 (적중률 통계에는 포함하지 않음)"""
+        row = self._connect().execute('SELECT created_at FROM responses WHERE key = ?', (key,)).fetchone()
+        return bool(row) and time.time() - row[0] <= self.max_age_days * 86400
+
+    def put(self, key, response, model=None):
+        """응답을 저장하고 오래된 항목을 정리하는 함수"""
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+            (key, model, response, now, now),
+        )
+        self.evict()
+
+    def evict(self):
+        """보관 기간이 지난 항목과 최대 항목 수를 넘는 오래된 항목을 삭제하는 함수"""
+        conn = self._connect()
+        conn.execute('DELETE FROM responses WHERE created_at < ?', (time.time() - self.max_age_days * 86400,))
+        conn.execute('''
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+        ''', (self.max_entries,))
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def report(self):
+        """이번 실행의 캐시 적중률을 출력하는 함수"""
+        total = self.hits + self.misses
+        print(f"LLM 캐시 적중: {self.hits}/{total} ({self.hit_rate() * 100:.1f}%)")
+
+
+# 모든 진입점(main.py, translationTest.py, ConinCrawling.py)에서 공유하는 LLM 응답 캐시
+llm_cache = LLMCache()
+
+
+def is_complete_response(response, finish_reason):
+    """
+    응답을 캐시해도 되는지 확인하는 함수
+
+    max_tokens에 걸려 잘린 응답(finish_reason == 'length') 등을 캐시하면 다시 실행할 때마다 같은
+    잘못된 응답이 재사용되므로, 끝까지 생성된(finish_reason == 'stop') 응답만 캐시한다.
+    """
+    if not response:
+        return False
+    if finish_reason != 'stop':
+        print(f"[WARN] 응답이 끝까지 생성되지 않아 캐시하지 않습니다 (finish_reason: {finish_reason})")
+        return False
+    return True
+
+
+def cached_chat_completion(client, model, system_prompt, user_content, temperature=None, cache=None, **kwargs):
+    """
+    캐시를 거쳐 chat completion을 요청하고 응답 텍스트를 반환하는 함수
+
+    Args:
+        client (OpenAI): OpenAI 클라이언트
+        model (str): 모델 이름
+        system_prompt (str): 시스템 프롬프트
+        user_content (str): 사용자 메시지 (기사 본문)
+        temperature (float): 생략하면 API 기본값 사용
+        cache (LLMCache): 사용할 캐시 (없으면 공유 캐시)
+        kwargs: chat.completions.create에 그대로 전달할 추가 옵션 (캐시 키에도 포함)
+
+    Returns:
+        str: 모델 응답 텍스트
+    """
+    cache = cache or llm_cache
+    key = make_cache_key(model, system_prompt, temperature, user_content, **kwargs)
+    cached = cache.get(key)
+    if cached is not None:
+        print("LLM 캐시 적중 - API 호출을 건너뜁니다.")
+        return cached
+
+    request = {
+        'model': model,
+        'messages': build_messages(system_prompt, user_content),
+    }
+    if temperature is not None:
+        request['temperature'] = temperature
+    request.update(kwargs)
+
+    rate_limiter.acquire('openai.chat')
+    completion = client.chat.completions.create(**request)
+    prompt_usage.record(completion.usage)
+    choice = completion.choices[0]
+    response = choice.message.content
+
+    if is_complete_response(response, choice.finish_reason):
+        cache.put(key, response, model)
+    return response
+
+
+def streamed_chat_completion(client, model, system_prompt, user_content, on_delta, temperature=None,
+                             cache=None, **kwargs):
+    """
+    캐시를 거쳐 chat completion을 스트리밍으로 요청하고, 도착하는 응답 조각마다 on_delta를 호출하는 함수
+
+    캐시 키는 cached_chat_completion과 같으므로 두 경로가 같은 캐시 항목을 공유한다.
+    캐시에 적중하면 전체 응답을 한 번에 on_delta로 전달한다.
+
+    Args:
+        on_delta (callable): 응답 텍스트 조각을 받을 함수
+        나머지는 cached_chat_completion과 같음
+
+    Returns:
+        str: 전체 응답 텍스트
+    """
+    cache = cache or llm_cache
+    key = make_cache_key(model, system_prompt, temperature, user_content, **kwargs)
+    cached = cache.get(key)
+    if cached is not None:
+        print("LLM 캐시 적중 - API 호출을 건너뜁니다.")
+        on_delta(cached)
+        return cached
+
+    request = {
+        'model': model,
+        'messages': build_messages(system_prompt, user_content),
+        'stream': True,
+        'stream_options': {'include_usage': True},
+    }
+    if temperature is not None:
+        request['temperature'] = temperature
+    request.update(kwargs)
+
+    rate_limiter.acquire('openai.chat')
+    parts = []
+    finish_reason = None
+    for event in client.chat.completions.create(**request):
+        # 마지막 이벤트에는 choices 없이 usage만 들어 있음
+        if event.usage:
+            prompt_usage.record(event.usage)
+        if not event.choices:
+            continue
+        choice = event.choices[0]
+        finish_reason = choice.finish_reason or finish_reason
+        delta = choice.delta.content
+        if delta:
+            parts.append(delta)
+            on_delta(delta)
+    response = ''.join(parts)
+
+    if is_complete_response(response, finish_reason):
+        cache.put(key, response, model)
+    return response
@@ -1,15 +1,39 @@
 import os
+import argparse
+import functools
 from datetime import datetime
 from dotenv import load_dotenv
-from rss_scraper import scrape_all_sources
+from feed_registry import feed_registry
+from feed_scheduler import FeedScheduler
+from feed_cadence import AdaptiveFeedScheduler
+from rss_scraper import SOURCES, get_new_entries, fetch_article_page, build_article, scrape_all_sources
 from openai import OpenAI
-import requests
-import time
 import json
-import re
+from concurrent.futures import ThreadPoolExecutor
+import time
 import base64
 from io import BytesIO
 from PIL import Image
+from rate_limiter import rate_limiter
+from http_client import http_client
+from article_store import article_store, format_for_translation, import_legacy_news_file
+from fetch_engine import HostPoliteness
+from extractor_registry import extractor_registry
+from pipeline import Pipeline, Stage
+from generated_image import GeneratedImage
+from job_store import job_store, JOB_WORKER_ID, LeaseLostError
+from process_pool import process_pool, WORKER_PROCESSES
+from seo import optimize_content_structure, score_article
+from llm_cache import cached_chat_completion, streamed_chat_completion, llm_cache
+from batch_translation import OpenAIBatchBackend, InlineBatchBackend, prefill_translations
+from async_openai import AsyncRunnerThread
+from prompt_registry import prompt_registry, prompt_usage
+from token_budget import prepare_translation_input, merge_translations, continuation_prompt
+from streaming_json import IncrementalJSONParser
+from translation_schema import (
+    TRANSLATION_RESPONSE_FORMAT, CONTINUATION_RESPONSE_FORMAT, TranslationParseError,
+    parse_translation_or_repair, parse_continuation
+)
 
 # .env 파일 로드
 load_dotenv()
@@ -24,184 +48,67 @@ wp_category_education_id = os.getenv('WP_CATEGORY_EDUCATION_ID')
 
 category_id_cache = {}
 
-# OpenAI 클라이언트 초기화
-client = OpenAI(api_key=openai_api_key)
-
-def validate_environment():
-    """환경 변수 검증"""
-    if not openai_api_key:
-        raise ValueError("OPENAI_API_KEY가 .env 파일에 설정되어 있지 않습니다.")
-    if not all([wp_url, wp_user, wp_pass]):
-        raise ValueError("WordPress 인증 정보가 .env 파일에 설정되어 있지 않습니다.")
-
-def validate_seo_optimization(title, lead, content):
-    """SEO 최적화 점수 계산"""
-    score = 0
-    
-    # 제목 길이 검증 (30-60자)
-    if 30 <= len(title) <= 60:
-        score += 20
-    else:
-        print(f" 제목 길이 부적절: {len(title)}자 (권장: 30-60자)")
-    
-    # 리드 길이 검증 (150-160자)
-    if 150 <= len(lead) <= 160:
-        score += 20
-    else:
-        print(f" 리드 길이 부적절: {len(lead)}자 (권장: 150-160자)")
-    
-    # 제목에 키워드 포함 여부
-    if any(keyword in title.lower() for keyword in ['비트코인', '이더리움', '암호화폐', '블록체인', '코인']):
-        score += 15
-    
-    # 리드에 키워드 포함 여부
-    if any(keyword in lead.lower() for keyword in ['비트코인', '이더리움', '암호화폐', '블록체인', '코인']):
-        score += 15
-    
-    # HTML 구조 검증
-    if '<p>' in content and '<br>' in content:
-        score += 10
-    
-    # 숫자 포함 여부 (신뢰도)
-    if any(char.isdigit() for char in title):
-        score += 10
-    
-    # 현재성 키워드 포함
-    if any(keyword in title for keyword in ['2025', '최신', '오늘', '급상승', '돌파']):
-        score += 10
-    
-    return min(score, 100)
-
-def generate_meta_description(title, lead):
-    """메타 설명 생성 (150-160자)"""
-    # 리드가 적절한 길이면 사용, 아니면 제목 기반으로 생성
-    if 150 <= len(lead) <= 160:
-        return lead
-    else:
-        # 제목 + 간단한 설명으로 메타 설명 생성
-        base_text = f"{title}. 최신 암호화폐 뉴스와 시장 분석을 제공합니다."
-        if len(base_text) <= 160:
-            return base_text
-        else:
-            return base_text[:157] + "..."
-
-def extract_focus_keyword(title, lead, content, tags=None):
-    """Return a focus keyword that best aligns with SEO heuristics."""
-    tags = tags or []
-
-    def normalize(term):
-        if not isinstance(term, str):
-            return ""
-        return re.sub(r'\s+', ' ', term.strip())
-
-    candidate_terms = []
-    for tag in tags:
-        tag_normalized = normalize(tag)
-        if tag_normalized:
-            candidate_terms.append(tag_normalized)
-
-    combined_text = f"{title} {lead} {content or ''}"
-    lowered_combined = combined_text.lower()
-
-    title_tokens = [normalize(token) for token in re.split(r'[\s\-\|,]+', title) if normalize(token)]
-    for token in title_tokens:
-        if len(token) >= 2:
-            candidate_terms.append(token)
-    if len(title_tokens) >= 2:
-        headline_phrase = normalize(' '.join(title_tokens[:2]))
-        if len(headline_phrase) >= 2:
-            candidate_terms.append(headline_phrase)
-
-    lead_tokens = [normalize(token) for token in re.split(r'[\s\-\|,]+', lead) if normalize(token)]
-    for token in lead_tokens[:5]:
-        if len(token) >= 2:
-            candidate_terms.append(token)
-
-    candidate_scores = {}
-    title_lower = title.lower()
-    lead_lower = lead.lower()
-    content_lower = (content or "").lower()
-
-    for candidate in candidate_terms:
-        if not candidate or len(candidate) < 2:
-            continue
-        candidate_lower = candidate.lower()
-
-        score = 0
-        if candidate_lower in title_lower:
-            score += 12
-        if candidate_lower in lead_lower:
-            score += 6
-        if candidate_lower in content_lower:
-            score += 4
+# 파이프라인 단계별 기본 작업자 수 (환경 변수 PIPELINE_WORKERS='{"translate": 4}' 형태로 덮어쓰기)
+PIPELINE_WORKERS = {
+    'scrape': 3,
+    'extract': 2,
+    'translate': 3,
+    'image': 2,
+    'upload': 2,
+    'post': 1,
+}
 
-        occurrences = lowered_combined.count(candidate_lower)
-        score += occurrences * 3
+# 번역 모델 설정 (배치 번역도 같은 값을 써야 캐시 키가 일치함)
+TRANSLATION_MODEL = "gpt-4o-mini"
+TRANSLATION_TEMPERATURE = 0.7  # 번역의 창의성 조절
+TRANSLATION_MAX_TOKENS = 4000  # 최대 토큰 수 제한
 
-        if any(normalize(tag).lower() == candidate_lower for tag in tags if isinstance(tag, str)):
-            score += 5
+# 대표 이미지 생성 모델
+IMAGE_MODEL = "dall-e-3"
 
-        token_count = len(candidate.split())
-        if 1 < token_count <= 4:
-            score += 2
-        elif token_count == 1 and len(candidate) >= 4:
-            score += 1
+# 긴 기사를 나눈 청크를 동시에 번역할 최대 스레드 수
+TRANSLATION_CHUNK_WORKERS = 4
 
-        current_best = candidate_scores.get(candidate)
-        if current_best is None or score > current_best:
-            candidate_scores[candidate] = score
+# 본문 추출 신뢰도가 이보다 낮은 기사는 번역하지 않음 (LLM 호출 절약)
+TRANSLATION_MIN_CONFIDENCE = float(os.getenv('TRANSLATION_MIN_CONFIDENCE', '0.25'))
 
-    if candidate_scores:
-        best_candidate = max(candidate_scores.items(), key=lambda item: (item[1], len(item[0])))[0]
-        return best_candidate
+# 번역 응답을 스트리밍으로 받아 리드가 완성되는 즉시 이미지 생성을 시작할지 여부
+TRANSLATION_STREAMING = os.getenv('TRANSLATION_STREAMING', 'true').lower() == 'true'
 
-    if title_tokens:
-        return title_tokens[0]
+# 번역/이미지 요청을 공유 비동기 실행기로 보낼지 여부 (429/한도 헤더에 따라 동시 요청 수 자동 조절)
+OPENAI_ASYNC = os.getenv('OPENAI_ASYNC', 'true').lower() == 'true'
 
-    return 'cryptocurrency'
+# 단계 사이 큐의 최대 크기 (backpressure)
+PIPELINE_QUEUE_SIZE = 4
 
+# 스케줄 실행의 피드 확인 간격 방식 (fixed: feeds.json의 간격 고정, adaptive: 피드별 발행 주기 학습)
+# adaptive는 python feed_cadence.py simulate 결과에서 같은 요청 수로 fixed보다 p95 지연이 짧지 않으므로 기본값은 fixed
+FEED_SCHEDULER = os.getenv('FEED_SCHEDULER', 'fixed').lower()
 
-def determine_primary_category(title, lead, content, tags=None):
-    """Choose the most relevant WordPress category between blockchain and education."""
-    tags = tags or []
+# 스트리밍 번역 중 리드가 완성되면 이미지 생성을 미리 시작하는 스레드 풀
+streaming_image_executor = ThreadPoolExecutor(max_workers=PIPELINE_WORKERS['image'])
 
-    def prepare_text(values):
-        return ' '.join([str(value) for value in values if isinstance(value, (str, bytes)) and value]).lower()
+# 스크랩 단계에서 공유하는 호스트별 제한
+scrape_politeness = HostPoliteness()
 
-    combined_text = prepare_text([title, lead, content, ' '.join(tag for tag in tags if isinstance(tag, str))])
+# WordPress 호스트는 인증 정보와 속도 제한 버킷을 공유 세션에 한 번만 등록
+if wp_url:
+    http_client.configure_host(wp_url, auth=(wp_user, wp_pass), rate_key='wordpress')
 
-    blockchain_keywords = [
-        'blockchain', '블록체인', '비트코인', 'bitcoin', '이더리움', 'ethereum', '암호화폐',
-        'crypto', 'cryptocurrency', '토큰', 'token', 'defi', '디파이', 'nft', 'web3',
-        '분산원장', 'distributed ledger', '디지털 자산', 'stablecoin', 'staking'
-    ]
-    education_keywords = [
-        '교육', 'education', '학습', 'training', '훈련', '세미나', 'workshop', '워크숍',
-        '강의', 'lecture', 'curriculum', '커리큘럼', '학생', 'student', '학교', 'school',
-        '교사', 'teacher', '강사', 'instructor', '자격증', 'certificate', 'certification', 'edtech'
-    ]
-
-    def score_keywords(keywords):
-        score = 0
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            occurrences = combined_text.count(keyword_lower)
-            if occurrences:
-                weight = 3 if len(keyword_lower) >= 6 else 2
-                score += occurrences * weight
-        return score
-
-    blockchain_score = score_keywords(blockchain_keywords)
-    education_score = score_keywords(education_keywords)
-
-    if education_score > blockchain_score:
-        chosen = 'education'
-    else:
-        chosen = 'blockchain'
+# OpenAI 클라이언트 초기화
+client = OpenAI(api_key=openai_api_key)
 
-    print(f"카테고리 점수 - Blockchain: {blockchain_score}, Education: {education_score}, 선택: {chosen}")
-    return chosen
+# 번역/이미지 단계의 모든 작업자가 함께 쓰는 비동기 실행기 (OPENAI_ASYNC가 false면 동기 클라이언트만 사용)
+openai_async = AsyncRunnerThread(openai_api_key) if OPENAI_ASYNC else None
 
+def validate_environment():
+    """환경 변수 검증"""
+    if not openai_api_key:
+        raise ValueError("OPENAI_API_KEY가 .env 파일에 설정되어 있지 않습니다.")
+    if not all([wp_url, wp_user, wp_pass]):
+        raise ValueError("WordPress 인증 정보가 .env 파일에 설정되어 있지 않습니다.")
+    # 번역 프롬프트를 시작 시 한 번 읽고 검증
+    prompt_registry.get('translation')
 
 def resolve_category_id(category_slug):
     """Return the numeric WordPress category ID for the provided slug."""
@@ -223,10 +130,9 @@ def resolve_category_id(category_slug):
             print(f"[WARN] 유효하지 않은 카테고리 ID(.env) - {category_slug}: {env_value}")
 
     try:
-        response = requests.get(
+        response = http_client.get(
             f"{wp_url}/wp-json/wp/v2/categories",
             params={'slug': category_slug},
-            auth=(wp_user, wp_pass),
             timeout=15
         )
         if response.status_code == 200:
@@ -245,76 +151,67 @@ def resolve_category_id(category_slug):
 
     return None
 
-def optimize_content_structure(content):
-    """콘텐츠 구조 SEO 최적화"""
-    # H2, H3 태그 추가 (간단한 예시)
-    optimized_content = content
+def build_image_prompt(lead):
+    """기사 리드로 DALL-E 이미지 프롬프트를 만드는 함수"""
+    # 이미지 생성을 위한 프롬프트 생성
+    # 뉴스 기사 이미지: {title}
     
-    # 첫 번째 문단을 H2로 감싸기
-    if '<p>' in content:
-        first_p = content.split('<p>')[1].split('</p>')[0] if '</p>' in content else ""
-        if first_p and len(first_p) > 20:
-            # 첫 번째 문단을 H2로 변경
-            optimized_content = content.replace(f'<p>{first_p}</p>', f'<h2>{first_p}</h2>', 1)
+    # 기사 요약: ...
     
-    return optimized_content
+    # 전문적이고 신뢰할 수 있는 뉴스 이미지를 생성해주세요. 
+    # - 기사 요약을 분석해서 관련된 이미지를 생성해주세요.
+    # - 깔끔하고 현대적인 디자인
+    # - 뉴스 매체에 적합한 색상 (주로 파란색, 회색, 흰색 톤)
+    # - 관련 아이콘이나 그래픽 요소 포함
+    # - 16:9 비율의 와이드 이미지
+
+    image_prompt = f"""
 
-def generate_image_with_dalle(title, content, lead, return_url_only=False):
-    """DALL-E를 사용하여 뉴스 기사에 맞는 이미지를 생성하는 함수"""
-    try:
-        # 이미지 생성을 위한 프롬프트 생성
-        # 뉴스 기사 이미지: {title}
-        
-        # 기사 요약: ...
-        
-        # 전문적이고 신뢰할 수 있는 뉴스 이미지를 생성해주세요. 
-        # - 기사 요약을 분석해서 관련된 이미지를 생성해주세요.
-        # - 깔끔하고 현대적인 디자인
-        # - 뉴스 매체에 적합한 색상 (주로 파란색, 회색, 흰색 톤)
-        # - 관련 아이콘이나 그래픽 요소 포함
-        # - 16:9 비율의 와이드 이미지
 
-        image_prompt = f"""
+    Create a high-quality, realistic editorial-style image that visually represents the following news topic:
 
+    "{lead[:200]}"
 
-        Create a high-quality, realistic editorial-style image that visually represents the following news topic:
+    The image must have a 16:9 wide aspect ratio suitable for online news banners or thumbnails.
+    Make it photojournalistic, realistic, and neutral in tone — like an image used by major global news outlets.
+    Avoid any text, logos, watermarks, or overly stylized filters.
+    Use natural lighting, balanced colors, and professional composition.
 
-        "{lead[:200]}"
 
-        The image must have a 16:9 wide aspect ratio suitable for online news banners or thumbnails.
-        Make it photojournalistic, realistic, and neutral in tone — like an image used by major global news outlets.
-        Avoid any text, logos, watermarks, or overly stylized filters.
-        Use natural lighting, balanced colors, and professional composition.
+    """
+    return image_prompt.strip()
 
+def generate_image_with_dalle(title, content, lead):
+    """
+    DALL-E를 사용하여 뉴스 기사에 맞는 이미지를 생성하는 함수
 
-        """
+    Returns:
+        GeneratedImage: 생성 결과 (URL, 프롬프트, 소요 시간, 필요할 때 다운로드하는 이미지 바이트) (실패 시 None)
+    """
+    try:
+        image_prompt = build_image_prompt(lead)
         
         print("DALL-E를 사용하여 이미지 생성 중...")
         
-        # DALL-E API 호출
-        response = client.images.generate(
-            model="dall-e-3",
-            prompt=image_prompt.strip(),
-            size="1792x1024",  # 16:9 비율
-            quality="standard",
-            n=1
-        )
-        
-        # 생성된 이미지 URL 가져오기
-        image_url = response.data[0].url
-        print(f"이미지 생성 완료: {image_url}")
-        
-        # URL만 반환하는 경우
-        if return_url_only:
-            return image_url
-        
-        # 이미지 다운로드
-        image_response = requests.get(image_url)
-        if image_response.status_code == 200:
-            return image_response.content
+        # DALL-E API 호출 (기사당 한 번만)
+        if openai_async is not None:
+            # 공유 비동기 실행기가 429/5xx 재시도와 동시 요청 수 조절을 처리 (기본 크기 1792x1024, 16:9 비율)
+            image = openai_async.image(image_prompt, IMAGE_MODEL)
         else:
-            print(f"이미지 다운로드 실패: {image_response.status_code}")
-            return None
+            rate_limiter.acquire('openai.images')
+            started = time.monotonic()
+            response = client.images.generate(
+                model=IMAGE_MODEL,
+                prompt=image_prompt,
+                size="1792x1024",  # 16:9 비율
+                quality="standard",
+                n=1
+            )
+
+            # 생성된 이미지 URL 가져오기 (이미지 바이트는 업로드할 때 한 번만 다운로드)
+            image = GeneratedImage(response.data[0].url, image_prompt, IMAGE_MODEL, time.monotonic() - started)
+        print(f"이미지 생성 완료 ({image.generation_seconds:.1f}초): {image.url}")
+        return image
             
     except Exception as e:
         print(f"이미지 생성 중 오류 발생: {e}")
@@ -342,11 +239,10 @@ def upload_image_to_wordpress(image_data, filename="news_image.jpg"):
         
         print(f"이미지 업로드 시도 중... (파일명: {safe_filename})")
         
-        response = requests.post(
+        response = http_client.post(
             media_url,
             files=files,
             headers=headers,
-            auth=(wp_user, wp_pass),
             timeout=30  # 타임아웃 설정
         )
         
@@ -367,8 +263,9 @@ def upload_image_to_wordpress(image_data, filename="news_image.jpg"):
         print(f"이미지 업로드 중 오류 발생: {e}")
         return None, None
 
-def post_to_wordpress(title, content, lead, status='publish', featured_media_id=None, image_url=None, tags=None):
-    """WordPress에 포스트를 업로드하는 함수 (SEO 최적화)"""
+def post_to_wordpress(title, content, lead, status='publish', featured_media_id=None, image_url=None, tags=None,
+                      category=None):
+    """WordPress에 포스트를 업로드하는 함수 (SEO 최적화, category가 없으면 기사 내용으로 카테고리 판단)"""
     api_url = f"{wp_url}/wp-json/wp/v2/posts"
     
     headers = {
@@ -380,10 +277,6 @@ def post_to_wordpress(title, content, lead, status='publish', featured_media_id=
     safe_content = content if content else ""
     safe_lead = lead if lead else ""
     
-    # SEO 최적화 검증
-    seo_score = validate_seo_optimization(safe_title, safe_lead, safe_content)
-    print(f"SEO 점수: {seo_score}/100")
-    
     # 이미지 URL이 있으면 content에 이미지 추가 (SEO 최적화)
     if image_url:
         # 이미지 alt 텍스트를 제목 기반으로 생성
@@ -399,11 +292,13 @@ def post_to_wordpress(title, content, lead, status='publish', featured_media_id=
         safe_content = image_html + safe_content
         print(f"SEO 최적화된 이미지가 content에 추가되었습니다: {image_url}")
     
-    # SEO 최적화된 메타데이터 생성
-    meta_description = generate_meta_description(safe_title, safe_lead)
-    focus_keyword = extract_focus_keyword(safe_title, safe_lead, safe_content, tags)
+    # SEO 점수와 메타데이터 계산 (CPU 작업이므로 프로세스 풀에서 실행)
+    seo = process_pool.run(score_article, safe_title, safe_lead, safe_content, tags)
+    print(f"SEO 점수: {seo['seo_score']}/100")
+    meta_description = seo['meta_description']
+    focus_keyword = seo['focus_keyword']
 
-    primary_category_slug = determine_primary_category(safe_title, safe_lead, safe_content, tags)
+    primary_category_slug = category or seo['category']
     primary_category_id = resolve_category_id(primary_category_slug)
     if primary_category_id:
         categories_payload = [primary_category_id]
@@ -449,11 +344,10 @@ def post_to_wordpress(title, content, lead, status='publish', featured_media_id=
         print(f"포스트 데이터 전송 중... (대표이미지 ID: {featured_media_id})")
         print(f"Content 미리보기: {safe_content[:200]}...")  # HTML 태그 확인용
         
-        response = requests.post(
+        response = http_client.post(
             api_url,
             data=json_data,
             headers=headers,
-            auth=(wp_user, wp_pass),
             timeout=30
         )
         
@@ -467,7 +361,7 @@ def post_to_wordpress(title, content, lead, status='publish', featured_media_id=
                 print(f"대표 이미지 설정 확인 중... (미디어 ID: {featured_media_id})")
                 # 포스트 정보를 다시 가져와서 대표 이미지 확인
                 post_check_url = f"{wp_url}/wp-json/wp/v2/posts/{post_data['id']}"
-                check_response = requests.get(post_check_url, auth=(wp_user, wp_pass))
+                check_response = http_client.get(post_check_url)
                 if check_response.status_code == 200:
                     post_info = check_response.json()
                     if post_info.get('featured_media') == featured_media_id:
@@ -487,266 +381,676 @@ def post_to_wordpress(title, content, lead, status='publish', featured_media_id=
         print(f"WordPress 업로드 중 오류 발생: {e}")
         return None
 
+def chat_completion(model, system_prompt, user_content, **kwargs):
+    """
+    캐시를 거쳐 chat completion을 요청하는 함수
+
+    OPENAI_ASYNC면 공유 비동기 실행기로 보내 모든 작업자의 요청에 적응형 동시성 제한을 적용한다.
+    두 경로는 같은 LLM 캐시 키를 사용한다.
+    """
+    if openai_async is not None:
+        return openai_async.chat(model, system_prompt, user_content, **kwargs)
+    return cached_chat_completion(client, model, system_prompt, user_content, **kwargs)
+
+def streamed_completion(model, system_prompt, user_content, on_delta, **kwargs):
+    """
+    캐시를 거쳐 chat completion을 스트리밍으로 요청하는 함수
+
+    chat_completion과 같이 OPENAI_ASYNC면 공유 비동기 실행기를 거치므로 스트리밍 요청에도 같은 동시성 제한이 적용된다.
+    """
+    if openai_async is not None:
+        return openai_async.chat_stream(model, system_prompt, user_content, on_delta, **kwargs)
+    return streamed_chat_completion(client, model, system_prompt, user_content, on_delta, **kwargs)
+
+def parse_translation_response(kr_content, repair=True):
+    """
+    번역 결과를 검증해 제목/리드/본문/태그로 변환하는 함수
+
+    형식에 맞지 않는 응답은 기사를 다시 번역하지 않고, 응답만 스키마에 맞게 고치는 요청을 한 번 보낸다.
+
+    Args:
+        kr_content (str): 번역 응답
+        repair (bool): False면 교정 요청 없이 실패 처리
+
+    Returns:
+        tuple: (title, lead, content, tags) (실패 시 모두 None)
+    """
+    def complete(system_prompt, user_content):
+        return chat_completion(
+            TRANSLATION_MODEL,
+            system_prompt,
+            user_content,
+            temperature=0,
+            response_format=TRANSLATION_RESPONSE_FORMAT
+        )
+
+    try:
+        translation = parse_translation_or_repair(kr_content, complete if repair else None)
+    except Exception as e:
+        print(f"번역 응답 파싱 실패: {e}")
+        return None, None, None, None
+
+    print("\n=== 파싱 결과 ===")
+    print(f"Content HTML 태그 확인: {'<br>' in translation.content or '<p>' in translation.content}")
+
+    return translation.title, translation.lead, translation.content, translation.tags
+
+def parse_continuation_response(kr_content):
+    """
+    이어지는 본문 번역 응답을 검증해 본문을 꺼내는 함수
+
+    Returns:
+        str: 본문 (형식에 맞지 않으면 None)
+    """
+    try:
+        return parse_continuation(kr_content)
+    except TranslationParseError as e:
+        print(f"경고: 이어지는 본문 번역 응답이 형식에 맞지 않습니다 ({e})")
+        return None
+
+def finish_translation(first, contents):
+    """
+    첫 청크의 번역 결과와 나머지 청크의 본문을 합친 뒤 본문에 SEO 구조를 한 번만 적용하는 함수
+
+    청크마다 적용하면 청크 첫 문단마다 소제목이 생기므로 합친 본문에만 적용한다.
+
+    Returns:
+        tuple: (title, lead, content, tags) (청크 하나라도 실패하면 모두 None)
+    """
+    title, lead, content, tags = merge_translations(first, contents)
+    if not content:
+        return None, None, None, None
+    # SEO 최적화된 콘텐츠 구조 생성
+    return title, lead, optimize_content_structure(content), tags
+
+def translate_chunk(chunk):
+    """번역 입력 청크 하나를 번역하고 (title, lead, content, tags)로 파싱하는 함수"""
+    # 시작 시 한 번 읽어 둔 시스템 프롬프트 사용 (모든 요청의 앞부분이 같아 프롬프트 캐시 대상이 됨)
+    system_prompt = prompt_registry.text('translation')
+
+    # GPT를 사용하여 번역 (GPT-4 대신), 같은 요청은 캐시된 응답 사용
+    kr_content = chat_completion(
+        TRANSLATION_MODEL,
+        system_prompt,
+        chunk,
+        temperature=TRANSLATION_TEMPERATURE,
+        max_tokens=TRANSLATION_MAX_TOKENS,
+        response_format=TRANSLATION_RESPONSE_FORMAT
+    )
+    print(f"kr_content: {kr_content}")
+
+    return parse_translation_response(kr_content)
+
+def translate_continuation(chunk):
+    """긴 기사의 두 번째 이후 청크를 본문만 번역하는 함수 (실패 시 None)"""
+    # 번역 프롬프트 뒤에 이어지는 본문 지시문만 붙이므로 시스템 프롬프트의 앞부분은 첫 청크와 같음
+    kr_content = chat_completion(
+        TRANSLATION_MODEL,
+        continuation_prompt(prompt_registry.text('translation')),
+        chunk,
+        temperature=TRANSLATION_TEMPERATURE,
+        max_tokens=TRANSLATION_MAX_TOKENS,
+        response_format=CONTINUATION_RESPONSE_FORMAT
+    )
+    print(f"kr_content: {kr_content}")
+
+    return parse_continuation_response(kr_content)
+
+def translate_article(news_content):
+    """
+    뉴스 내용을 번역하고 제목/리드/본문/태그로 파싱하는 함수
+
+    상투 문구를 정리하고 토큰 예산을 적용한 뒤, 긴 기사는 문단 단위 청크로 나눠 동시에 번역하고 다시 합친다.
+    첫 청크는 기사 전체로, 나머지 청크는 본문만 번역한다.
+
+    Returns:
+        tuple: (title, lead, content, tags) (실패 시 모두 None)
+    """
+    try:
+        prepared = prepare_translation_input(news_content, TRANSLATION_MODEL)
+        if not prepared.is_chunked:
+            return finish_translation(translate_chunk(prepared.chunks[0]), [])
+
+        with ThreadPoolExecutor(max_workers=min(len(prepared.chunks), TRANSLATION_CHUNK_WORKERS)) as executor:
+            rest = [executor.submit(translate_continuation, chunk) for chunk in prepared.chunks[1:]]
+            first = translate_chunk(prepared.chunks[0])
+            return finish_translation(first, [future.result() for future in rest])
+
+    except Exception as e:
+        report_translation_error(e)
+        return None, None, None, None
+
+def translate_article_streaming(news_content, on_field=None):
+    """
+    번역 응답을 스트리밍으로 받으면서 JSON 필드(title, lead, content, tags)가 완성되는 즉시 on_field를 호출하는 함수
+
+    첫 청크만 스트리밍으로 받고, 긴 기사의 나머지 청크는 그동안 일반 요청으로 동시에 번역한다.
+    최종 결과는 translate_article과 같은 파싱을 거치므로 JSON이 아닌 응답도 처리된다.
+
+    Args:
+        news_content (str): 번역할 기사 텍스트
+        on_field (callable): 필드가 완성될 때 (name, value)로 호출할 함수
+
+    Returns:
+        tuple: (title, lead, content, tags) (실패 시 모두 None)
+    """
+    try:
+        prepared = prepare_translation_input(news_content, TRANSLATION_MODEL)
+        started = time.monotonic()
+
+        def handle_field(name, value):
+            print(f"스트리밍 번역: '{name}' 필드 완성 ({time.monotonic() - started:.1f}초)")
+            if on_field:
+                on_field(name, value)
+
+        parser = IncrementalJSONParser(handle_field)
+        with ThreadPoolExecutor(max_workers=TRANSLATION_CHUNK_WORKERS) as executor:
+            rest = [executor.submit(translate_continuation, chunk) for chunk in prepared.chunks[1:]]
+            kr_content = streamed_completion(
+                TRANSLATION_MODEL,
+                prompt_registry.text('translation'),
+                prepared.chunks[0],
+                parser.feed,
+                temperature=TRANSLATION_TEMPERATURE,
+                max_tokens=TRANSLATION_MAX_TOKENS,
+                response_format=TRANSLATION_RESPONSE_FORMAT
+            )
+            print(f"kr_content: {kr_content}")
+            first = parse_translation_response(kr_content)
+            return finish_translation(first, [future.result() for future in rest])
+
+    except Exception as e:
+        report_translation_error(e)
+        return None, None, None, None
+
+def report_translation_error(e):
+    """번역 중 발생한 오류를 출력하는 함수"""
+    if 'insufficient_quota' in str(e):
+        print("OpenAI API 할당량이 초과되었습니다. 계정의 사용량과 결제 상태를 확인해주세요.")
+        print("https://platform.openai.com/account/usage 에서 현재 사용량을 확인할 수 있습니다.")
+    else:
+        print(f"번역 중 오류 발생: {e}")
+
+
+def generate_featured_image(title, content, lead):
+    """
+    DALL-E로 대표 이미지를 생성하는 함수 (이미지 단계)
+
+    Returns:
+        GeneratedImage: 생성 결과 (실패 시 None)
+    """
+    image = generate_image_with_dalle(title, content, lead)
+    if not image:
+        print("이미지 생성 실패 - 이미지 없이 포스트를 생성합니다.")
+        return None
+
+    print(f"DALL-E 이미지 URL 획득: {image.url}")
+    return image
+
+def upload_featured_image(image):
+    """
+    생성한 이미지를 WordPress 미디어로 업로드하는 함수 (업로드 단계)
+
+    업로드에 실패하면 같은 이미지의 DALL-E URL을 그대로 사용한다.
+
+    Args:
+        image (GeneratedImage): generate_featured_image의 결과
+
+    Returns:
+        tuple: (featured_media_id, image_url)
+    """
+    if not image:
+        return None, None
+
+    # 이미지 다운로드하여 WordPress에 업로드 시도
+    image_data = image.content
+    if image_data:
+        # WordPress에 이미지 업로드
+        print("WordPress에 이미지 업로드 중...")
+        media_id, uploaded_image_url = upload_image_to_wordpress(image_data)
+        if media_id and uploaded_image_url:
+            print(f"대표 이미지 설정 완료 (ID: {media_id})")
+            print(f"이미지 URL: {uploaded_image_url}")
+            print(f"이미지 처리 시간: {image.timings}")
+            return media_id, uploaded_image_url
+        print("이미지 업로드 실패 - DALL-E URL을 직접 사용합니다.")
+    else:
+        print("이미지 다운로드 실패 - DALL-E URL을 직접 사용합니다.")
+
+    print(f"DALL-E 이미지 URL 사용: {image.url}")
+    return None, image.url
+
+def prepare_featured_image(title, content, lead):
+    """대표 이미지를 생성하고 업로드하는 함수 (실패해도 이미지 없이 진행)"""
+    try:
+        image = generate_featured_image(title, content, lead)
+        return upload_featured_image(image)
+    except Exception as image_error:
+        print(f"이미지 생성/업로드 중 오류 발생: {image_error}")
+        print("이미지 없이 포스트를 생성합니다.")
+        return None, None
+
 def translate_and_format(news_content):
     """뉴스 내용을 번역하고 포맷팅하는 함수"""
-    try:
-        # prompt.txt 파일에서 시스템 프롬프트 읽기
-        with open('prompt.txt', 'r', encoding='utf-8') as f:
-            system_prompt = f.read()
-
-        # GPT를 사용하여 번역 (GPT-4 대신)
-        completion = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": system_prompt
-                },
-                {
-                    "role": "user",
-                    "content": news_content
-                }
-            ],
-            temperature=0.7,  # 번역의 창의성 조절
-            max_tokens=4000   # 최대 토큰 수 제한
-        )
+    title, lead, content, tags = translate_article(news_content)
+    if not all([title, lead, content]):
+        return None, None, None, None, None, None
 
-        kr_content = completion.choices[0].message.content
-        print(f"kr_content: {kr_content}")
-        
-        # 코드 블록(```json ... ```)이 있으면 제거
-        if kr_content.strip().startswith("```"):
-            kr_content = re.sub(r"^```[a-zA-Z]*\s*", "", kr_content.strip())
-            if kr_content.strip().endswith("```"):
-                kr_content = kr_content.strip()[:-3].strip()
-
-        # JSON 형식인지 확인
-        is_json = False
+    # 이미지 생성
+    print("\n=== 이미지 생성 중 ===")
+    featured_media_id, image_url = prepare_featured_image(title, content, lead)
+
+    return title, lead, content, featured_media_id, image_url, tags
+
+def load_pipeline_workers(overrides=None):
+    """기본 단계별 작업자 수에 환경 변수 PIPELINE_WORKERS와 overrides를 덮어쓴 설정을 반환하는 함수"""
+    workers = dict(PIPELINE_WORKERS)
+    env_value = os.getenv('PIPELINE_WORKERS')
+    if env_value:
         try:
-            # JSON 형식인지 시도
-            article_json = json.loads(kr_content)
-            is_json = True
-        except json.JSONDecodeError:
-            is_json = False
-
-        title = ''
-        lead = ''
-        content = ''
-
-        if is_json:
-            # JSON 형식 처리
-            title = article_json.get('title', '').strip()
-            lead = article_json.get('lead', '').strip()
-            content = article_json.get('content', '').strip()
-        else:
-            # 일반 문자열 형식 처리
-            try:
-                # title 추출
-                if 'title:' in kr_content:
-                    title_parts = kr_content.split('lead:')
-                    title = title_parts[0].replace('title:', '').strip()
-                elif '### 제목' in kr_content:
-                    title_parts = kr_content.split('### 리드' if '### 리드' in kr_content else '### 본문')
-                    title = title_parts[0].split('### 제목')[-1].strip()
-                elif '**제목**' in kr_content:
-                    title_parts = kr_content.split('**리드**' if '**리드**' in kr_content else '**본문**')
-                    title = title_parts[0].split('**제목**')[-1].strip()
-                # lead 추출
-                if 'lead:' in kr_content:
-                    lead_parts = kr_content.split('content:')
-                    lead = lead_parts[0].split('lead:')[1].strip()
-                elif '### 리드' in kr_content:
-                    lead_parts = kr_content.split('### 본문')
-                    lead = lead_parts[0].split('### 리드')[-1].strip()
-                elif '**리드**' in kr_content:
-                    lead_parts = kr_content.split('**본문**')
-                    lead = lead_parts[0].split('**리드**')[-1].strip()
-                # content 추출
-                if 'content:' in kr_content:
-                    content = kr_content.split('content:')[1].strip()
-                elif '### 본문' in kr_content:
-                    content_parts = kr_content.split('### 본문')
-                    if len(content_parts) > 1:
-                        content = content_parts[1].strip()
-                        # 다음 섹션이 있다면 그 전까지만 추출
-                        next_section = content.find('###')
-                        if next_section != -1:
-                            content = content[:next_section].strip()
-                elif '**본문**' in kr_content:
-                    content_parts = kr_content.split('**본문**')
-                    if len(content_parts) > 1:
-                        content = content_parts[1].strip()
-                        # 다음 섹션이 있다면 그 전까지만 추출
-                        next_section = content.find('**')
-                        if next_section != -1:
-                            content = content[:next_section].strip()
-            except Exception as parsing_error:
-                print(f"번역 결과 파싱 중 오류 발생: {parsing_error}")
-                print(f"원본 번역 결과: {kr_content}")
-                return None, None, None
-
-        print("\n=== 파싱 결과 ===")
-        print(f"Content HTML 태그 확인: {'<br>' in content or '<p>' in content}")
-        
-        # SEO 최적화된 콘텐츠 구조 생성
-        content = optimize_content_structure(content)
-        
-        # 태그 추출 (JSON에서 tags 필드가 있는 경우)
-        tags = []
-        if is_json and 'tags' in article_json:
-            tags = article_json.get('tags', [])
-        elif not is_json and 'tags:' in kr_content:
-            try:
-                tags_section = kr_content.split('tags:')[1].strip()
-                if tags_section.startswith('[') and tags_section.endswith(']'):
-                    import ast
-                    tags = ast.literal_eval(tags_section)
-                else:
-                    # 간단한 태그 파싱
-                    tags = [tag.strip() for tag in tags_section.split(',') if tag.strip()]
-            except:
-                tags = []
-
-        if not all([title, lead, content]):
-            print("경고: 일부 필드가 비어 있습니다.")
-            print(f"비어있는 필드: {[field for field, value in {'title': title, 'lead': lead, 'content': content}.items() if not value]}")
-            return None, None, None, None, None, None
-
-        # 이미지 생성
-        print("\n=== 이미지 생성 중 ===")
-        featured_media_id = None
-        image_url = None
-        
+            workers.update({key: int(value) for key, value in json.loads(env_value).items()})
+        except (ValueError, AttributeError) as e:
+            print(f"[WARN] PIPELINE_WORKERS 설정을 읽을 수 없습니다: {e}")
+    # 추출 단계 스레드는 프로세스 풀의 결과를 기다리므로, 프로세스 수만큼 있어야 모든 코어를 사용
+    workers['extract'] = max(workers.get('extract', 1), process_pool.processes)
+    workers.update(overrides or {})
+    return workers
+
+def scrape_stage(source, on_feed=None):
+    """피드에서 새 기사를 골라 페이지 HTML을 하나씩 가져오는 단계 (fan-out)"""
+    source_name, url = source
+    for entry, pub_date in get_new_entries(url, source_name, on_feed):
         try:
-            # DALL-E 이미지 생성
-            dalle_image_url = generate_image_with_dalle(title, content, lead, return_url_only=True)
-            
-            if dalle_image_url:
-                print(f"DALL-E 이미지 URL 획득: {dalle_image_url}")
-                
-                # 이미지 다운로드하여 WordPress에 업로드 시도
-                image_data = generate_image_with_dalle(title, content, lead)
-                
-                if image_data:
-                    # WordPress에 이미지 업로드
-                    print("WordPress에 이미지 업로드 중...")
-                    media_id, uploaded_image_url = upload_image_to_wordpress(image_data)
-                    if media_id and uploaded_image_url:
-                        featured_media_id = media_id
-                        image_url = uploaded_image_url
-                        print(f"대표 이미지 설정 완료 (ID: {media_id})")
-                        print(f"이미지 URL: {image_url}")
-                    else:
-                        print("이미지 업로드 실패 - DALL-E URL을 직접 사용합니다.")
-                        image_url = dalle_image_url
-                        print(f"DALL-E 이미지 URL 사용: {image_url}")
-                else:
-                    print("이미지 다운로드 실패 - DALL-E URL을 직접 사용합니다.")
-                    image_url = dalle_image_url
-                    print(f"DALL-E 이미지 URL 사용: {image_url}")
-            else:
-                print("이미지 생성 실패 - 이미지 없이 포스트를 생성합니다.")
-        except Exception as image_error:
-            print(f"이미지 생성/업로드 중 오류 발생: {image_error}")
-            print("이미지 없이 포스트를 생성합니다.")
-            featured_media_id = None
-            image_url = None
-
-        return title, lead, content, featured_media_id, image_url, tags
-        
+            with scrape_politeness.slot(entry.link):
+                page = fetch_article_page(entry, source_name, pub_date)
+        except Exception as e:
+            print(f"기사 내용 가져오기 실패 ({entry.link}): {e}")
+            continue
+        yield page
+
+def extract_stage(page):
+    """페이지에서 본문을 추출해 기사 저장소에 기록하고 작업으로 등록하는 단계 (이미 등록된 기사는 제외)"""
+    return job_store.enqueue(build_article(page, article_store), JOB_WORKER_ID)
+
+def enqueue_articles(articles):
+    """기사들을 작업으로 등록하고 이 프로세스가 맡은 작업을 반환하는 제너레이터 (이미 등록된 기사는 제외)"""
+    for article in articles:
+        job = job_store.enqueue(article, JOB_WORKER_ID)
+        if job:
+            yield job
+
+def has_translatable_content(article):
+    """본문 추출 신뢰도가 번역할 만큼 높은지 확인하는 함수 (신뢰도가 없는 예전 기사는 번역)"""
+    confidence = article.get('confidence')
+    if confidence in (None, '') or float(confidence) >= TRANSLATION_MIN_CONFIDENCE:
+        return True
+    print(f"본문 추출 신뢰도가 낮아({float(confidence):.2f}) 번역을 건너뜁니다: {article.get('title')}")
+    return False
+
+def job_step(state, func):
+    """
+    작업이 state 단계에 있을 때만 func(job)을 실행하는 단계 함수를 만드는 함수
+
+    이미 지난 단계는 건너뛰고 작업을 그대로 넘기므로, 재시작한 작업은 마지막으로 끝난 단계 다음부터 진행한다.
+    func가 실패하면 작업 저장소에 실패를 기록하고 임대를 반납한다 (대기 시간 뒤 재시도).
+    """
+    def step(job):
+        if job.state != state:
+            return job
+        try:
+            return func(job)
+        except LeaseLostError as e:
+            print(f"[WARN] {e} - 다른 작업자가 이어서 처리합니다.")
+            return None
+        except Exception as e:
+            print(f"작업 처리 중 오류 발생 ({job.article.get('title')}): {e}")
+            job_store.fail(job, e)
+            return None
+    return step
+
+def translate_stage(job):
+    """
+    기사를 번역하고 파싱해 결과를 작업에 저장하는 단계
+
+    스트리밍 모드에서는 리드가 완성되는 즉시 이미지 생성을 시작해 두고, 이미지 단계에서 그 결과를 기다린다.
+    번역이 실패해도 미리 만든 이미지는 작업에 보관하므로, 재시도할 때 이미지를 다시 생성하지 않는다.
+    """
+    article = job.article
+    if not has_translatable_content(article):
+        job_store.skip(job, 'low_confidence')
+        return None
+
+    print(f"\n3. 기사 번역 및 포맷팅 중... ({article.get('title')})")
+    image_future = None
+    # 이전 시도에서 보관한 이미지가 있으면 새로 만들지 않음
+    if TRANSLATION_STREAMING and not job['image_url']:
+        def start_image(name, value):
+            nonlocal image_future
+            if name == 'lead' and value and image_future is None:
+                image_future = streaming_image_executor.submit(generate_featured_image, None, None, value)
+
+        title, lead, content, tags = translate_article_streaming(format_for_translation(article), start_image)
+    else:
+        title, lead, content, tags = translate_article(format_for_translation(article))
+
+    # 예외 발생 등으로 하나라도 None이거나 비어있으면 실패로 기록 (대기 시간 뒤 재시도)
+    if not all([title, lead, content]):
+        if image_future:
+            keep_prefetched_image(job, image_future)
+        raise ValueError("번역/파싱 오류")
+
+    job_store.advance(job, 'translated', title=title, lead=lead, content=content, tags=tags)
+    job.runtime['image_future'] = image_future
+    return job
+
+def keep_prefetched_image(job, image_future):
+    """
+    번역이 실패한 작업에서 미리 시작한 이미지를 작업에 보관하는 함수
+
+    이미 시작한 이미지 생성은 취소되지 않으므로, 결과를 버리지 않고 재시도할 때 다시 사용한다.
+    """
+    if image_future.cancel():
+        return
+    try:
+        image = image_future.result()
+        if image and image.content:
+            job_store.update(job, image_url=image.url, image_path=job_store.save_image(job, image.content))
     except Exception as e:
-        if 'insufficient_quota' in str(e):
-            print("OpenAI API 할당량이 초과되었습니다. 계정의 사용량과 결제 상태를 확인해주세요.")
-            print("https://platform.openai.com/account/usage 에서 현재 사용량을 확인할 수 있습니다.")
-        else:
-            print(f"번역 중 오류 발생: {e}")
-        return None, None, None, None, None, None
+        print(f"[WARN] 미리 생성한 이미지를 보관하지 못했습니다: {e}")
 
-def process_news():
+def image_stage(job):
+    """대표 이미지를 생성해 파일로 보관하는 단계 (실패해도 이미지 없이 다음 단계로 진행)"""
+    print(f"\n=== 이미지 생성 중 === ({job['title']})")
+    try:
+        # 스트리밍 번역 중 미리 시작한 이미지 생성이 있으면 그 결과를 사용
+        image_future = job.runtime.pop('image_future', None)
+        if image_future:
+            image = image_future.result()
+        elif job['image_url'] and job['image_path']:
+            # 번역이 실패했던 이전 시도에서 보관한 이미지를 사용
+            image = GeneratedImage.restore(job['image_url'], job_store.load_image(job))
+        else:
+            image = generate_featured_image(job['title'], job['content'], job['lead'])
+    except Exception as image_error:
+        print(f"이미지 생성 중 오류 발생: {image_error}")
+        image = None
+
+    # 재시작해도 이미지를 다시 생성하지 않도록 업로드 전까지 파일로 보관
+    image_path = job_store.save_image(job, image.content) if image and image.content else None
+    job_store.advance(job, 'image_ready', image_url=image.url if image else None, image_path=image_path)
+    job.runtime['image'] = image
+    return job
+
+def upload_stage(job):
+    """생성한 이미지를 WordPress 미디어로 업로드하는 단계"""
+    image = job.runtime.pop('image', None)
+    if image is None and job['image_url']:
+        # 이전 실행에서 보관해 둔 이미지로 이어서 업로드
+        image = GeneratedImage.restore(job['image_url'], job_store.load_image(job))
+    try:
+        featured_media_id, image_url = upload_featured_image(image)
+    except Exception as image_error:
+        print(f"이미지 업로드 중 오류 발생: {image_error}")
+        featured_media_id, image_url = None, image.url if image else None
+    # 이미지 바이트는 업로드 후 필요 없으므로 메모리와 디스크에서 해제
+    if image:
+        image.release()
+    job_store.advance(job, 'media_uploaded', featured_media_id=featured_media_id, image_url=image_url)
+    job_store.remove_image(job)
+    return job
+
+def post_stage(job):
+    """번역된 기사를 WordPress에 포스팅하는 단계 (실패하면 대기 시간 뒤 재시도)"""
+    print(f"title: {job['title']}")
+    print(f"lead: {job['lead']}")
+    print(f"content: {job['content']}")
+    print(f"tags: {job['tags']}")
+
+    print("\n4. WordPress에 포스팅 중...")
+    result = post_to_wordpress(
+        job['title'], job['content'], job['lead'], 'publish',
+        job['featured_media_id'], job['image_url'], job['tags'],
+        feed_registry.category(job.article.get('source')),
+    )
+    if not result:
+        raise RuntimeError("WordPress 포스팅 실패")
+    job_store.advance(job, 'posted', post_id=result['id'], post_link=result['link'])
+    print(f"포스트 ID: {result['id']}")
+    print(f"포스트 링크: {result['link']}")
+    return result
+
+def build_news_pipeline(workers=None, from_stage='scrape', queue_size=PIPELINE_QUEUE_SIZE, on_feed=None):
+    """
+    scrape -> extract -> translate -> image -> upload -> post 파이프라인을 만드는 함수
+
+    Args:
+        workers (dict): 단계 이름 -> 작업자 수 (기본값과 PIPELINE_WORKERS를 덮어씀)
+        from_stage (str): 시작할 단계 이름 (예: 작업 저장소의 작업을 처리할 때는 'translate')
+        queue_size (int): 단계 사이 큐의 최대 크기
+        on_feed (callable): 피드를 가져올 때마다 (source_name, entries)로 호출할 함수 (발행 주기 학습용)
+
+    Returns:
+        Pipeline: 실행할 파이프라인
+    """
+    workers = load_pipeline_workers(workers)
+    # 번역 이후 단계는 작업 저장소의 상태를 보고 이미 끝난 단계는 건너뜀
+    stage_funcs = [
+        ('scrape', functools.partial(scrape_stage, on_feed=on_feed), True),
+        ('extract', extract_stage, False),
+        ('translate', job_step('scraped', translate_stage), False),
+        ('image', job_step('translated', image_stage), False),
+        ('upload', job_step('image_ready', upload_stage), False),
+        ('post', job_step('media_uploaded', post_stage), False),
+    ]
+    names = [name for name, _, _ in stage_funcs]
+    stages = [
+        Stage(name, func, workers=workers.get(name, 1), fan_out=fan_out)
+        for name, func, fan_out in stage_funcs[names.index(from_stage):]
+    ]
+    return Pipeline(stages, queue_size=queue_size)
+
+def resume_jobs(workers=None):
+    """
+    작업 저장소에 남은 미완료 기사를 마지막으로 끝난 단계 다음부터 이어서 처리하는 함수
+
+    작업은 하나씩 임대해서 처리하므로 여러 프로세스에서 동시에 실행해도 같은 기사를 중복 처리하지 않는다.
+    """
+    unfinished = job_store.unfinished_count()
+    if not unfinished:
+        return
+    print(f"\n이전 실행에서 끝나지 않은 기사 {unfinished}개를 이어서 처리합니다...")
+    pipeline = build_news_pipeline(workers, from_stage='translate')
+    pipeline.run(job_store.iter_leased(JOB_WORKER_ID))
+
+def process_news(workers=None):
     """뉴스 스크래핑, 번역, 포스팅을 처리하는 메인 함수"""
     try:
         # 환경 변수 검증
         validate_environment()
-        
-        # 뉴스 스크래핑
+
+        # 지난 실행이 중간에 멈췄다면 남은 단계부터 처리
+        resume_jobs(workers)
+
+        # 뉴스 스크래핑부터 포스팅까지 단계별로 동시에 진행
         print("\n1. 뉴스 스크래핑 시작...")
-        scrape_all_sources()
-        
-        # news.txt 파일 읽기
-        print("\n2. 스크래핑된 뉴스 읽기...")
-        with open('news.txt', 'r', encoding='utf-8') as f:
-            news_content = f.read()
-        
-        # 각 기사 분리 (구분자로 분리)
-        articles = news_content.split("-" * 80)
-
-        for article in articles:
-            if not article.strip():
-                continue
-                
-            print("\n3. 기사 번역 및 포맷팅 중...")
-            title, lead, content, featured_media_id, image_url, tags = translate_and_format(article)
-
-            # 예외 발생 등으로 하나라도 None이거나 비어있으면 건너뜀
-            if not all([title, lead, content]):
-                print("이 기사는 번역/파싱 오류로 건너뜁니다.")
-                continue
-
-            print(f"title: {title}")
-            print(f"lead: {lead}")
-            print(f"content: {content}")
-            print(f"tags: {tags}")
-
-            print("\n4. WordPress에 포스팅 중...")
-            result = post_to_wordpress(title, content, lead, 'publish', featured_media_id, image_url, tags)
-            if result:
-                print(f"포스트 ID: {result['id']}")
-                print(f"포스트 링크: {result['link']}")
-            time.sleep(5)
+        article_store.reset()
+        pipeline = build_news_pipeline(workers)
+        pipeline.run(SOURCES.items())
+        extractor_registry.report()
+        llm_cache.report()
+        prompt_usage.report()
+        job_store.report()
     except Exception as e:
         print(f"처리 중 오류 발생: {e}")
 
+def rotating_sources(feeds):
+    """스케줄된 피드를 (이름, URL)로 넘기면서 날짜가 바뀌면 기사 저장소를 날짜별 파일로 옮기는 제너레이터"""
+    for feed in feeds:
+        article_store.rotate()
+        yield feed.name, feed.url
+
+def process_news_scheduled(workers=None, stop_event=None):
+    """
+    피드마다 자기 간격(+무작위 편차)으로 계속 스크랩해 포스팅하는 함수
+
+    하루 한 번 모든 피드를 몰아서 처리하지 않고 피드별로 흩어서 확인하므로,
+    뉴스 사이트와 OpenAI 한도에 걸리는 부하가 시간에 고르게 분산된다.
+    FEED_SCHEDULER가 adaptive면 피드의 발행 주기를 학습해 간격을 정하고(feed_cadence),
+    fixed면 feeds.json의 간격을 그대로 사용한다.
+    stop_event가 설정되거나 Ctrl+C로 중단할 때까지 실행한다.
+    """
+    try:
+        # 환경 변수 검증
+        validate_environment()
+
+        # 지난 실행이 중간에 멈췄다면 남은 단계부터 처리
+        resume_jobs(workers)
+
+        feeds = feed_registry.feeds()
+        print(f"\n1. 피드 {len(feeds)}개를 피드별 간격으로 스크랩합니다...")
+        if FEED_SCHEDULER == 'fixed':
+            scheduler = FeedScheduler(feeds)
+            pipeline = build_news_pipeline(workers)
+        else:
+            scheduler = AdaptiveFeedScheduler(feeds)
+            pipeline = build_news_pipeline(workers, on_feed=scheduler.observe)
+        pipeline.run(rotating_sources(scheduler.iter_due(stop_event)))
+    except KeyboardInterrupt:
+        print("\n스케줄 실행을 중단합니다.")
+    except Exception as e:
+        print(f"처리 중 오류 발생: {e}")
+    finally:
+        extractor_registry.report()
+        llm_cache.report()
+        prompt_usage.report()
+        job_store.report()
+
 # 테스트용 
-def process_news_test():
+def process_news_test(workers=None):
     """뉴스 스크래핑, 번역, 포스팅을 처리하는 메인 함수"""
     try:
         # 환경 변수 검증
         validate_environment()
         
-        # news.txt 파일 읽기
-        print("\n2. 스크래핑된 뉴스 읽기...")
-        with open('news.txt', 'r', encoding='utf-8') as f:
-            news_content = f.read()
+        # 예전 news.txt만 있으면 기사 저장소로 옮김
+        if not os.path.exists(article_store.path):
+            imported = import_legacy_news_file(article_store)
+            print(f"news.txt에서 {imported}개의 기사를 가져왔습니다.")
         
-        # 각 기사 분리 (구분자로 분리)
-        articles = news_content.split("-" * 80)
-
-        for article in articles:
-            if not article.strip():
-                continue
-                
-            print("\n3. 기사 번역 및 포맷팅 중...")
-            title, lead, content, featured_media_id, image_url, tags = translate_and_format(article)
-
-            # 예외 발생 등으로 하나라도 None이거나 비어있으면 건너뜀
-            if not all([title, lead, content]):
-                print("이 기사는 번역/파싱 오류로 건너뜁니다.")
-                continue
-
-            print(f"title: {title}")
-            print(f"lead: {lead}")
-            print(f"content: {content}")
-            print(f"tags: {tags}")
-
-            print("\n4. WordPress에 포스팅 중...")
-            result = post_to_wordpress(title, content, lead, 'publish', featured_media_id, image_url, tags)
-            if result:
-                print(f"포스트 ID: {result['id']}")
-                print(f"포스트 링크: {result['link']}")
-            time.sleep(5)
+        # 지난 실행이 중간에 멈췄다면 남은 단계부터 처리
+        resume_jobs(workers)
+
+        # 기사 저장소에서 한 건씩 읽어 작업으로 등록하고 번역 단계부터 실행 (이미 등록된 기사는 제외)
+        print("\n2. 스크래핑된 뉴스 읽기...")
+        pipeline = build_news_pipeline(workers, from_stage='translate')
+        pipeline.run(enqueue_articles(article_store.iter_articles()))
+        llm_cache.report()
+        prompt_usage.report()
+        job_store.report()
+    except Exception as e:
+        print(f"처리 중 오류 발생: {e}")
+
+def get_batch_backend():
+    """
+    환경 변수에 맞는 배치 번역 백엔드를 반환하는 함수
+
+    BATCH_BACKEND=inline이면 즉시 실행하는 로컬 대체 백엔드를, 그 외에는 OpenAI Batch API를 사용한다.
+    OPENAI_BATCH_BASE_URL을 지정하면 해당 주소(예: fake_batch_server.py)로 배치 요청을 보낸다.
+    """
+    if os.getenv('BATCH_BACKEND') == 'inline':
+        return InlineBatchBackend(client)
+    base_url = os.getenv('OPENAI_BATCH_BASE_URL')
+    batch_client = OpenAI(api_key=openai_api_key, base_url=base_url) if base_url else client
+    return OpenAIBatchBackend(batch_client)
+
+def process_news_batch(workers=None, poll_interval=30, scrape=True):
+    """
+    기사들을 Batch API로 한 번에 번역한 뒤 기존 파이프라인으로 포스팅하는 함수
+
+    배치 결과는 LLM 캐시에 저장되므로, 이어서 실행하는 번역 단계는 API 호출 없이 캐시에서 결과를 읽어
+    기존 파싱/이미지/포스팅 경로를 그대로 따른다.
+
+    Args:
+        workers (dict): 단계 이름 -> 작업자 수
+        poll_interval (float): 배치 상태를 확인하는 간격(초)
+        scrape (bool): False면 스크랩 없이 기사 저장소에 있는 기사만 처리
+    """
+    try:
+        # 환경 변수 검증
+        validate_environment()
+
+        if scrape:
+            print("\n1. 뉴스 스크래핑 시작...")
+            scrape_all_sources(store=article_store)
+
+        system_prompt = prompt_registry.text('translation')
+
+        # 대기 중인 기사를 모아 배치로 제출
+        print("\n2. 배치 번역 제출 중...")
+        # 번역 단계와 같은 청크와 프롬프트를 써야 캐시 키가 일치함 (첫 청크는 기사 전체, 나머지는 본문만)
+        first_chunks, continuation_chunks = [], []
+        for article in article_store.iter_articles():
+            if has_translatable_content(article):
+                chunks = prepare_translation_input(format_for_translation(article), TRANSLATION_MODEL).chunks
+                first_chunks.append(chunks[0])
+                continuation_chunks.extend(chunks[1:])
+        backend = get_batch_backend()
+        prefill_translations(
+            backend,
+            TRANSLATION_MODEL,
+            system_prompt,
+            first_chunks,
+            temperature=TRANSLATION_TEMPERATURE,
+            poll_interval=poll_interval,
+            max_tokens=TRANSLATION_MAX_TOKENS,
+            response_format=TRANSLATION_RESPONSE_FORMAT,
+        )
+        if continuation_chunks:
+            prefill_translations(
+                backend,
+                TRANSLATION_MODEL,
+                continuation_prompt(system_prompt),
+                continuation_chunks,
+                temperature=TRANSLATION_TEMPERATURE,
+                poll_interval=poll_interval,
+                max_tokens=TRANSLATION_MAX_TOKENS,
+                response_format=CONTINUATION_RESPONSE_FORMAT,
+            )
+
+        # 번역 단계부터 기존 파이프라인 실행 (번역은 캐시에서 읽음)
+        pipeline = build_news_pipeline(workers, from_stage='translate')
+        pipeline.run(enqueue_articles(article_store.iter_articles()))
+        llm_cache.report()
+        prompt_usage.report()
+        job_store.report()
     except Exception as e:
         print(f"처리 중 오류 발생: {e}")
 
 if __name__ == "__main__":
-    process_news() 
+    arg_parser = argparse.ArgumentParser(description="뉴스를 스크랩해 번역하고 WordPress에 포스팅합니다.")
+    # resume: 스크랩 없이 남은 작업만 처리 (여러 프로세스에서 동시에 실행 가능)
+    # schedule: 피드마다 feeds.json의 간격으로 계속 스크랩해 포스팅
+    # batch: 스크랩한 기사(--from-store면 기사 저장소의 기사)를 Batch API로 번역한 뒤 포스팅
+    arg_parser.add_argument('command', nargs='?', choices=['run', 'resume', 'schedule', 'batch'], default='run')
+    arg_parser.add_argument('--workers', type=int, default=WORKER_PROCESSES,
+                            help="HTML 파싱/본문 추출/SEO 점수 계산에 사용할 프로세스 수 (0이면 현재 프로세스)")
+    arg_parser.add_argument('--poll-interval', type=float, default=30, help="batch: 배치 상태를 확인하는 간격(초)")
+    arg_parser.add_argument('--from-store', action='store_true', help="batch: 스크랩 없이 기사 저장소의 기사만 번역")
+    args = arg_parser.parse_args()
+    process_pool.configure(args.workers)
+    try:
+        if args.command == 'resume':
+            validate_environment()
+            resume_jobs()
+            job_store.report()
+        elif args.command == 'schedule':
+            process_news_scheduled()
+        elif args.command == 'batch':
+            process_news_batch(poll_interval=args.poll_interval, scrape=not args.from_store)
+        else:
+            process_news()
+    finally:
+        process_pool.shutdown()
+        if openai_async is not None:
+            openai_async.close()
     # process_news_test()
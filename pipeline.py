@@ -0,0 +1,162 @@
+import queue
+import threading
+import time
+
+# 단계 종료를 알리는 표식
+_STOP = object()
+
+
+class Stage:
+    """
+    파이프라인의 한 단계
+
+    func는 입력 항목 하나를 받아 다음 단계로 넘길 항목을 반환한다.
+    None을 반환하면 그 항목은 버려지고, fan_out=True면 반환한 iterable의 항목을 하나씩 넘긴다.
+    """
+
+    def __init__(self, name, func, workers=1, fan_out=False):
+        """
+        Args:
+            name (str): 단계 이름 (통계 출력용)
+            func (callable): 항목 처리 함수
+            workers (int): 이 단계를 실행할 작업 스레드 수
+            fan_out (bool): func가 여러 항목을 반환(yield)하는지 여부
+        """
+        self.name = name
+        self.func = func
+        self.workers = max(1, int(workers))
+        self.fan_out = fan_out
+        self.processed = 0
+        self.emitted = 0
+        self.dropped = 0
+        self.errors = 0
+        self.busy_time = 0.0
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def _record(self, busy, emitted=0, dropped=0, errors=0):
+        with self._lock:
+            self.processed += 1
+            self.emitted += emitted
+            self.dropped += dropped
+            self.errors += errors
+            self.busy_time += busy
+
+    def stats(self):
+        """단계별 처리량 통계를 dict로 반환하는 함수"""
+        elapsed = (self.finished_at or time.monotonic()) - (self.started_at or time.monotonic())
+        return {
+            'stage': self.name,
+            'workers': self.workers,
+            'processed': self.processed,
+            'emitted': self.emitted,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'busy_seconds': round(self.busy_time, 2),
+            'throughput_per_min': round(self.processed / elapsed * 60, 2) if elapsed > 0 else 0.0,
+        }
+
+
+class Pipeline:
+    """
+    단계 사이를 크기가 제한된 큐로 연결한 생산자/소비자 파이프라인
+
+    각 단계는 자기 작업 스레드에서 독립적으로 실행되므로, 첫 기사가 마지막 단계까지 가는 동안
+    뒤의 기사들은 앞 단계에서 계속 처리된다. 큐가 가득 차면 앞 단계가 대기하므로(backpressure)
+    메모리 사용량은 큐 크기로 제한된다.
+    """
+
+    def __init__(self, stages, queue_size=4):
+        """
+        Args:
+            stages (list): Stage 목록 (순서대로 연결)
+            queue_size (int): 단계 사이 큐의 최대 크기
+        """
+        self.stages = stages
+        self.queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+        self._remaining = [stage.workers for stage in stages]
+        self._lock = threading.Lock()
+
+    def _emit(self, index, item):
+        if index + 1 < len(self.stages):
+            self.queues[index + 1].put(item)
+
+    def _worker(self, index):
+        stage = self.stages[index]
+        inbox = self.queues[index]
+        while True:
+            item = inbox.get()
+            if item is _STOP:
+                break
+            started = time.monotonic()
+            emitted = dropped = errors = 0
+            try:
+                result = stage.func(item)
+                if stage.fan_out:
+                    for child in result or ():
+                        if child is not None:
+                            self._emit(index, child)
+                            emitted += 1
+                elif result is None:
+                    dropped = 1
+                else:
+                    self._emit(index, result)
+                    emitted = 1
+            except Exception as e:
+                errors = dropped = 1
+                print(f"[{stage.name}] 항목 처리 중 오류 발생: {e}")
+            stage._record(time.monotonic() - started, emitted, dropped, errors)
+
+        # 이 단계의 마지막 작업 스레드가 끝나면 다음 단계 작업 스레드 수만큼 종료 표식 전달
+        with self._lock:
+            self._remaining[index] -= 1
+            last = self._remaining[index] == 0
+        if last:
+            stage.finished_at = time.monotonic()
+            if index + 1 < len(self.stages):
+                for _ in range(self.stages[index + 1].workers):
+                    self.queues[index + 1].put(_STOP)
+
+    def run(self, items):
+        """
+        입력 항목을 첫 단계에 흘려보내고 모든 단계가 끝날 때까지 기다리는 함수
+
+        Args:
+            items (iterable): 첫 단계에 넣을 항목들 (제너레이터도 가능)
+
+        Returns:
+            list: 단계별 통계
+        """
+        threads = []
+        for index, stage in enumerate(self.stages):
+            stage.started_at = time.monotonic()
+            for n in range(stage.workers):
+                thread = threading.Thread(target=self._worker, args=(index,), name=f"{stage.name}-{n}", daemon=True)
+                thread.start()
+                threads.append(thread)
+
+        try:
+            for item in items:
+                self.queues[0].put(item)
+        finally:
+            for _ in range(self.stages[0].workers):
+                self.queues[0].put(_STOP)
+
+        for thread in threads:
+            thread.join()
+
+        stats = [stage.stats() for stage in self.stages]
+        print_stats(stats)
+        return stats
+
+
+def print_stats(stats):
+    """단계별 처리량 통계를 출력하는 함수"""
+    print("\n=== 파이프라인 단계별 처리량 ===")
+    for row in stats:
+        print(
+            f"{row['stage']:<10} 작업자 {row['workers']:>2} | 처리 {row['processed']:>4} | 전달 {row['emitted']:>4} | "
+            f"제외 {row['dropped']:>3} | 오류 {row['errors']:>3} | 작업시간 {row['busy_seconds']:>7}s | "
+            f"{row['throughput_per_min']}건/분"
+        )
@@ -0,0 +1,109 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from html_backend import parse_html
+from extractor_registry import extractor_registry
+
+# CPU 작업(HTML 파싱/본문 추출/SEO 점수)을 실행할 프로세스 수 (0이면 현재 프로세스에서 실행)
+WORKER_PROCESSES = int(os.getenv('WORKER_PROCESSES', '0'))
+
+
+class EntryRecord(dict):
+    """
+    다른 프로세스로 넘기는 RSS 항목의 최소 정보 (title, link, description, summary, content)
+
+    feedparser 항목처럼 속성으로도 읽을 수 있어 추출 규칙의 대체 방법(rss)에 그대로 넘길 수 있다.
+    """
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    @classmethod
+    def from_entry(cls, entry):
+        record = cls(
+            title=entry.get('title', ''),
+            link=entry.get('link', ''),
+            description=entry.get('description', ''),
+            summary=entry.get('summary', ''),
+        )
+        if entry.get('content'):
+            record['content'] = [cls(value=entry['content'][0].get('value', ''))]
+        return record
+
+
+def extract_page(html, content_type, source_name, entry):
+    """
+    기사 페이지 바이트를 파싱해 소스 규칙으로 본문을 추출하는 함수 (프로세스 풀에서 실행)
+
+    Args:
+        html (bytes): 기사 페이지 원본 바이트
+        content_type (str): 응답의 Content-Type 헤더
+        source_name (str): 추출 규칙 이름 (보통 뉴스 소스 이름)
+        entry (EntryRecord): RSS 항목 정보
+
+    Returns:
+        dict: {'content', 'method', 'confidence', 'seconds'} (파싱한 문서는 넘기지 않음)
+    """
+    started = time.perf_counter()
+    document = parse_html(html, content_type)
+    content, method, confidence = extractor_registry.get(source_name).extract(document, entry)
+    return {
+        'content': content,
+        'method': method,
+        'confidence': confidence,
+        'seconds': time.perf_counter() - started,
+    }
+
+
+class ProcessPool:
+    """
+    CPU를 많이 쓰는 작업을 여러 프로세스에 나눠 실행하는 풀
+
+    스레드에서 run()을 호출하면 작업이 빈 프로세스에서 실행되고, 호출한 스레드는 결과만 기다린다.
+    입력은 원본 바이트/문자열, 결과는 작은 dict로 주고받아 프로세스 간 복사량을 줄인다.
+    프로세스 수가 0이면 같은 함수를 현재 프로세스에서 바로 실행한다.
+    """
+
+    def __init__(self, processes=WORKER_PROCESSES):
+        """
+        Args:
+            processes (int): 작업 프로세스 수 (0이면 사용하지 않음)
+        """
+        self.processes = processes
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def configure(self, processes):
+        """작업 프로세스 수를 바꾸는 함수 (이미 실행 중인 풀은 종료하고 다음 작업 때 새로 만듦)"""
+        self.shutdown()
+        self.processes = processes
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # 스레드가 실행 중인 프로세스를 fork하면 잠금이 꼬일 수 있으므로 새 인터프리터로 시작
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def run(self, func, *args):
+        """func(*args)를 작업 프로세스에서 실행하고 결과를 반환하는 함수 (프로세스 수가 0이면 바로 실행)"""
+        if self.processes <= 0:
+            return func(*args)
+        return self._get_executor().submit(func, *args).result()
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# 스크래퍼와 포스팅 단계에서 공유하는 프로세스 풀
+process_pool = ProcessPool()
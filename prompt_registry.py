@@ -0,0 +1,144 @@
+import hashlib
+import threading
+
+# 프롬프트 이름별 파일과 검증용 필수 문구
+PROMPT_FILES = {
+    'translation': 'prompt.txt',
+    'cointelegraph': 'prompt_cointelegraph.txt',
+}
+PROMPT_REQUIRED_PHRASES = {
+    'translation': ('title', 'lead', 'content'),
+    'cointelegraph': ('헤드라인', '리드'),
+}
+
+
+class Prompt:
+    """
+    한 번 읽어 둔 시스템 프롬프트
+
+    텍스트는 실행 동안 바뀌지 않으므로 모든 요청의 메시지 앞부분이 바이트 단위로 같아져
+    제공자 측 프롬프트 캐시(prompt caching) 대상이 된다.
+    """
+
+    def __init__(self, name, path, text):
+        self.name = name
+        self.path = path
+        self.text = text
+        self.version = hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]
+
+    def messages(self, user_content):
+        """정적인 시스템 프롬프트를 앞에, 기사 내용을 뒤에 둔 메시지 목록을 반환하는 함수"""
+        return build_messages(self.text, user_content)
+
+
+class PromptRegistry:
+    """
+    시스템 프롬프트를 처음 사용할 때 한 번만 읽고 검증하는 저장소
+
+    기사마다 파일을 다시 읽지 않으며, 프롬프트 내용의 해시를 버전으로 기록한다.
+    """
+
+    def __init__(self, files=None, required_phrases=None):
+        """
+        Args:
+            files (dict): 프롬프트 이름 -> 파일 경로
+            required_phrases (dict): 프롬프트 이름 -> 반드시 포함해야 하는 문구
+        """
+        self.files = dict(PROMPT_FILES if files is None else files)
+        self.required_phrases = dict(PROMPT_REQUIRED_PHRASES if required_phrases is None else required_phrases)
+        self._prompts = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """이름에 해당하는 Prompt를 반환하는 함수 (처음 호출할 때 파일을 읽고 검증)"""
+        with self._lock:
+            prompt = self._prompts.get(name)
+            if prompt is None:
+                prompt = self._load(name)
+                self._prompts[name] = prompt
+            return prompt
+
+    def text(self, name):
+        return self.get(name).text
+
+    def _load(self, name):
+        if name not in self.files:
+            raise KeyError(f"등록되지 않은 프롬프트입니다: {name}")
+        path = self.files[name]
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+
+        if not text.strip():
+            raise ValueError(f"프롬프트 파일이 비어 있습니다: {path}")
+        missing = [phrase for phrase in self.required_phrases.get(name, ()) if phrase not in text]
+        if missing:
+            raise ValueError(f"프롬프트 {path}에 필수 문구가 없습니다: {', '.join(missing)}")
+
+        prompt = Prompt(name, path, text)
+        print(f"프롬프트 로드: {name} ({path}, 버전 {prompt.version}, {len(text)}자)")
+        return prompt
+
+    def load_all(self):
+        """등록된 모든 프롬프트를 미리 읽고 검증하는 함수 (시작 시 오류를 바로 확인)"""
+        return [self.get(name) for name in self.files]
+
+
+def build_messages(system_prompt, user_content):
+    """
+    chat completion 메시지를 만드는 함수
+
+    긴 정적 지시문(시스템 프롬프트)이 항상 같은 위치의 앞부분이 되도록 하고, 기사마다 바뀌는 내용은 뒤에 둔다.
+    """
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_content},
+    ]
+
+
+def _usage_value(usage, *path):
+    # SDK 응답 객체와 배치 결과의 dict를 모두 지원
+    value = usage
+    for name in path:
+        if value is None:
+            return 0
+        value = value.get(name) if isinstance(value, dict) else getattr(value, name, None)
+    return value or 0
+
+
+class PromptUsage:
+    """실행 동안의 입력 토큰 중 제공자 캐시에 적중한 토큰 수를 집계하는 클래스"""
+
+    def __init__(self):
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+        self._lock = threading.Lock()
+
+    def record(self, usage):
+        """응답의 usage(prompt_tokens_details.cached_tokens 포함)를 더하는 함수"""
+        if usage is None:
+            return
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += _usage_value(usage, 'prompt_tokens')
+            self.cached_tokens += _usage_value(usage, 'prompt_tokens_details', 'cached_tokens')
+            self.completion_tokens += _usage_value(usage, 'completion_tokens')
+
+    def cached_ratio(self):
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def report(self):
+        """이번 실행의 캐시/비캐시 입력 토큰 수를 출력하는 함수"""
+        if not self.requests:
+            return
+        print(
+            f"입력 토큰: {self.prompt_tokens} (캐시 적중 {self.cached_tokens}, "
+            f"비캐시 {self.prompt_tokens - self.cached_tokens}, {self.cached_ratio() * 100:.1f}%), "
+            f"출력 토큰: {self.completion_tokens} ({self.requests}건)"
+        )
+
+
+# 모든 진입점에서 공유하는 프롬프트 저장소와 토큰 사용량 집계
+prompt_registry = PromptRegistry()
+prompt_usage = PromptUsage()
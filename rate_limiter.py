@@ -0,0 +1,128 @@
+import json
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 버킷별 기본 설정 (rate: 초당 토큰 충전 수, capacity: 최대 버스트 크기)
+# 환경 변수 RATE_LIMITS에 같은 형태의 JSON을 넣으면 항목별로 덮어쓴다.
+# 예시: RATE_LIMITS='{"coindesk.com": {"rate": 1, "capacity": 3}}'
+DEFAULT_RATE_LIMITS = {
+    'default': {'rate': 1.0, 'capacity': 2},
+    # 뉴스 소스 (호스트 단위)
+    'cointelegraph.com': {'rate': 0.5, 'capacity': 2},
+    'coindesk.com': {'rate': 0.5, 'capacity': 2},
+    'thepienews.com': {'rate': 0.5, 'capacity': 2},
+    # API (이름 단위)
+    'openai.chat': {'rate': 3.0, 'capacity': 10},
+    'openai.images': {'rate': 5 / 60, 'capacity': 1},
+    'wordpress': {'rate': 2.0, 'capacity': 4},
+}
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기
+
+    토큰이 남아 있으면 즉시 통과하고, 비어 있을 때만 다음 토큰이 충전될 때까지 대기한다.
+    """
+
+    def __init__(self, rate, capacity):
+        """
+        Args:
+            rate (float): 초당 충전되는 토큰 수
+            capacity (float): 버킷의 최대 토큰 수 (버스트 크기)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens=1):
+        """
+        토큰을 예약하고 대기해야 하는 시간(초)을 반환하는 함수
+
+        토큰이 부족하면 음수로 빌려 쓰므로, 동시에 호출한 스레드들은 순서대로 줄을 선다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens=1):
+        """토큰을 얻을 때까지 대기하는 함수 (대기한 시간을 반환)"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """이름(호스트 또는 API)별 토큰 버킷을 관리하는 클래스"""
+
+    def __init__(self, limits=None):
+        """
+        Args:
+            limits (dict): 버킷 이름 -> {'rate', 'capacity'} 설정
+        """
+        self.limits = dict(limits or DEFAULT_RATE_LIMITS)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def configure(self, key, rate, capacity):
+        """버킷 설정을 변경하는 함수 (기존 버킷은 새 설정으로 교체)"""
+        with self._lock:
+            self.limits[key] = {'rate': rate, 'capacity': capacity}
+            self._buckets.pop(key, None)
+
+    def bucket(self, key):
+        """이름에 해당하는 버킷을 반환하는 함수 (설정이 없으면 default 설정으로 생성)"""
+        with self._lock:
+            if key not in self._buckets:
+                config = self.limits.get(key) or self.limits['default']
+                self._buckets[key] = TokenBucket(config['rate'], config['capacity'])
+            return self._buckets[key]
+
+    def acquire(self, key, tokens=1):
+        """해당 버킷에서 토큰을 얻을 때까지 대기하는 함수"""
+        return self.bucket(key).acquire(tokens)
+
+
+def load_rate_limits():
+    """기본 설정에 환경 변수 RATE_LIMITS의 값을 덮어쓴 설정을 반환하는 함수"""
+    limits = {key: dict(value) for key, value in DEFAULT_RATE_LIMITS.items()}
+    overrides = os.getenv('RATE_LIMITS')
+    if overrides:
+        try:
+            for key, value in json.loads(overrides).items():
+                # 잘못된 항목 하나 때문에 모든 진입점이 import 단계에서 죽지 않도록 해당 항목만 건너뜀
+                if not isinstance(value, dict) or not all(
+                    isinstance(value.get(field, 0), (int, float)) for field in ('rate', 'capacity')
+                ):
+                    print(f"[WARN] RATE_LIMITS의 '{key}' 설정은 {{\"rate\": 숫자, \"capacity\": 숫자}} 형식이어야 합니다: {value!r}")
+                    continue
+                limits.setdefault(key, dict(limits['default'])).update(value)
+        except (ValueError, AttributeError) as e:
+            print(f"[WARN] RATE_LIMITS 설정을 읽을 수 없습니다: {e}")
+    return limits
+
+
+# 파이프라인 전체에서 공유하는 속도 제한기
+rate_limiter = RateLimiter(load_rate_limits())
+
+
+def acquire(key, tokens=1):
+    """공유 속도 제한기에서 토큰을 얻을 때까지 대기하는 함수"""
+    return rate_limiter.acquire(key, tokens)
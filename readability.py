@@ -0,0 +1,137 @@
+import re
+
+# 본문 후보에서 제외하는 태그 (하위 트리 전체)
+SKIP_TAGS = {'script', 'style', 'noscript', 'iframe', 'nav', 'header', 'footer', 'aside', 'form', 'figure', 'svg', 'button'}
+
+# 문단으로 보는 블록 태그
+BLOCK_TAGS = {'p', 'li', 'blockquote', 'pre', 'h2', 'h3', 'h4'}
+
+# class/id로 본문 여부를 가늠하는 패턴
+POSITIVE_RE = re.compile(r'article|body|content|entry|main|post|story|text', re.IGNORECASE)
+NEGATIVE_RE = re.compile(
+    r'comment|footer|sidebar|related|share|social|promo|newsletter|subscribe|menu|banner|sponsor|widget|\bad[-_]|advert',
+    re.IGNORECASE,
+)
+
+# 문단으로 인정하는 최소 글자 수와 최대 링크 비율
+MIN_BLOCK_CHARS = 25
+MAX_LINK_DENSITY = 0.5
+
+# 신뢰도 계산에서 충분하다고 보는 본문 길이(글자 수)
+CONFIDENT_TEXT_CHARS = 1500
+
+
+class ReadabilityResult:
+    """일반 본문 추출 결과 (문단 목록과 0~1 사이의 신뢰도)"""
+
+    def __init__(self, paragraphs, confidence, link_density=0.0):
+        self.paragraphs = paragraphs
+        self.confidence = confidence
+        self.link_density = link_density
+
+    @property
+    def content(self):
+        return '\n\n'.join(self.paragraphs)
+
+
+class _Frame:
+    # 트리를 내려가는 동안 요소별로 유지하는 점수 정보
+    __slots__ = ('node', 'children', 'score', 'start', 'weight')
+
+    def __init__(self, node, children, start, weight):
+        self.node = node
+        self.children = children
+        self.score = 0.0
+        self.start = start
+        self.weight = weight
+
+
+def _class_weight(node):
+    names = ' '.join(filter(None, [' '.join(node.get('class') or []), node.get('id') or '']))
+    if not names:
+        return 0.0
+    weight = 0.0
+    if POSITIVE_RE.search(names):
+        weight += 25
+    if NEGATIVE_RE.search(names):
+        weight -= 25
+    return weight
+
+
+def _block_score(text):
+    # 글자 수와 쉼표 수가 많을수록 본문 문단일 가능성이 높음
+    return 1 + text.count(',') + min(len(text) / 100, 3)
+
+
+def extract_main_content(document):
+    """
+    텍스트 밀도와 링크 밀도로 블록에 점수를 매겨 본문 영역을 찾는 함수 (트리를 한 번만 훑음)
+
+    문단 블록의 점수를 부모(전부)와 조부모(절반)에 더하고, 하위 블록의 링크 비율과 class/id를 반영해
+    점수가 가장 높은 요소를 본문 영역으로 고른다.
+
+    Args:
+        document: html_backend.parse_html로 파싱한 문서
+
+    Returns:
+        ReadabilityResult: 본문 문단과 신뢰도 (본문을 찾지 못하면 문단 없이 신뢰도 0)
+    """
+    # 문서 순서대로 모은 블록: (텍스트, 링크 글자 수, 좋은 문단 여부)
+    blocks = []
+    best = None
+    best_score = 0.0
+    stack = [_Frame(document, iter(document.children), 0, 0.0)]
+
+    while stack:
+        frame = stack[-1]
+        child = next(frame.children, None)
+
+        if child is None:
+            stack.pop()
+            # 하위 블록의 링크 비율만큼 점수를 깎아 후보 점수 계산
+            subtree = blocks[frame.start:]
+            if frame.score > 0 and subtree:
+                text_chars = sum(len(text) for text, _, _ in subtree)
+                link_chars = sum(links for _, links, _ in subtree)
+                density = link_chars / text_chars if text_chars else 1.0
+                score = (frame.score + frame.weight) * (1 - density)
+                if score > best_score:
+                    best_score, best = score, (frame.start, len(blocks), density)
+            continue
+
+        name = child.name
+        if name in SKIP_TAGS:
+            continue
+        weight = _class_weight(child)
+        if weight < 0 and name not in ('body', 'html', 'main', 'article'):
+            continue
+
+        if name in BLOCK_TAGS:
+            text = child.text()
+            link_chars = sum(len(link.text()) for link in child.find_all('a'))
+            good = len(text) >= MIN_BLOCK_CHARS and link_chars / len(text) <= MAX_LINK_DENSITY
+            blocks.append((text, link_chars, good))
+            if good:
+                score = _block_score(text)
+                frame.score += score
+                if len(stack) > 1:
+                    stack[-2].score += score / 2
+            continue
+
+        stack.append(_Frame(child, iter(child.children), len(blocks), weight))
+
+    if best is None:
+        return ReadabilityResult([], 0.0)
+
+    start, end, density = best
+    paragraphs = [text for text, _, good in blocks[start:end] if good]
+    text_chars = sum(len(text) for text in paragraphs)
+    all_good_chars = sum(len(text) for text, _, good in blocks if good)
+
+    # 신뢰도: 본문 길이, 문서 전체 본문 중 후보가 차지하는 비율, 링크 비율을 함께 반영
+    length_factor = min(text_chars / CONFIDENT_TEXT_CHARS, 1.0)
+    dominance = text_chars / all_good_chars if all_good_chars else 0.0
+    confidence = 0.5 * length_factor + 0.3 * dominance + 0.2 * (1 - density)
+    if len(paragraphs) < 2:
+        confidence *= 0.5
+    return ReadabilityResult(paragraphs, round(confidence, 3), density)
@@ -0,0 +1,235 @@
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 수집한 기사 기록을 저장할 SQLite 파일
+SEEN_DB_PATH = 'seen_articles.db'
+
+# 예전 버전에서 사용하던 제목 목록 파일 (최초 실행 시 한 번 가져옴)
+LEGACY_TITLES_PATH = 'titles.txt'
+
+# 기사 기록을 보관하는 기간(일) - 이보다 오래된 기록은 정리 (0이면 정리하지 않음)
+SEEN_TTL_DAYS = float(os.getenv('SEEN_TTL_DAYS', '30'))
+
+# 오래된 기록을 정리하는 최소 간격(초) - 스크랩할 때마다 확인하지만 실제 정리는 하루 한 번
+COMPACT_INTERVAL_SECONDS = 86400
+
+# URL 정규화 시 제거할 추적용 쿼리 파라미터 접두어
+TRACKING_PARAM_PREFIXES = ('utm_', 'fbclid', 'gclid', 'mc_')
+
+
+def normalize_url(url):
+    """
+    같은 기사를 가리키는 URL이 같은 키가 되도록 정규화하는 함수
+
+    http/https 통일, 호스트 소문자화, www. 제거, 추적용 쿼리 파라미터와 fragment 제거, 끝의 / 제거를 수행한다.
+    """
+    parts = urlsplit((url or '').strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ))
+    path = parts.path.rstrip('/') or '/'
+    scheme = parts.scheme.lower()
+    if scheme in ('', 'http'):
+        scheme = 'https'
+    return urlunsplit((scheme, host, path, query, ''))
+
+
+def content_hash(title):
+    """대소문자, 공백, 문장부호 차이를 무시한 제목 해시를 반환하는 함수"""
+    normalized = re.sub(r'[\W_]+', ' ', (title or '').lower()).strip()
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+class SeenStore:
+    """
+    이미 수집한 기사를 기록하는 SQLite 기반 저장소
+
+    정규화한 URL(기본 키)과 제목 해시(인덱스)로 조회하므로, 기록이 수십만 건으로 늘어나도
+    시작 비용 없이 인덱스 조회 한 번으로 중복 여부를 확인한다.
+    WAL 모드와 busy timeout을 사용하므로 여러 스레드/프로세스가 동시에 기록해도 안전하다.
+    """
+
+    def __init__(self, path=SEEN_DB_PATH, legacy_titles_path=LEGACY_TITLES_PATH):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            legacy_titles_path (str): 최초 실행 시 가져올 예전 titles.txt 경로
+        """
+        self.path = path
+        self.legacy_titles_path = legacy_titles_path
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self):
+        # sqlite3 연결은 스레드 간에 공유할 수 없으므로 스레드마다 따로 연결
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        with self._init_lock:
+            if not self._initialized:
+                self._create_schema(conn)
+                self._initialized = True
+        return conn
+
+    def _create_schema(self, conn):
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS seen (
+                url_key TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                title TEXT,
+                seen_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_seen_content_hash ON seen(content_hash);
+            CREATE INDEX IF NOT EXISTS idx_seen_seen_at ON seen(seen_at);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        ''')
+        self._import_legacy_titles(conn)
+
+    def _import_legacy_titles(self, conn):
+        """예전 titles.txt의 제목을 한 번만 가져오는 함수 (URL이 없으므로 제목 해시로만 기록)"""
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_titles_imported'").fetchone():
+            return
+        rows = []
+        if self.legacy_titles_path and os.path.exists(self.legacy_titles_path):
+            now = time.time()
+            with open(self.legacy_titles_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.startswith('- '):
+                        title = line[2:].strip()
+                        digest = content_hash(title)
+                        rows.append((f"title:{digest}", digest, title, now))
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany('INSERT OR IGNORE INTO seen VALUES (?, ?, ?, ?)', rows)
+            conn.execute("INSERT OR IGNORE INTO meta VALUES ('legacy_titles_imported', ?)", (str(len(rows)),))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        if rows:
+            print(f"titles.txt에서 {len(rows)}개의 기존 제목을 가져왔습니다.")
+
+    def contains(self, url, title=None):
+        """URL 또는 제목 해시가 이미 기록되어 있는지 확인하는 함수"""
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT 1 FROM seen WHERE url_key = ? OR content_hash = ? LIMIT 1',
+            (normalize_url(url), content_hash(title) if title else ''),
+        ).fetchone()
+        return row is not None
+
+    def claim(self, url, title=None):
+        """
+        기사를 기록하고, 이번 호출이 처음 기록한 경우에만 True를 반환하는 함수
+
+        여러 작업자가 같은 기사를 동시에 처리하려 할 때 하나만 True를 받는다.
+        """
+        conn = self._connect()
+        digest = content_hash(title) if title else content_hash(url)
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if title and conn.execute('SELECT 1 FROM seen WHERE content_hash = ? LIMIT 1', (digest,)).fetchone():
+                conn.execute('COMMIT')
+                return False
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO seen VALUES (?, ?, ?, ?)',
+                (normalize_url(url), digest, title, time.time()),
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return cursor.rowcount == 1
+
+    def add_many(self, articles):
+        """기사 dict 목록(link, title)을 한 트랜잭션으로 기록하는 함수"""
+        now = time.time()
+        rows = [
+            (normalize_url(article['link']), content_hash(article.get('title')), article.get('title'), now)
+            for article in articles
+        ]
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany('INSERT OR IGNORE INTO seen VALUES (?, ?, ?, ?)', rows)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def compact(self, ttl_days):
+        """
+        ttl_days보다 오래된 기록을 삭제하는 함수
+
+        Returns:
+            int: 삭제한 기록 수
+        """
+        conn = self._connect()
+        cutoff = time.time() - ttl_days * 86400
+        cursor = conn.execute('DELETE FROM seen WHERE seen_at < ?', (cutoff,))
+        deleted = cursor.rowcount
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        return deleted
+
+    def compact_if_due(self, ttl_days=SEEN_TTL_DAYS, interval=COMPACT_INTERVAL_SECONDS):
+        """
+        마지막 정리 후 interval초가 지났으면 오래된 기록을 정리하는 함수
+
+        정리 시각을 meta 테이블에 기록하므로 여러 프로세스/노드가 호출해도 한 곳에서만 정리한다.
+
+        Returns:
+            int: 삭제한 기록 수 (정리하지 않았으면 0)
+        """
+        if ttl_days <= 0:
+            return 0
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'last_compacted'").fetchone()
+            if row and now - float(row[0]) < interval:
+                conn.execute('COMMIT')
+                return 0
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_compacted', ?)", (str(now),))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        deleted = self.compact(ttl_days)
+        if deleted:
+            print(f"수집 기록에서 {ttl_days:g}일이 지난 기록 {deleted}개를 정리했습니다.")
+        return deleted
+
+    def count(self):
+        return self._connect().execute('SELECT COUNT(*) FROM seen').fetchone()[0]
+
+
+# 스크래퍼 전체에서 공유하는 기사 기록 저장소
+seen_store = SeenStore()
+
+
+if __name__ == "__main__":
+    # python seen_store.py compact [일수]: 오래된 기록을 바로 정리
+    if len(sys.argv) > 1 and sys.argv[1] == 'compact':
+        days = float(sys.argv[2]) if len(sys.argv) > 2 else SEEN_TTL_DAYS
+        print(f"{days:g}일이 지난 기록 {seen_store.compact(days)}개를 삭제했습니다. (남은 기록 {seen_store.count()}개)")
+    else:
+        print(f"수집 기록 {seen_store.count()}개 (보관 기간 {SEEN_TTL_DAYS:g}일)")
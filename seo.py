@@ -0,0 +1,202 @@
+import re
+
+
+def validate_seo_optimization(title, lead, content):
+    """SEO 최적화 점수 계산"""
+    score = 0
+    
+    # 제목 길이 검증 (30-60자)
+    if 30 <= len(title) <= 60:
+        score += 20
+    else:
+        print(f" 제목 길이 부적절: {len(title)}자 (권장: 30-60자)")
+    
+    # 리드 길이 검증 (150-160자)
+    if 150 <= len(lead) <= 160:
+        score += 20
+    else:
+        print(f" 리드 길이 부적절: {len(lead)}자 (권장: 150-160자)")
+    
+    # 제목에 키워드 포함 여부
+    if any(keyword in title.lower() for keyword in ['비트코인', '이더리움', '암호화폐', '블록체인', '코인']):
+        score += 15
+    
+    # 리드에 키워드 포함 여부
+    if any(keyword in lead.lower() for keyword in ['비트코인', '이더리움', '암호화폐', '블록체인', '코인']):
+        score += 15
+    
+    # HTML 구조 검증
+    if '<p>' in content and '<br>' in content:
+        score += 10
+    
+    # 숫자 포함 여부 (신뢰도)
+    if any(char.isdigit() for char in title):
+        score += 10
+    
+    # 현재성 키워드 포함
+    if any(keyword in title for keyword in ['2025', '최신', '오늘', '급상승', '돌파']):
+        score += 10
+    
+    return min(score, 100)
+
+
+def generate_meta_description(title, lead):
+    """메타 설명 생성 (150-160자)"""
+    # 리드가 적절한 길이면 사용, 아니면 제목 기반으로 생성
+    if 150 <= len(lead) <= 160:
+        return lead
+    else:
+        # 제목 + 간단한 설명으로 메타 설명 생성
+        base_text = f"{title}. 최신 암호화폐 뉴스와 시장 분석을 제공합니다."
+        if len(base_text) <= 160:
+            return base_text
+        else:
+            return base_text[:157] + "..."
+
+
+def extract_focus_keyword(title, lead, content, tags=None):
+    """Return a focus keyword that best aligns with SEO heuristics."""
+    tags = tags or []
+
+    def normalize(term):
+        if not isinstance(term, str):
+            return ""
+        return re.sub(r'\s+', ' ', term.strip())
+
+    candidate_terms = []
+    for tag in tags:
+        tag_normalized = normalize(tag)
+        if tag_normalized:
+            candidate_terms.append(tag_normalized)
+
+    combined_text = f"{title} {lead} {content or ''}"
+    lowered_combined = combined_text.lower()
+
+    title_tokens = [normalize(token) for token in re.split(r'[\s\-\|,]+', title) if normalize(token)]
+    for token in title_tokens:
+        if len(token) >= 2:
+            candidate_terms.append(token)
+    if len(title_tokens) >= 2:
+        headline_phrase = normalize(' '.join(title_tokens[:2]))
+        if len(headline_phrase) >= 2:
+            candidate_terms.append(headline_phrase)
+
+    lead_tokens = [normalize(token) for token in re.split(r'[\s\-\|,]+', lead) if normalize(token)]
+    for token in lead_tokens[:5]:
+        if len(token) >= 2:
+            candidate_terms.append(token)
+
+    candidate_scores = {}
+    title_lower = title.lower()
+    lead_lower = lead.lower()
+    content_lower = (content or "").lower()
+
+    for candidate in candidate_terms:
+        if not candidate or len(candidate) < 2:
+            continue
+        candidate_lower = candidate.lower()
+
+        score = 0
+        if candidate_lower in title_lower:
+            score += 12
+        if candidate_lower in lead_lower:
+            score += 6
+        if candidate_lower in content_lower:
+            score += 4
+
+        occurrences = lowered_combined.count(candidate_lower)
+        score += occurrences * 3
+
+        if any(normalize(tag).lower() == candidate_lower for tag in tags if isinstance(tag, str)):
+            score += 5
+
+        token_count = len(candidate.split())
+        if 1 < token_count <= 4:
+            score += 2
+        elif token_count == 1 and len(candidate) >= 4:
+            score += 1
+
+        current_best = candidate_scores.get(candidate)
+        if current_best is None or score > current_best:
+            candidate_scores[candidate] = score
+
+    if candidate_scores:
+        best_candidate = max(candidate_scores.items(), key=lambda item: (item[1], len(item[0])))[0]
+        return best_candidate
+
+    if title_tokens:
+        return title_tokens[0]
+
+    return 'cryptocurrency'
+
+
+def determine_primary_category(title, lead, content, tags=None):
+    """Choose the most relevant WordPress category between blockchain and education."""
+    tags = tags or []
+
+    def prepare_text(values):
+        return ' '.join([str(value) for value in values if isinstance(value, (str, bytes)) and value]).lower()
+
+    combined_text = prepare_text([title, lead, content, ' '.join(tag for tag in tags if isinstance(tag, str))])
+
+    blockchain_keywords = [
+        'blockchain', '블록체인', '비트코인', 'bitcoin', '이더리움', 'ethereum', '암호화폐',
+        'crypto', 'cryptocurrency', '토큰', 'token', 'defi', '디파이', 'nft', 'web3',
+        '분산원장', 'distributed ledger', '디지털 자산', 'stablecoin', 'staking'
+    ]
+    education_keywords = [
+        '교육', 'education', '학습', 'training', '훈련', '세미나', 'workshop', '워크숍',
+        '강의', 'lecture', 'curriculum', '커리큘럼', '학생', 'student', '학교', 'school',
+        '교사', 'teacher', '강사', 'instructor', '자격증', 'certificate', 'certification', 'edtech'
+    ]
+
+    def score_keywords(keywords):
+        score = 0
+        for keyword in keywords:
+            keyword_lower = keyword.lower()
+            occurrences = combined_text.count(keyword_lower)
+            if occurrences:
+                weight = 3 if len(keyword_lower) >= 6 else 2
+                score += occurrences * weight
+        return score
+
+    blockchain_score = score_keywords(blockchain_keywords)
+    education_score = score_keywords(education_keywords)
+
+    if education_score > blockchain_score:
+        chosen = 'education'
+    else:
+        chosen = 'blockchain'
+
+    print(f"카테고리 점수 - Blockchain: {blockchain_score}, Education: {education_score}, 선택: {chosen}")
+    return chosen
+
+
+def optimize_content_structure(content):
+    """콘텐츠 구조 SEO 최적화"""
+    # H2, H3 태그 추가 (간단한 예시)
+    optimized_content = content
+    
+    # 첫 번째 문단을 H2로 감싸기
+    if '<p>' in content:
+        first_p = content.split('<p>')[1].split('</p>')[0] if '</p>' in content else ""
+        if first_p and len(first_p) > 20:
+            # 첫 번째 문단을 H2로 변경
+            optimized_content = content.replace(f'<p>{first_p}</p>', f'<h2>{first_p}</h2>', 1)
+    
+    return optimized_content
+
+
+def score_article(title, lead, content, tags=None):
+    """
+    포스팅에 필요한 SEO 점수와 메타데이터를 한 번에 계산하는 함수 (프로세스 풀에서 실행 가능)
+
+    Returns:
+        dict: {'seo_score', 'meta_description', 'focus_keyword', 'category'}
+    """
+    return {
+        'seo_score': validate_seo_optimization(title, lead, content),
+        'meta_description': generate_meta_description(title, lead),
+        'focus_keyword': extract_focus_keyword(title, lead, content, tags),
+        'category': determine_primary_category(title, lead, content, tags),
+    }
@@ -0,0 +1,114 @@
+import json
+
+
+class IncrementalJSONParser:
+    """
+    스트리밍으로 도착하는 JSON 객체의 최상위 필드를 완성되는 즉시 꺼내는 파서
+
+    응답 조각을 feed()로 넣으면, 최상위 객체의 값 하나가 끝날 때마다 on_field(name, value)를 호출한다.
+    첫 '{' 앞의 텍스트(예: 마크다운 코드 블록 시작)는 무시한다.
+    JSON이 아닌 응답이면 아무 필드도 완성되지 않으며, 전체 텍스트는 text로 얻을 수 있다.
+    """
+
+    def __init__(self, on_field=None):
+        """
+        Args:
+            on_field (callable): 필드가 완성될 때 (name, value)로 호출할 함수
+        """
+        self.on_field = on_field
+        self.fields = {}
+        self._buffer = []
+        self._text = ''
+        self._pos = 0
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key = None
+        self._token_start = None
+        self._expect = 'key'
+
+    @property
+    def text(self):
+        return self._text
+
+    @property
+    def finished(self):
+        """최상위 객체가 닫혔는지 여부"""
+        return self._finished
+
+    def feed(self, chunk):
+        """응답 조각을 추가하고 새로 완성된 필드를 처리하는 함수"""
+        if not chunk:
+            return
+        self._text += chunk
+        while self._pos < len(self._text) and not self._finished:
+            self._step(self._text[self._pos])
+            self._pos += 1
+
+    def _step(self, char):
+        if not self._started:
+            if char == '{':
+                self._started = True
+                self._depth = 1
+            return
+
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == '\\':
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._depth == 1:
+                    self._end_token(self._pos + 1)
+            return
+
+        if char == '"':
+            self._in_string = True
+            if self._depth == 1:
+                self._token_start = self._pos
+        elif char in '{[':
+            if self._depth == 1:
+                self._token_start = self._pos
+            self._depth += 1
+        elif char in '}]':
+            self._depth -= 1
+            if self._depth == 1:
+                self._end_token(self._pos + 1)
+            elif self._depth == 0:
+                # 숫자/true/false/null 같은 마지막 값이 '}' 바로 앞에서 끝남
+                self._end_scalar()
+                self._finished = True
+        elif self._depth == 1:
+            if char == ':':
+                self._expect = 'value'
+            elif char == ',':
+                self._end_scalar()
+                self._expect = 'key'
+            elif not char.isspace() and self._token_start is None and self._expect == 'value':
+                self._token_start = self._pos
+
+    def _end_token(self, end):
+        raw = self._text[self._token_start:end]
+        self._token_start = None
+        if self._expect == 'key':
+            self._key = json.loads(raw)
+        else:
+            self._emit(raw)
+
+    def _end_scalar(self):
+        if self._token_start is not None and self._expect == 'value':
+            self._emit(self._text[self._token_start:self._pos].strip())
+            self._token_start = None
+
+    def _emit(self, raw):
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return
+        self.fields[self._key] = value
+        self._expect = None
+        if self.on_field:
+            self.on_field(self._key, value)
@@ -0,0 +1,87 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import job_store as job_store_module
+from job_store import JOB_STATES, MAX_ATTEMPTS, RETRY_DELAY_SECONDS, JobStore, LeaseLostError
+
+ARTICLE = {'title': '제목', 'link': 'https://example.com/news/1?utm_source=rss'}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(job_store_module, 'time', fake)
+    return fake
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    return JobStore(str(tmp_path / 'jobs.db'), str(tmp_path / 'images'), lease_seconds=60)
+
+
+@pytest.mark.parametrize('state', JOB_STATES[:-1])
+def test_resume_from_each_state(store, clock, state):
+    job = store.enqueue(ARTICLE, 'worker-a')
+    for index, next_state in enumerate(JOB_STATES[1:JOB_STATES.index(state) + 1]):
+        store.advance(job, next_state, **{f"step{index}": next_state})
+
+    # 작업자가 죽어 임대가 만료되면 다른 작업자가 마지막으로 끝난 단계부터 이어받음
+    clock.now += 61
+    [resumed] = store.lease('worker-b')
+    assert resumed.state == state
+    assert resumed.data == job.data
+    assert resumed.article == ARTICLE
+
+
+def test_posted_job_is_not_leased_again(store, clock):
+    job = store.enqueue(ARTICLE, 'worker-a')
+    store.advance(job, 'posted', post_id=1)
+    clock.now += 61
+    assert store.lease('worker-b') == []
+    assert store.enqueue(ARTICLE) is None
+
+
+def test_expired_lease_is_stolen_and_stale_advance_raises(store, clock):
+    job = store.enqueue(ARTICLE, 'worker-a')
+    assert store.lease('worker-b') == []
+
+    clock.now += 61
+    [stolen] = store.lease('worker-b')
+    with pytest.raises(LeaseLostError):
+        store.advance(job, 'translated', title='늦은 결과')
+
+    store.advance(stolen, 'translated', title='새 결과')
+    clock.now += 61
+    [resumed] = store.lease('worker-c')
+    assert resumed['title'] == '새 결과'
+
+
+def test_update_keeps_state(store):
+    job = store.enqueue(ARTICLE, 'worker-a')
+    store.update(job, image_url='https://example.com/image.png')
+    assert job.state == JOB_STATES[0]
+    assert job['image_url'] == 'https://example.com/image.png'
+
+
+def test_fails_after_max_attempts(store, clock):
+    store.enqueue(ARTICLE)
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        [job] = store.lease('worker-a')
+        store.fail(job, 'boom')
+        assert store.lease('worker-a') == []
+        clock.now += RETRY_DELAY_SECONDS * attempt + 1
+    assert job.state == 'failed'
+    assert store.counts() == {'failed': 1}
+    assert store.unfinished_count() == 0
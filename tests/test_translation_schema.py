@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translation_schema import TranslationParseError, parse_continuation, parse_translation
+
+
+def test_legacy_labels():
+    result = parse_translation("title: 제목\nlead: 리드\ncontent: 본문\ntags: 비트코인, 이더리움")
+    assert (result.title, result.lead, result.content) == ('제목', '리드', '본문')
+    assert not result.structured
+
+
+def test_label_text_inside_body_is_not_a_section():
+    result = parse_translation("title: T\nlead: L\ncontent: C has content: inside\nand tags: here too")
+    assert result.content == 'C has content: inside\nand tags: here too'
+
+
+def test_markdown_headings():
+    result = parse_translation("### 제목\nT\n### 리드\nL\n### 본문\n본문에 ### 제목 이라는 글자\n")
+    assert result.content == '본문에 ### 제목 이라는 글자'
+
+
+def test_missing_field_raises():
+    with pytest.raises(TranslationParseError):
+        parse_translation("title: T\nlead: L")
+
+
+def test_continuation_reads_content_only():
+    assert parse_continuation('{"content": "이어지는 본문"}') == '이어지는 본문'
+    assert parse_continuation('이어지는 본문\n') == '이어지는 본문'
+
+
+def test_empty_continuation_raises():
+    with pytest.raises(TranslationParseError):
+        parse_continuation('{"content": " "}')
@@ -0,0 +1,83 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import work_queue as work_queue_module
+from work_queue import TASK_MAX_ATTEMPTS, TASK_RETRY_DELAY_SECONDS, WorkQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(work_queue_module, 'time', fake)
+    return fake
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    return WorkQueue(str(tmp_path / 'queue.db'), lease_seconds=60)
+
+
+def test_expired_lease_is_reclaimed_by_another_node(queue, clock):
+    queue.put('article:a', 'article', {'n': 1})
+    [task] = queue.lease('node-a')
+    assert queue.lease('node-b') == []
+
+    clock.now += 61
+    [stolen] = queue.lease('node-b')
+    assert stolen.id == task.id
+
+    # 임대를 잃은 노드의 완료 기록은 무시됨
+    queue.complete(task)
+    assert queue.counts() == {('article', 'leased'): 1}
+    queue.complete(stolen)
+    assert queue.counts() == {('article', 'done'): 1}
+
+
+def test_heartbeat_extends_lease(queue, clock):
+    queue.put('article:a', 'article', {})
+    queue.lease('node-a')
+
+    clock.now += 50
+    assert queue.heartbeat('node-a') == 1
+    clock.now += 50
+    assert queue.lease('node-b') == []
+    assert queue.live_nodes(within=60) == ['node-a']
+
+
+def test_article_task_fails_after_max_attempts(queue, clock):
+    queue.put('article:a', 'article', {})
+    for attempt in range(1, TASK_MAX_ATTEMPTS + 1):
+        [task] = queue.lease('node-a')
+        queue.fail(task, 'boom')
+        assert queue.lease('node-a') == []
+        clock.now += TASK_RETRY_DELAY_SECONDS * attempt + 1
+    assert queue.counts() == {('article', 'failed'): 1}
+
+
+def test_feed_task_is_always_rescheduled(queue, clock):
+    queue.put('feed:a', 'feed', {})
+    for _ in range(TASK_MAX_ATTEMPTS + 2):
+        [task] = queue.lease('node-a')
+        queue.fail(task, 'boom')
+        clock.now += work_queue_module.FEED_RETRY_MAX_SECONDS + 1
+    assert queue.counts() == {('feed', 'ready'): 1}
+
+    # 성공하면 시도 횟수를 초기화하고 지정한 간격 뒤에 다시 임대
+    [task] = queue.lease('node-a')
+    queue.reschedule(task, 300)
+    assert queue.lease('node-a') == []
+    clock.now += 301
+    [task] = queue.lease('node-a')
+    assert task.attempts == 0
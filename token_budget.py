@@ -0,0 +1,216 @@
+import re
+
+try:
+    import tiktoken
+except ImportError:  # 선택 의존성: 없으면 글자 수로 토큰 수를 추정
+    tiktoken = None
+
+# 번역 요청 하나(청크)에 넣을 최대 입력 토큰 수
+# 한국어 출력은 영어 입력보다 토큰이 많으므로 TRANSLATION_MAX_TOKENS(4000)의 절반 정도로 제한
+TRANSLATION_CHUNK_TOKENS = 1800
+
+# 기사 한 건에 허용하는 최대 입력 토큰 수 (넘는 문단은 잘라냄)
+ARTICLE_TOKEN_BUDGET = 9000
+
+# tiktoken이 없을 때 토큰 수 추정에 사용하는 토큰당 평균 글자 수
+CHARS_PER_TOKEN = 4
+
+# 번역할 필요 없는 문단 (구독 안내, 면책 조항, 관련 기사 링크 등)
+BOILERPLATE_PATTERNS = [
+    r'^(related|read more|see also|also read|recommended|magazine)\s*:',
+    r'^(subscribe|sign up|join our|follow us|get the latest|don\'t miss)\b',
+    r'this article (does not contain|is for general information)',
+    r'^disclaimer\b',
+    r'all rights reserved',
+    r'\bcookies?\b.*\b(accept|consent|policy)\b',
+    r'^(share|tweet|copy link)( this)?( article)?$',
+    r'^advertisement$',
+]
+_BOILERPLATE_RE = [re.compile(pattern, re.IGNORECASE) for pattern in BOILERPLATE_PATTERNS]
+
+# format_for_translation이 붙이는 머리말 줄 (모든 청크에 반복)
+_HEADER_RE = re.compile(r'^(출처|발행일|제목):')
+
+# 기사 한 건에 붙이는 최대 태그 수 (프롬프트가 요구하는 키워드 수)
+MAX_TAGS = 3
+
+# 두 번째 이후 청크의 번역 요청에서 시스템 프롬프트 뒤에 붙이는 지시문
+# 기사 텍스트에는 섞지 않으며, 시스템 프롬프트의 앞부분이 그대로라 프롬프트 캐시도 계속 적중한다
+CONTINUATION_INSTRUCTION = """### 이어지는 본문 번역
+이번 요청의 기사는 앞부분이 따로 번역되는 긴 기사의 이어지는 본문이다.
+- 맨 앞의 출처, 발행일, 제목 줄은 맥락을 파악하는 데만 사용하고 번역하지 않는다.
+- 제목, 리드, 태그는 만들지 않고 본문 번역만 content 키에 담은 JSON 객체로 반환한다.
+- 언론사명으로 시작하는 첫 문단, 소제목, 목록, 링크, CTA, FAQ, 결론 문단을 새로 만들지 않고 주어진 문단만 번역한다."""
+
+_encodings = {}
+
+
+def _encoding(model):
+    encoding = _encodings.get(model)
+    if encoding is None:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding('o200k_base')
+        _encodings[model] = encoding
+    return encoding
+
+
+def count_tokens(text, model='gpt-4o-mini'):
+    """텍스트의 토큰 수를 반환하는 함수 (tiktoken이 없으면 글자 수로 추정)"""
+    if not text:
+        return 0
+    if tiktoken is None:
+        return len(text) // CHARS_PER_TOKEN + 1
+    return len(_encoding(model).encode(text))
+
+
+def is_boilerplate(paragraph):
+    return any(pattern.search(paragraph) for pattern in _BOILERPLATE_RE)
+
+
+def trim_boilerplate(paragraphs):
+    """상투 문구 문단과 중복 문단을 제거한 문단 리스트를 반환하는 함수"""
+    seen = set()
+    trimmed = []
+    for paragraph in paragraphs:
+        key = ' '.join(paragraph.split()).lower()
+        if not key or key in seen or is_boilerplate(key):
+            continue
+        seen.add(key)
+        trimmed.append(paragraph)
+    return trimmed
+
+
+def split_header(text):
+    """기사 텍스트를 (머리말 줄, 본문 문단 리스트)로 나누는 함수"""
+    header = []
+    lines = text.strip().split('\n')
+    while lines and _HEADER_RE.match(lines[0]):
+        header.append(lines.pop(0))
+    paragraphs = [p.strip() for p in re.split(r'\n\s*\n', '\n'.join(lines)) if p.strip()]
+    return '\n'.join(header), paragraphs
+
+
+def _split_long_paragraph(paragraph, max_tokens, model):
+    # 한 문단이 청크보다 길면 문장 단위로 나눔
+    parts, current = [], ''
+    for sentence in re.split(r'(?<=[.!?])\s+', paragraph):
+        candidate = f"{current} {sentence}".strip()
+        if current and count_tokens(candidate, model) > max_tokens:
+            parts.append(current)
+            current = sentence
+        else:
+            current = candidate
+    if current:
+        parts.append(current)
+    return parts
+
+
+class TranslationInput:
+    """
+    토큰 예산을 적용한 번역 입력
+
+    chunks의 각 항목이 번역 요청 하나가 된다. 청크는 문단 경계에서 나누며 모든 청크에 머리말(출처/제목)을 붙인다.
+    첫 청크는 기사 전체(제목/리드/본문/태그)로, 나머지 청크는 continuation_prompt로 본문만 번역한다.
+    """
+
+    def __init__(self, chunks, original_tokens, tokens, dropped_paragraphs):
+        self.chunks = chunks
+        self.original_tokens = original_tokens
+        self.tokens = tokens
+        self.dropped_paragraphs = dropped_paragraphs
+
+    @property
+    def is_chunked(self):
+        return len(self.chunks) > 1
+
+
+def prepare_translation_input(text, model='gpt-4o-mini', chunk_tokens=TRANSLATION_CHUNK_TOKENS,
+                              budget=ARTICLE_TOKEN_BUDGET):
+    """
+    기사 텍스트의 상투 문구를 정리하고, 토큰 예산을 적용해 문단 단위 청크로 나누는 함수
+
+    같은 입력은 항상 같은 청크가 되므로 청크별 LLM 캐시 키도 실행마다 같다.
+
+    Args:
+        text (str): format_for_translation 결과 또는 news.txt 내용
+        model (str): 토큰 수를 셀 모델 이름
+        chunk_tokens (int): 청크당 최대 토큰 수
+        budget (int): 기사당 최대 토큰 수
+
+    Returns:
+        TranslationInput: 번역할 청크와 토큰 통계
+    """
+    original_tokens = count_tokens(text, model)
+    header, paragraphs = split_header(text)
+    paragraphs = trim_boilerplate(paragraphs)
+
+    # 기사 예산을 넘는 뒤쪽 문단은 버림
+    kept, used = [], count_tokens(header, model)
+    for paragraph in paragraphs:
+        tokens = count_tokens(paragraph, model)
+        if used + tokens > budget and kept:
+            break
+        kept.append(paragraph)
+        used += tokens
+    dropped = len(paragraphs) - len(kept)
+
+    # 문단 경계에서 청크로 묶음
+    body_limit = max(chunk_tokens - count_tokens(header, model), chunk_tokens // 2)
+    groups, current, current_tokens = [], [], 0
+    for paragraph in kept:
+        pieces = [paragraph]
+        if count_tokens(paragraph, model) > body_limit:
+            pieces = _split_long_paragraph(paragraph, body_limit, model)
+        for piece in pieces:
+            tokens = count_tokens(piece, model)
+            if current and current_tokens + tokens > body_limit:
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += tokens
+    if current or not groups:
+        groups.append(current)
+
+    chunks = []
+    for group in groups:
+        body = '\n\n'.join(group)
+        chunks.append(f"{header}\n\n{body}" if header else body)
+
+    prepared = TranslationInput(chunks, original_tokens, sum(count_tokens(c, model) for c in chunks), dropped)
+    log_budget(prepared)
+    return prepared
+
+
+def log_budget(prepared):
+    """토큰 예산 적용 결과를 출력하는 함수"""
+    message = (f"토큰 예산: 원본 {prepared.original_tokens} -> 번역 입력 {prepared.tokens} "
+               f"(청크 {len(prepared.chunks)}개)")
+    if prepared.dropped_paragraphs:
+        print(f"[WARN] {message}, 예산 초과로 문단 {prepared.dropped_paragraphs}개 제외")
+    else:
+        print(message)
+
+
+def continuation_prompt(system_prompt):
+    """두 번째 이후 청크의 번역 요청에 사용할 시스템 프롬프트를 반환하는 함수 (본문만 번역)"""
+    return f"{system_prompt}\n\n{CONTINUATION_INSTRUCTION}"
+
+
+def merge_translations(first, contents):
+    """
+    첫 청크의 번역 결과 (title, lead, content, tags)와 나머지 청크의 본문 번역을 하나의 기사로 합치는 함수
+
+    제목, 리드, 태그는 첫 청크에서 가져오고(태그는 최대 MAX_TAGS개), 본문은 순서대로 이어 붙인다.
+    청크가 하나라도 실패하면 본문 일부만 포스팅되지 않도록 기사 전체를 실패로 처리한다.
+    """
+    if not first or not all(first[:3]):
+        return None, None, None, None
+    total = len(contents) + 1
+    for index, part_content in enumerate(contents, start=2):
+        if not part_content:
+            print(f"[WARN] 청크 {index}/{total} 번역 실패 - 기사 전체를 실패로 처리합니다.")
+            return None, None, None, None
+    title, lead, content, tags = first
+    return title, lead, '\n'.join([content, *contents]), list(tags or [])[:MAX_TAGS]
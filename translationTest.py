@@ -1,6 +1,10 @@
 import time
 import os
-import requests
+from http_client import http_client
+from llm_cache import cached_chat_completion, llm_cache
+from prompt_registry import prompt_registry, prompt_usage
+from article_store import article_store, format_for_translation
+from translation_schema import TRANSLATION_RESPONSE_FORMAT, parse_translation_or_repair
 from openai import OpenAI
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
@@ -25,6 +29,12 @@ if not all([wp_url, wp_user, wp_pass]):
 
 client = OpenAI(api_key=openai_api_key)
 
+# 구조화 출력(json_schema)을 지원하는 번역 모델 (main.py와 같은 모델)
+TRANSLATION_MODEL = "gpt-4o-mini"
+
+# WordPress 호스트의 인증 정보를 공유 세션에 등록
+http_client.configure_host(wp_url, auth=(wp_user, wp_pass), rate_key='wordpress')
+
 #WordPress에 포스트를 업로드하는 함수
 def post_to_wordpress(title, content, lead,status='publish'):
     
@@ -53,11 +63,10 @@ def post_to_wordpress(title, content, lead,status='publish'):
     }
     
     try:
-        response = requests.post(
+        response = http_client.post(
             api_url,
             json=data,
-            headers=headers,
-            auth=(wp_user, wp_pass)
+            headers=headers
         )
         
         if response.status_code == 201:  # 성공적으로 생성됨
@@ -77,53 +86,31 @@ def post_to_wordpress(title, content, lead,status='publish'):
 # print("기준 날짜 (미국 기준 어제):", yesterday_str)
 
 try:
-    # prompt.txt 파일에서 시스템 프롬프트 읽기
-    with open('prompt.txt', 'r', encoding='utf-8') as f:
-        system_prompt = f.read()
-
-    # news.txt 파일에서 뉴스 내용 읽기
-    with open('news.txt', 'r', encoding='utf-8') as f:
-        news_content = f.read()
-
-    # GPT-4를 사용하여 번역
-    completion = client.chat.completions.create(
-        model="gpt-4",
-        messages=[
-            {
-                "role": "system",
-                "content": system_prompt
-            },
-            {
-                "role": "user",
-                "content": news_content
-            },
-            
-        ]
-    )
+    system_prompt = prompt_registry.text('translation')
 
-    kr_content = completion.choices[0].message.content
+    # 기사 저장소(main.py와 같은 news.jsonl)의 첫 기사를 번역
+    article = next(article_store.iter_articles(), None)
+    if article is None:
+        raise ValueError("기사 저장소에 번역할 기사가 없습니다.")
+    news_content = format_for_translation(article)
+
+    # main.py와 같은 모델과 구조화 출력 형식으로 번역 (같은 요청은 캐시된 응답 사용)
+    kr_content = cached_chat_completion(
+        client, TRANSLATION_MODEL, system_prompt, news_content, response_format=TRANSLATION_RESPONSE_FORMAT
+    )
     print("\n=== 번역 결과 ===")
     print(kr_content)
 
-    # 번역 결과를 각 부분으로 분리
-    title = ''
-    lead = ''
-    content = ''
-    
-    # title 추출
-    if 'title:' in kr_content:
-        title_parts = kr_content.split('lead:')
-        title = title_parts[0].replace('title:', '').strip()
-    
-    # lead 추출
-    if 'lead:' in kr_content:
-        lead_parts = kr_content.split('content:')
-        lead = lead_parts[0].split('lead:')[1].strip()
-    
-    # content 추출 (content: 이후의 모든 내용)
-    if 'content:' in kr_content:
-        content = kr_content.split('content:')[1].strip()
-    
+    # 번역 결과를 각 부분으로 분리 (main.py와 같은 파서와 응답 교정 사용)
+    def complete(repair_prompt, user_content):
+        return cached_chat_completion(
+            client, TRANSLATION_MODEL, repair_prompt, user_content,
+            temperature=0, response_format=TRANSLATION_RESPONSE_FORMAT
+        )
+
+    translation = parse_translation_or_repair(kr_content, complete)
+    title, lead, content = translation.title, translation.lead, translation.content
+
     print("\n=== 파싱된 결과 ===")
     print("제목:", title)
     print("리드:", lead)
@@ -136,5 +123,8 @@ try:
         print(f"포스트 ID: {result['id']}")
         print(f"포스트 링크: {result['link']}")
 
+    llm_cache.report()
+    prompt_usage.report()
+
 except Exception as e:
     print(f"프로그램 실행 중 오류 발생: {e}")
@@ -0,0 +1,213 @@
+import ast
+import json
+import re
+
+# 번역 응답 필드
+TRANSLATION_FIELDS = ('title', 'lead', 'content', 'tags')
+REQUIRED_FIELDS = ('title', 'lead', 'content')
+
+# chat.completions.create에 그대로 넘기는 구조화 출력(JSON schema) 형식
+TRANSLATION_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'translated_article',
+        'strict': True,
+        'schema': {
+            'type': 'object',
+            'properties': {
+                'title': {'type': 'string', 'description': '한국어 기사 제목'},
+                'lead': {'type': 'string', 'description': '3줄 이내의 리드 문장'},
+                'content': {'type': 'string', 'description': '본문 (문단은 \\n 또는 <br>로 구분)'},
+                'tags': {'type': 'array', 'items': {'type': 'string'}, 'description': '한국어 키워드 3개'},
+            },
+            'required': list(TRANSLATION_FIELDS),
+            'additionalProperties': False,
+        },
+    },
+}
+
+# 긴 기사의 두 번째 이후 청크에 쓰는 본문 전용 구조화 출력 형식
+CONTINUATION_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'translated_article_continuation',
+        'strict': True,
+        'schema': {
+            'type': 'object',
+            'properties': {
+                'content': {'type': 'string', 'description': '이어지는 본문 (문단은 \\n 또는 <br>로 구분)'},
+            },
+            'required': ['content'],
+            'additionalProperties': False,
+        },
+    },
+}
+
+# 스키마를 어긴 응답을 고치는 요청에 쓰는 시스템 프롬프트 (기사를 다시 번역하지 않음)
+REPAIR_SYSTEM_PROMPT = """당신은 JSON 교정기입니다.
+사용자가 주는 번역 응답을 title, lead, content, tags 키를 가진 JSON 객체 하나로 고쳐서 반환한다.
+- 번역된 문장은 바꾸거나 새로 쓰지 않고, 응답 안에 있는 내용만 옮긴다.
+- 비어 있는 필드는 응답의 다른 부분(예: 본문 첫 문장)에서 가져와 채운다.
+- tags는 한국어 문자열 배열로 만든다.
+- 마크다운 코드 블록 없이 순수 JSON만 반환한다."""
+
+# JSON이 아닌 예전 형식 응답의 구역 표시 (title:, ### 제목, **제목** 등)
+_FIELD_ALIASES = {
+    'title': 'title', 'lead': 'lead', 'content': 'content', 'tags': 'tags',
+    '제목': 'title', '리드': 'lead', '본문': 'content', '태그': 'tags',
+}
+# 구역 표시는 줄 맨 앞에 있을 때만 인정 (본문 안의 'content:' 같은 문자열에서 잘리지 않도록)
+_SECTION_RE = re.compile(
+    r'^[ \t]*(?:(?P<label>title|lead|content|tags)[ \t]*:'
+    r'|###[ \t]*(?P<heading>제목|리드|본문|태그)'
+    r'|\*\*(?P<bold>제목|리드|본문|태그)\*\*)',
+    re.MULTILINE,
+)
+_FENCE_RE = re.compile(r'^```[a-zA-Z]*\s*|\s*```$')
+
+
+class TranslationParseError(ValueError):
+    """번역 응답이 계약(title, lead, content, tags)을 지키지 않았을 때 발생하는 오류"""
+
+    def __init__(self, message, missing=()):
+        super().__init__(message)
+        self.missing = list(missing)
+
+
+class Translation:
+    """검증을 통과한 번역 결과 한 건"""
+
+    def __init__(self, title, lead, content, tags=None, structured=True):
+        """
+        Args:
+            title (str): 제목
+            lead (str): 리드 문장
+            content (str): 본문
+            tags (list): 태그 목록
+            structured (bool): JSON 응답이면 True, 예전 문자열 형식이면 False
+        """
+        self.title = title
+        self.lead = lead
+        self.content = content
+        self.tags = tags or []
+        self.structured = structured
+
+    def as_tuple(self):
+        return self.title, self.lead, self.content, self.tags
+
+
+def _coerce_tags(value):
+    if isinstance(value, list):
+        return [str(tag).strip() for tag in value if str(tag).strip()]
+    if isinstance(value, str):
+        value = value.strip()
+        if value.startswith('[') and value.endswith(']'):
+            try:
+                return _coerce_tags(ast.literal_eval(value))
+            except (ValueError, SyntaxError):
+                value = value[1:-1]
+        return [tag.strip(' \'"') for tag in value.split(',') if tag.strip(' \'"')]
+    return []
+
+
+def _parse_sections(text):
+    # 구역 표시를 한 번만 훑어서 표시 사이의 텍스트를 필드 값으로 사용 (같은 필드는 처음 나온 것만 사용)
+    matches = list(_SECTION_RE.finditer(text))
+    fields = {}
+    for index, match in enumerate(matches):
+        field = _FIELD_ALIASES[match.group('label') or match.group('heading') or match.group('bold')]
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        if field not in fields:
+            fields[field] = text[match.end():end].strip()
+    return fields
+
+
+def parse_translation(text):
+    """
+    번역 응답을 한 번에 검증하고 Translation으로 변환하는 함수
+
+    JSON 응답(구조화 출력)을 우선 처리하고, JSON이 아니면 예전 문자열 형식(title:, ### 제목, **제목**)을 읽는다.
+
+    Raises:
+        TranslationParseError: 필수 필드가 없거나 비어 있을 때
+    """
+    if not text or not text.strip():
+        raise TranslationParseError("응답이 비어 있습니다.", REQUIRED_FIELDS)
+    text = _FENCE_RE.sub('', text.strip())
+
+    try:
+        data = json.loads(text)
+        structured = True
+    except ValueError:
+        data = None
+        structured = False
+
+    if structured and not isinstance(data, dict):
+        raise TranslationParseError(f"JSON 객체가 아닙니다: {type(data).__name__}", REQUIRED_FIELDS)
+    if not structured:
+        data = _parse_sections(text)
+
+    values = {field: data.get(field) for field in REQUIRED_FIELDS}
+    for field, value in values.items():
+        if value is not None and not isinstance(value, str):
+            raise TranslationParseError(f"'{field}' 필드는 문자열이어야 합니다.", [field])
+    missing = [field for field, value in values.items() if not (value or '').strip()]
+    if missing:
+        raise TranslationParseError(f"비어 있는 필드: {missing}", missing)
+
+    return Translation(
+        values['title'].strip(),
+        values['lead'].strip(),
+        values['content'].strip(),
+        _coerce_tags(data.get('tags')),
+        structured=structured,
+    )
+
+
+def parse_continuation(text):
+    """
+    이어지는 본문 번역 응답(content만 있는 JSON)에서 본문을 꺼내는 함수
+
+    JSON이 아니면 응답 전체를 본문으로 사용한다.
+
+    Raises:
+        TranslationParseError: 본문이 없거나 비어 있을 때
+    """
+    text = _FENCE_RE.sub('', (text or '').strip())
+    try:
+        data = json.loads(text)
+    except ValueError:
+        content = text
+    else:
+        content = data.get('content') if isinstance(data, dict) else None
+    if not isinstance(content, str) or not content.strip():
+        raise TranslationParseError("이어지는 본문이 비어 있습니다.", ['content'])
+    return content.strip()
+
+
+def build_repair_request(text, error):
+    """스키마를 어긴 응답을 고치는 요청의 사용자 메시지를 만드는 함수"""
+    return f"오류: {error}\n\n고칠 응답:\n{text}"
+
+
+def parse_translation_or_repair(text, complete=None):
+    """
+    번역 응답을 검증하고, 형식에 맞지 않으면 응답만 스키마에 맞게 고치는 요청을 한 번 보내는 함수
+
+    기사를 다시 번역하지 않으므로 교정 요청은 번역 요청보다 훨씬 짧다.
+
+    Args:
+        text (str): 번역 응답
+        complete (callable): (system_prompt, user_content)를 받아 교정 응답을 반환하는 함수 (없으면 교정하지 않음)
+
+    Raises:
+        TranslationParseError: 교정하지 않거나 교정한 응답도 형식에 맞지 않을 때
+    """
+    try:
+        return parse_translation(text)
+    except TranslationParseError as e:
+        print(f"경고: 번역 응답이 형식에 맞지 않습니다 ({e})")
+        if complete is None:
+            raise
+        print("응답 교정 요청 중...")
+        return parse_translation(complete(REPAIR_SYSTEM_PROMPT, build_repair_request(text, e)))
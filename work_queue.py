@@ -0,0 +1,242 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+# 여러 크롤링 노드가 공유하는 작업 큐 SQLite 파일 (모든 노드가 같은 경로를 보도록 설정)
+WORK_QUEUE_PATH = os.getenv('WORK_QUEUE_PATH', 'work_queue.db')
+
+# 작업 임대 시간(초) - 노드가 하트비트로 연장하지 않으면 만료되어 다른 노드가 가져감
+TASK_LEASE_SECONDS = 60
+
+# 실패한 작업의 최대 시도 횟수와 재시도 전 대기 시간(초, 시도 횟수만큼 늘어남)
+TASK_MAX_ATTEMPTS = 3
+TASK_RETRY_DELAY_SECONDS = 60
+
+# 실패한 피드 작업의 최대 재시도 대기 시간(초) - 피드는 멈추지 않고 대기 시간을 두 배씩 늘려 계속 재시도
+FEED_RETRY_MAX_SECONDS = 3600
+
+# 이 프로세스의 노드 이름 (작업 임대 소유자로 기록)
+NODE_ID = os.getenv('NODE_ID') or f"{socket.gethostname()}:{os.getpid()}"
+
+
+class Task:
+    """큐에서 임대한 작업 한 건 (kind: 'feed' 또는 'article', payload: 작업 정보 dict)"""
+
+    def __init__(self, task_id, kind, payload, attempts, owner):
+        self.id = task_id
+        self.kind = kind
+        self.payload = payload
+        self.attempts = attempts
+        self.owner = owner
+
+    def __repr__(self):
+        return f"Task({self.kind}, {self.id})"
+
+
+class WorkQueue:
+    """
+    여러 노드가 피드와 기사 URL을 나눠 처리하는 SQLite 기반 공유 작업 큐
+
+    작업은 만료 시간이 있는 임대로 빌려주고, 노드는 처리 중인 작업의 임대를 하트비트로 연장한다.
+    노드가 죽으면 하트비트가 끊겨 임대가 만료되고, 그 작업은 다른 노드가 다시 가져간다.
+    작업 ID가 기본 키이므로 같은 작업은 여러 노드가 넣어도 한 번만 등록된다.
+    """
+
+    def __init__(self, path=WORK_QUEUE_PATH, lease_seconds=TASK_LEASE_SECONDS):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            lease_seconds (float): 작업 임대 시간(초)
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self):
+        # sqlite3 연결은 스레드 간에 공유할 수 없으므로 스레드마다 따로 연결
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        with self._init_lock:
+            if not self._initialized:
+                conn.executescript('''
+                    CREATE TABLE IF NOT EXISTS tasks (
+                        task_id TEXT PRIMARY KEY,
+                        kind TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        state TEXT NOT NULL DEFAULT 'ready',
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        available_at REAL NOT NULL,
+                        lease_owner TEXT,
+                        lease_expires REAL,
+                        last_error TEXT,
+                        updated_at REAL NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_tasks_ready ON tasks(state, available_at);
+                    CREATE TABLE IF NOT EXISTS nodes (
+                        node_id TEXT PRIMARY KEY,
+                        last_heartbeat REAL NOT NULL
+                    );
+                ''')
+                self._initialized = True
+        return conn
+
+    def _transaction(self, func):
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            result = func(conn)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return result
+
+    def put(self, task_id, kind, payload, available_at=None):
+        """
+        작업을 등록하는 함수 (같은 ID의 작업이 이미 있으면 무시)
+
+        Returns:
+            bool: 새로 등록했는지 여부
+        """
+        now = time.time()
+
+        def insert(conn):
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO tasks (task_id, kind, payload, available_at, updated_at) VALUES (?, ?, ?, ?, ?)',
+                (task_id, kind, json.dumps(payload, ensure_ascii=False), available_at or now, now),
+            )
+            return cursor.rowcount == 1
+
+        return self._transaction(insert)
+
+    def lease(self, owner, limit=1):
+        """
+        처리할 수 있는 작업을 노드에 임대하는 함수 (기사 작업을 피드 작업보다 먼저, 오래 기다린 작업부터)
+
+        Returns:
+            list: 임대한 Task 목록 (없으면 빈 목록)
+        """
+        now = time.time()
+
+        def take(conn):
+            rows = conn.execute(
+                "SELECT task_id, kind, payload, attempts FROM tasks "
+                "WHERE state IN ('ready', 'leased') AND available_at <= ? "
+                "AND (lease_expires IS NULL OR lease_expires < ?) "
+                "ORDER BY kind = 'feed', available_at LIMIT ?",
+                (now, now, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE tasks SET state = 'leased', lease_owner = ?, lease_expires = ?, updated_at = ? WHERE task_id = ?",
+                [(owner, now + self.lease_seconds, now, row[0]) for row in rows],
+            )
+            return rows
+
+        return [
+            Task(task_id, kind, json.loads(payload), attempts, owner)
+            for task_id, kind, payload, attempts in self._transaction(take)
+        ]
+
+    def heartbeat(self, owner):
+        """
+        노드가 살아 있음을 기록하고 처리 중인 작업의 임대를 연장하는 함수
+
+        Returns:
+            int: 임대를 연장한 작업 수
+        """
+        now = time.time()
+
+        def beat(conn):
+            conn.execute('INSERT OR REPLACE INTO nodes VALUES (?, ?)', (owner, now))
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ? WHERE state = 'leased' AND lease_owner = ?",
+                (now + self.lease_seconds, owner),
+            )
+            return cursor.rowcount
+
+        return self._transaction(beat)
+
+    def _finish(self, task, sets, params):
+        # 임대가 만료되어 다른 노드가 가져간 작업은 기록하지 않음
+        def update(conn):
+            cursor = conn.execute(
+                f"UPDATE tasks SET {sets}, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                f"WHERE task_id = ? AND lease_owner = ?",
+                (*params, time.time(), task.id, task.owner),
+            )
+            return cursor.rowcount == 1
+
+        if not self._transaction(update):
+            print(f"[WARN] 작업 임대가 만료되어 결과를 기록하지 않습니다: {task.id}")
+
+    def complete(self, task):
+        """작업을 완료 처리하는 함수"""
+        self._finish(task, "state = 'done', last_error = NULL", ())
+
+    def reschedule(self, task, delay):
+        """반복 작업(피드)을 delay초 뒤에 다시 처리하도록 돌려놓는 함수"""
+        self._finish(task, "state = 'ready', attempts = 0, last_error = NULL, available_at = ?", (time.time() + delay,))
+
+    def fail(self, task, error):
+        """
+        작업 실패를 기록하는 함수
+
+        시도 횟수가 TASK_MAX_ATTEMPTS에 도달하면 failed 상태로 멈추고, 아니면 대기 시간 뒤에 다시 임대할 수 있다.
+        피드 작업은 seed_feeds(이미 있는 작업은 무시)로 되살릴 수 없으므로 멈추지 않고,
+        최대 FEED_RETRY_MAX_SECONDS까지 대기 시간을 두 배씩 늘려 다시 처리한다.
+        """
+        attempts = task.attempts + 1
+        if task.kind == 'feed':
+            delay = min(TASK_RETRY_DELAY_SECONDS * 2 ** (attempts - 1), FEED_RETRY_MAX_SECONDS)
+            self._finish(
+                task, "state = 'ready', attempts = ?, last_error = ?, available_at = ?",
+                (attempts, str(error), time.time() + delay),
+            )
+            print(f"[WARN] 피드 작업 실패 {attempts}회, {delay:.0f}초 뒤 다시 시도합니다: {task.id} ({error})")
+        elif attempts >= TASK_MAX_ATTEMPTS:
+            self._finish(task, "state = 'failed', attempts = ?, last_error = ?", (attempts, str(error)))
+            print(f"[WARN] 작업을 {attempts}회 시도했지만 실패해 중단합니다: {task.id} ({error})")
+        else:
+            self._finish(
+                task, "state = 'ready', attempts = ?, last_error = ?, available_at = ?",
+                (attempts, str(error), time.time() + TASK_RETRY_DELAY_SECONDS * attempts),
+            )
+
+    def counts(self):
+        """(종류, 상태)별 작업 수를 dict로 반환하는 함수"""
+        rows = self._connect().execute('SELECT kind, state, COUNT(*) FROM tasks GROUP BY kind, state').fetchall()
+        return {(kind, state): count for kind, state, count in rows}
+
+    def pending_count(self, kind=None):
+        """지금 또는 나중에 처리할 작업 수 (완료/실패 제외)"""
+        return sum(
+            count for (task_kind, state), count in self.counts().items()
+            if state in ('ready', 'leased') and (kind is None or task_kind == kind)
+        )
+
+    def live_nodes(self, within=TASK_LEASE_SECONDS):
+        """최근 within초 안에 하트비트를 보낸 노드 목록을 반환하는 함수"""
+        rows = self._connect().execute(
+            'SELECT node_id FROM nodes WHERE last_heartbeat >= ? ORDER BY node_id', (time.time() - within,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def report(self):
+        """종류/상태별 작업 수와 살아 있는 노드 수를 출력하는 함수"""
+        counts = self.counts()
+        summary = ', '.join(f"{kind}/{state} {count}" for (kind, state), count in sorted(counts.items()))
+        print(f"작업 큐: {summary or '비어 있음'} | 살아 있는 노드 {len(self.live_nodes())}개")
+
+
+# 크롤링 노드가 공유하는 작업 큐
+work_queue = WorkQueue()